@@ -11,6 +11,11 @@ Phase B (full-text acquisition):
     Fetches missing full text (and methods when available) using a combined
     strategy: three-tier waterfall (Europe PMC → Unpaywall+GROBID → abstract)
     first, then SciHub DOI fallback for any papers still without full text.
+    Papers are fetched one at a time unless --fulltext-workers asks for
+    more; requests to each API host stay spaced process-wide
+    (pipeline/rate_limit.py) however many workers run, GROBID requests are
+    capped separately (--grobid-workers), and downloaded PDFs are kept in a
+    content-addressed cache (pdf_cache/) so re-runs never re-download.
 
     This phase does NOT run tagging agents. Authoritative tagging happens in
     step 3 (`3_clean.py`).
@@ -21,6 +26,14 @@ Usage:
     python 1_scrape.py --fulltext-only        # skip scraping, fetch full text only
     python 1_scrape.py --fulltext-limit 500   # only fetch full text for 500 papers
     python 1_scrape.py --no-scihub             # disable SciHub DOI fallback
+    python 1_scrape.py --incremental           # nightly refresh: only new PubMed records
+    python 1_scrape.py --oa-archives /data/pmc_oa
+                                              # index local PMC / Europe PMC OA bulk
+                                              # archives; full text is read from them
+                                              # before any network tier
+    python 1_scrape.py --fulltext-workers 8 --grobid-workers 4
+                                              # 8 papers fetched at once, at most
+                                              # 4 PDFs in GROBID at a time
 
 Scraper flags (forwarded to backup/microhub_scraper.py):
     --db PATH               Database path (default: microhub.db)
@@ -33,6 +46,14 @@ Scraper flags (forwarded to backup/microhub_scraper.py):
     --full-text-only         Only save papers with full text
     --no-citations           Skip citation fetching
     --update-citations       Update citations for existing papers
+    --pipelined              Run search, fetch and save as concurrent stages
+                             sharing one NCBI rate budget
+    --fetch-workers N        Concurrent fetch workers with --pipelined (default: 3)
+    --incremental            Only search records added to PubMed since each
+                             query's last completed run (scrape_log high-water mark)
+    --overlap-days N         Overlap with the previous window (default: 1)
+    --db-batch-size N        Papers per DB write transaction (default: 200)
+    --db-batch-seconds T     Flush queued papers after T seconds (default: 5)
     --llm-enrich             Enable LLM enrichment (Claude Haiku)
     --llm-api-key KEY        Anthropic API key
     --update-github-tools    Refresh GitHub tool metrics
@@ -46,7 +67,9 @@ import os
 import sqlite3
 import subprocess
 import sys
-from typing import Optional
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, Iterator, Optional
 
 logging.basicConfig(
     level=logging.INFO,
@@ -57,16 +80,41 @@ logger = logging.getLogger(__name__)
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 
 
+def _fetch_in_order(fetch: Callable[[Dict], tuple], papers: Iterable[Dict],
+                    workers: int) -> Iterator[Callable[[], tuple]]:
+    """Yield one result getter per paper, in input order.
+
+    With several workers, up to ``2 * workers`` papers are fetched ahead
+    of the one being consumed; calling a getter returns its result or
+    re-raises the fetch's exception.
+    """
+    if workers <= 1:
+        for paper in papers:
+            yield lambda paper=paper: fetch(paper)
+        return
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        window = deque()
+        for paper in papers:
+            window.append(pool.submit(fetch, paper))
+            if len(window) >= 2 * workers:
+                yield window.popleft().result
+        while window:
+            yield window.popleft().result
+
+
 def acquire_fulltext(
     db_path: str,
     limit: Optional[int] = None,
     use_scihub_fallback: bool = True,
+    workers: int = 1,
 ) -> int:
     """Acquire full text for papers that do not have it yet.
 
     Uses a combined strategy: three-tier waterfall (Europe PMC →
     Unpaywall+GROBID → abstract) first, then SciHub DOI fallback for
-    any papers the waterfall couldn't resolve.
+    any papers the waterfall couldn't resolve.  *workers* papers are
+    fetched concurrently; results are written to the database in order
+    from this thread.
 
     This phase does NOT run tagging agents. Tagging happens in step 3.
     """
@@ -109,23 +157,36 @@ def acquire_fulltext(
         "Strategy: three-tier waterfall%s",
         " + SciHub DOI fallback" if use_scihub_fallback else "",
     )
+    logger.info("Fetch workers: %d", workers)
     logger.info("")
 
+    def fetch(paper: Dict) -> tuple:
+        """Network part of one paper: (sections, scihub_text, scihub_tried)."""
+        sections = three_tier_waterfall(paper)
+        if sections and sections.full_text:
+            return sections, None, False
+        doi = paper.get("doi", "")
+        if use_scihub_fallback and doi:
+            return None, fetch_fulltext_via_scihub(doi), True
+        return None, None, False
+
     acquired_waterfall = 0
     acquired_scihub = 0
     scihub_attempted = 0
     still_missing = 0
     errors = 0
 
-    for i, row in enumerate(rows):
-        paper = dict(row)
+    papers = [dict(row) for row in rows]
+    results = _fetch_in_order(fetch, papers, workers)
+    for i, (paper, result) in enumerate(zip(papers, results)):
         doi = paper.get("doi", "")
         pmid = paper.get("pmid", "?")
 
         try:
+            sections, scihub_text, scihub_tried = result()
+
             # ---- Tier 1-3: three-tier waterfall ----
-            sections = three_tier_waterfall(paper)
-            if sections and sections.full_text:
+            if sections:
                 updates_sql = "UPDATE papers SET full_text = ?"
                 params_sql = [sections.full_text]
                 if sections.methods:
@@ -149,9 +210,8 @@ def acquire_fulltext(
                 continue
 
             # ---- SciHub DOI fallback ----
-            if use_scihub_fallback and doi:
+            if scihub_tried:
                 scihub_attempted += 1
-                scihub_text = fetch_fulltext_via_scihub(doi)
                 if scihub_text:
                     if has_text_acquired:
                         conn.execute(
@@ -228,6 +288,21 @@ def main():
                         help="Disable SciHub DOI fallback (only use three-tier waterfall)")
     parser.add_argument("--db", default="microhub.db",
                         help="Database path (default: microhub.db)")
+    parser.add_argument("--oa-archives", default=None, metavar="DIR",
+                        help="Directory of PMC OA / Europe PMC bulk XML archives "
+                             "(.tar.gz, .xml.gz) to index before full-text acquisition")
+    parser.add_argument("--oa-store", default=None, metavar="PATH",
+                        help="Local OA full-text store (default: pmc_oa_fulltext.sqlite)")
+    parser.add_argument("--fulltext-workers", type=int, default=1, metavar="N",
+                        help="Papers fetched concurrently in full-text acquisition; "
+                             "requests per host stay rate-limited "
+                             "(default: 1 = sequential)")
+    parser.add_argument("--grobid-workers", type=int, default=None, metavar="N",
+                        help="Max PDFs in GROBID at once; match the server's "
+                             "concurrency setting (default: 4)")
+    parser.add_argument("--pdf-cache", default=None, metavar="DIR",
+                        help="Content-addressed store for downloaded OA PDFs and "
+                             "their GROBID output (default: pdf_cache/)")
 
     known, remaining = parser.parse_known_args()
 
@@ -281,10 +356,30 @@ def main():
             logger.error("Database not found at %s — nothing to fetch.", db_path)
             return 1
 
+        from pipeline.parsing import oa_archive
+        oa_store = known.oa_store or oa_archive.DEFAULT_STORE_PATH
+        if known.oa_archives:
+            if not os.path.isdir(known.oa_archives):
+                logger.error("OA archive directory not found: %s", known.oa_archives)
+                return 1
+            stats = oa_archive.ingest_archives(known.oa_archives, oa_store)
+            logger.info(
+                "OA archives: %d bundles indexed (%d articles), %d unchanged",
+                stats["bundles"], stats["articles"], stats["skipped"],
+            )
+        oa_archive.set_default_store_path(oa_store)
+        if known.pdf_cache:
+            from pipeline.parsing.pdf_store import set_default_store_dir
+            set_default_store_dir(known.pdf_cache)
+        if known.grobid_workers:
+            from pipeline.parsing.grobid_parser import set_grobid_concurrency
+            set_grobid_concurrency(known.grobid_workers)
+
         acquire_fulltext(
             db_path=db_path,
             limit=known.fulltext_limit,
             use_scihub_fallback=not known.no_scihub,
+            workers=max(1, known.fulltext_workers),
         )
 
     # ---- Full-text coverage stats ----
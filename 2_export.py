@@ -12,12 +12,28 @@ This is a raw dump — enrichment (RORs, repositories, etc.) happens in step 3.
     python 2_export.py --full-text-only            # only papers with full text
     python 2_export.py --methods-only              # only methods-extracted tags
     python 2_export.py --min-citations 5           # min 5 citations
+    python 2_export.py --workers 8                 # build chunks in 8 processes
+    python 2_export.py --delta                     # only papers changed since last export
+    python 2_export.py --chunk-format jsonl.gz     # compressed JSON Lines chunks
 
 Output:
     <output-dir>/microhub_papers_v5_chunk_1.json
     <output-dir>/microhub_papers_v5_chunk_2.json
     ...
     <output-dir>/microhub_papers_v5_github_tools.json
+    <output-dir>/microhub_papers_v5_manifest.json   (chunks written + watermark)
+
+With --delta, only papers inserted or updated since the export recorded in
+the manifest are written, to microhub_papers_v5_delta_<watermark>_chunk_N.json.
+Pass the manifest to steps 2b and 3 (--manifest) to process just those;
+without --manifest they skip *_delta_* chunks.
+
+Every export creates the index idx_papers_export_order on papers (if it
+is missing) so rows can be read in export order page by page.  --delta
+also installs a change log: a paper_changes table and two triggers on
+papers that record every insert and update; exports without --delta leave
+it out.  The first --delta run finds no watermark and exports everything;
+later ones export only the changes.
 """
 
 import argparse
@@ -35,6 +51,8 @@ SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 
 
 def main():
+    from pipeline.export.chunk_io import CHUNK_FORMATS, HAS_ZSTD, MANIFEST_SUFFIX
+
     parser = argparse.ArgumentParser(
         description="Step 2 — Export DB to chunked JSON",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -53,8 +71,17 @@ def main():
                         help="Only methods-extracted tags")
     parser.add_argument("--chunk-size", type=int, default=500,
                         help="Papers per JSON file (default: 500)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="Processes building and writing chunks (default: CPU count)")
+    parser.add_argument("--chunk-format", choices=sorted(CHUNK_FORMATS), default="json",
+                        help="Chunk file format (default: json; jsonl.gz/jsonl.zst are "
+                             "compressed JSON Lines for steps 2b and 3)")
+    parser.add_argument("--delta", action="store_true",
+                        help="Export only papers added or changed since the last export")
 
     args = parser.parse_args()
+    if args.chunk_format == "jsonl.zst" and not HAS_ZSTD:
+        parser.error("--chunk-format jsonl.zst needs the zstandard package")
 
     from pipeline.export.json_exporter import JsonExporter
 
@@ -74,6 +101,9 @@ def main():
     logger.info("Database:   %s", db_path)
     logger.info("Output dir: %s", out_dir)
     logger.info("Chunk size: %d", args.chunk_size)
+    logger.info("Workers:    %d", max(1, args.workers))
+    logger.info("Mode:       %s", "delta" if args.delta else "full")
+    logger.info("Format:     %s", args.chunk_format)
     logger.info("")
 
     exporter = JsonExporter(db_path=db_path)
@@ -85,11 +115,18 @@ def main():
         min_citations=args.min_citations,
         methods_only=args.methods_only,
         chunk_size=args.chunk_size,
+        workers=max(1, args.workers),
+        delta=args.delta,
+        chunk_format=args.chunk_format,
     )
 
     logger.info("")
     logger.info("Done. %d papers exported to %s", count, out_dir)
-    logger.info("Next step: python 3_clean.py --input-dir %s", out_dir)
+    if args.delta:
+        manifest = output.replace(".json", "") + MANIFEST_SUFFIX
+        logger.info("Next step: python 2b_segment.py --input-dir %s --manifest %s", out_dir, manifest)
+    else:
+        logger.info("Next step: python 3_clean.py --input-dir %s", out_dir)
 
 
 if __name__ == "__main__":
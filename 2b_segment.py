@@ -21,17 +21,45 @@ Segmentation priority:
     python 2b_segment.py --output-dir segmented_export/   # custom output
     python 2b_segment.py --no-strip-citations             # keep inline citations
     python 2b_segment.py --include-introduction           # don't exclude introduction
-
-Input:  raw_export/*_chunk_*.json         (from step 2)
-Output: segmented_export/*_chunk_*.json   (for step 3)
+    python 2b_segment.py --no-seg-cache                   # re-segment every paper
+    python 2b_segment.py --workers 8                      # 8 segmentation processes
+    python 2b_segment.py --chunk-format jsonl.gz          # compressed JSON Lines output
+    python 2b_segment.py --manifest raw_export/microhub_papers_v5_manifest.json
+                                                          # only chunks of that export
+
+Segmentation results are cached in a SQLite sidecar (segmentation_cache.db)
+keyed by a hash of the paper's input text fields, the segmentation options
+and SEGMENTER_VERSION, so reruns skip papers whose text has not changed.
+
+Papers are streamed through a process pool (--workers, default one per
+CPU) one at a time rather than loading whole chunks; output files, paper
+order and statistics are the same as a single-process run.
+
+Input:  raw_export/*_chunk_*.json         (from step 2; or .jsonl.gz/.jsonl.zst)
+Output: segmented_export/*_chunk_*.json   (for step 3; same format as the input
+                                           unless --chunk-format is given)
 """
 
 import argparse
 import glob
+import hashlib
 import json
 import logging
 import os
+import sqlite3
 import sys
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+
+from pipeline.export.chunk_io import (
+    CHUNK_FORMATS,
+    HAS_ZSTD,
+    ChunkWriter,
+    find_chunk_files,
+    iter_chunk,
+    manifest_chunk_files,
+    with_chunk_format,
+)
 
 logging.basicConfig(
     level=logging.INFO,
@@ -41,6 +69,90 @@ logger = logging.getLogger(__name__)
 
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 
+# Bump whenever segment_paper() or the section_extractor helpers it calls
+# change their output — cached results from older versions are then ignored.
+SEGMENTER_VERSION = "2"
+DEFAULT_CACHE_PATH = os.path.join(SCRIPT_DIR, "segmentation_cache.db")
+
+# Paper fields segment_paper() reads, and the fields it may write.
+_SEGMENT_INPUT_FIELDS = (
+    "full_text", "methods", "results", "discussion", "figures",
+    "data_availability", "_segmented_figures", "_segmented_data_availability",
+)
+_SEGMENT_OUTPUT_FIELDS = (
+    "_segmented_methods", "_segmented_results", "_segmented_discussion",
+    "_segmented_figures", "_segmented_data_availability",
+    "_segmentation_source", "_segmentation_sections", "methods",
+)
+# Fields shipped to a worker process: everything segment_paper() reads or
+# may overwrite, so the returned changes match an in-place run.
+_WORKER_FIELDS = frozenset(_SEGMENT_INPUT_FIELDS + _SEGMENT_OUTPUT_FIELDS)
+
+
+class SegmentationCache:
+    """Persistent store of segment_paper() output keyed by input hash.
+
+    Entries are keyed by SHA-256 over the paper fields segmentation reads,
+    the segmentation options and SEGMENTER_VERSION, so a changed full text
+    or a segmenter upgrade is a cache miss rather than a stale hit.  Writes
+    are buffered and committed by flush(); call it once per chunk.
+    """
+
+    def __init__(self, path=DEFAULT_CACHE_PATH):
+        self.path = path
+        self.conn = sqlite3.connect(path, timeout=30.0)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS segmentation_cache ("
+            " key TEXT PRIMARY KEY,"
+            " version TEXT NOT NULL,"
+            " result TEXT NOT NULL)"
+        )
+        self.conn.commit()
+        self._pending = []
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(paper, strip_citations=True, include_introduction=False):
+        h = hashlib.sha256()
+        h.update(SEGMENTER_VERSION.encode())
+        h.update(b"\0%d%d" % (bool(strip_citations), bool(include_introduction)))
+        for field in _SEGMENT_INPUT_FIELDS:
+            value = paper.get(field)
+            if not isinstance(value, str):
+                value = json.dumps(value, sort_keys=True, default=str)
+            h.update(b"\0" + field.encode() + b"\0" + value.encode("utf-8", "replace"))
+        return h.hexdigest()
+
+    def get(self, key):
+        row = self.conn.execute(
+            "SELECT result FROM segmentation_cache WHERE key = ? AND version = ?",
+            (key, SEGMENTER_VERSION),
+        ).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return json.loads(row[0])
+
+    def put(self, key, result):
+        self._pending.append((key, SEGMENTER_VERSION, json.dumps(result, ensure_ascii=False)))
+
+    def flush(self):
+        if not self._pending:
+            return
+        self.conn.executemany(
+            "INSERT OR REPLACE INTO segmentation_cache (key, version, result) VALUES (?, ?, ?)",
+            self._pending,
+        )
+        self.conn.commit()
+        self._pending = []
+
+    def close(self):
+        self.flush()
+        self.conn.close()
+
 
 def segment_paper(paper, *, strip_citations=True, include_introduction=False):
     """Segment a single paper dict, adding _segmented_* fields.
@@ -182,6 +294,51 @@ def segment_paper(paper, *, strip_citations=True, include_introduction=False):
     return paper
 
 
+def _segment_delta(paper, strip_citations=True, include_introduction=False):
+    """Run segment_paper() on *paper* and return the output fields it set.
+
+    Changed fields are listed in the paper's own key order, so applying the
+    result with ``dict.update`` to an unsegmented copy reproduces the same
+    dict (and the same JSON output) as segmenting that copy in place.
+    """
+    before = {f: paper.get(f) for f in _SEGMENT_OUTPUT_FIELDS}
+    segment_paper(paper, strip_citations=strip_citations,
+                  include_introduction=include_introduction)
+    return {
+        f: paper[f] for f in paper
+        if f in before and (paper[f] != before[f] or before[f] is None)
+    }
+
+
+def segment_paper_cached(paper, cache, *, strip_citations=True, include_introduction=False):
+    """segment_paper() with results reused from *cache* when inputs are unchanged.
+
+    Falls through to a plain segment_paper() call when *cache* is None.
+    """
+    if cache is None:
+        return segment_paper(paper, strip_citations=strip_citations,
+                             include_introduction=include_introduction)
+
+    key = cache.make_key(paper, strip_citations, include_introduction)
+    cached = cache.get(key)
+    if cached is not None:
+        paper.update(cached)
+        return paper
+
+    cache.put(key, _segment_delta(paper, strip_citations, include_introduction))
+    return paper
+
+
+def _iter_papers(input_files):
+    """Yield ``(file_idx, paper)`` for every paper, then ``(file_idx, None)``
+    once each file is exhausted."""
+    for file_idx, input_file in enumerate(input_files):
+        logger.info("Processing: %s", os.path.basename(input_file))
+        for paper in iter_chunk(input_file):
+            yield file_idx, paper
+        yield file_idx, None
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Step 2b — Section Segmentation",
@@ -195,8 +352,23 @@ def main():
                         help="Do not strip inline citations")
     parser.add_argument("--include-introduction", action="store_true",
                         help="Include introduction in taggable sections")
+    parser.add_argument("--seg-cache", default=DEFAULT_CACHE_PATH,
+                        help="Segmentation cache file (default: segmentation_cache.db)")
+    parser.add_argument("--no-seg-cache", action="store_true",
+                        help="Disable the segmentation cache")
+    parser.add_argument("--manifest",
+                        help="Only process the chunks listed in this export manifest "
+                             "(from 2_export.py, e.g. a --delta run)")
+    parser.add_argument("--chunk-format", choices=sorted(CHUNK_FORMATS),
+                        help="Output chunk format (default: same as each input; "
+                             "jsonl.gz/jsonl.zst are compressed JSON Lines)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="Segmentation worker processes (default: CPU count; "
+                             "1 = segment in-process)")
 
     args = parser.parse_args()
+    if args.chunk_format == "jsonl.zst" and not HAS_ZSTD:
+        parser.error("--chunk-format jsonl.zst needs the zstandard package")
 
     # --- Resolve input files ---
     input_dir = args.input_dir
@@ -206,14 +378,25 @@ def main():
     else:
         # Auto-detect: prefer raw_export/
         raw_export_dir = os.path.join(SCRIPT_DIR, "raw_export")
-        if os.path.isdir(raw_export_dir) and glob.glob(os.path.join(raw_export_dir, "*.json")):
+        if os.path.isdir(raw_export_dir) and (find_chunk_files(raw_export_dir)
+                                              or glob.glob(os.path.join(raw_export_dir, "*.json"))):
             input_dir = raw_export_dir
         else:
             input_dir = SCRIPT_DIR
 
-    input_files = sorted(glob.glob(os.path.join(input_dir, "*_chunk_*.json")))
-    if not input_files:
-        input_files = sorted(glob.glob(os.path.join(input_dir, "*.json")))
+    if args.manifest:
+        try:
+            input_files = manifest_chunk_files(args.manifest, input_dir)
+        except ValueError as exc:
+            logger.error("%s", exc)
+            sys.exit(1)
+        if not input_files:
+            logger.info("Manifest lists no chunks — nothing to segment.")
+            return
+    else:
+        input_files = find_chunk_files(input_dir)
+        if not input_files:
+            input_files = sorted(glob.glob(os.path.join(input_dir, "*.json")))
 
     if not input_files:
         logger.error("No JSON files found! Run step 2 first.")
@@ -226,6 +409,8 @@ def main():
     os.makedirs(out_dir, exist_ok=True)
 
     strip_citations = not args.no_strip_citations
+    cache = None if args.no_seg_cache else SegmentationCache(args.seg_cache)
+    workers = max(1, args.workers)
 
     logger.info("=" * 60)
     logger.info("STEP 2b — SECTION SEGMENTATION")
@@ -234,6 +419,8 @@ def main():
     logger.info("Output dir:       %s", out_dir)
     logger.info("Strip citations:  %s", "yes" if strip_citations else "no")
     logger.info("Incl. intro:      %s", "yes" if args.include_introduction else "no")
+    logger.info("Seg. cache:       %s", cache.path if cache else "off")
+    logger.info("Workers:          %d", workers)
     logger.info("")
 
     total_papers = 0
@@ -245,30 +432,82 @@ def main():
         "none": 0,
     }
 
-    for input_file in input_files:
-        logger.info("Processing: %s", os.path.basename(input_file))
-
-        with open(input_file, "r", encoding="utf-8") as f:
-            papers = json.load(f)
-        if not isinstance(papers, list):
-            papers = [papers]
-
-        for paper in papers:
-            segment_paper(
-                paper,
-                strip_citations=strip_citations,
-                include_introduction=args.include_introduction,
-            )
-            source = paper.get("_segmentation_source", "none")
-            stats[source] = stats.get(source, 0) + 1
-
-        # Write output
-        out_file = os.path.join(out_dir, os.path.basename(input_file))
-        with open(out_file, "w", encoding="utf-8") as f:
-            json.dump(papers, f, indent=2, ensure_ascii=False, default=str)
-
-        total_papers += len(papers)
-        logger.info("  → %d papers → %s", len(papers), os.path.basename(out_file))
+    # Papers are read, segmented and written one at a time.  Segmentation
+    # runs in a process pool; a bounded window of in-flight papers, spanning
+    # chunk boundaries, keeps the output (and the statistics) in input order.
+    seg_options = (strip_citations, args.include_introduction)
+    pool = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    max_pending = workers * 4 if pool is not None else 0
+    window = deque()   # (file_idx, paper, result, cache key, owns key)
+    in_flight = {}     # cache key → result not yet flushed
+    chunk_keys = {}    # file_idx → cache keys that chunk will flush
+    writers = {}       # file_idx → ChunkWriter
+    window_shared = 0  # cache misses answered by an identical in-flight paper
+
+    def _submit(paper):
+        fields = {f: v for f, v in paper.items() if f in _WORKER_FIELDS}
+        if pool is None:
+            return _segment_delta(fields, *seg_options)
+        return pool.submit(_segment_delta, fields, *seg_options)
+
+    def _drain_one():
+        nonlocal total_papers
+        file_idx, paper, result, key, owns_key = window.popleft()
+        out_file = os.path.join(out_dir, os.path.basename(input_files[file_idx]))
+        if args.chunk_format:
+            out_file = with_chunk_format(out_file, args.chunk_format)
+        writer = writers.get(file_idx)
+        if writer is None:
+            writer = writers[file_idx] = ChunkWriter(out_file)
+
+        if paper is None:  # end of this input file
+            if cache is not None:
+                cache.flush()
+                for k in chunk_keys.pop(file_idx, ()):
+                    in_flight.pop(k, None)
+            writers.pop(file_idx).close()
+            total_papers += writer.count
+            logger.info("  → %d papers → %s", writer.count, os.path.basename(out_file))
+            return
+
+        if isinstance(result, Future):
+            result = result.result()
+        paper.update(result)
+        if owns_key:
+            cache.put(key, result)
+        source = paper.get("_segmentation_source", "none")
+        stats[source] = stats.get(source, 0) + 1
+        writer.write(paper)
+
+    try:
+        for file_idx, paper in _iter_papers(input_files):
+            key = result = None
+            owns_key = False
+            if paper is not None and cache is not None:
+                key = cache.make_key(paper, *seg_options)
+                result = cache.get(key)
+                if result is None and key in in_flight:
+                    # Same input as a paper still in the window (its result
+                    # is not in the cache yet): share that result.
+                    result = in_flight[key]
+                    window_shared += 1
+                elif result is None:
+                    owns_key = True
+            if paper is not None and result is None:
+                result = _submit(paper)
+                if owns_key:
+                    in_flight[key] = result
+                    chunk_keys.setdefault(file_idx, []).append(key)
+            window.append((file_idx, paper, result, key, owns_key))
+            while len(window) > max_pending:
+                _drain_one()
+        while window:
+            _drain_one()
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+        for writer in writers.values():  # only left over after an error
+            writer.abort()
 
     logger.info("")
     logger.info("=" * 60)
@@ -280,8 +519,16 @@ def main():
     logger.info("  Heuristic segmented:  %d", stats["heuristic"])
     logger.info("  Full-text fallback:   %d", stats["full_text_fallback"])
     logger.info("  Abstract-only:        %d", stats["abstract_only"])
+    if cache is not None:
+        logger.info("  Cache hits / misses:  %d / %d", cache.hits, cache.misses)
+        logger.info("  Shared in window:     %d", window_shared)
+        cache.close()
     logger.info("")
-    logger.info("Next step: python 3_clean.py --input-dir %s", out_dir)
+    if args.manifest:
+        logger.info("Next step: python 3_clean.py --input-dir %s --manifest %s",
+                    out_dir, args.manifest)
+    else:
+        logger.info("Next step: python 3_clean.py --input-dir %s", out_dir)
 
 
 if __name__ == "__main__":
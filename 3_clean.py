@@ -15,12 +15,21 @@ Reads the chunked JSON from step 2 and runs the full processing pipeline:
     python 3_clean.py --output-dir cleaned_export/        # write here
     python 3_clean.py --no-enrich                         # skip agent pipeline (NOT recommended)
     python 3_clean.py --no-segment                        # skip section segmentation
+    python 3_clean.py --no-seg-cache                      # re-segment instead of reusing cached sections
     python 3_clean.py --skip-api                          # skip all API enrichment
     python 3_clean.py --no-openalex                       # skip OpenAlex enrichment
     python 3_clean.py --no-datacite                       # skip DataCite/OpenAIRE dataset linking
     python 3_clean.py --no-ror                            # skip ROR v2 affiliation matching
-
-Input:  raw_export/*_chunk_*.json        (from step 2)
+    python 3_clean.py --fetch-workers 8                   # concurrent full-text fetches per chunk
+    python 3_clean.py --oa-store /data/pmc_oa_fulltext.sqlite
+                                                          # local OA full text (see 1_scrape.py)
+    python 3_clean.py --grobid-workers 8 --pdf-cache /data/pdf_cache
+                                                          # PDF-tier GROBID concurrency and PDF cache
+    python 3_clean.py --inflight-chunks 0                 # don't overlap enrichment with next chunk's extraction
+    python 3_clean.py --manifest raw_export/microhub_papers_v5_manifest.json
+                                                          # only chunks of that (delta) export
+
+Input:  raw_export/*_chunk_*.json        (from step 2; or .jsonl.gz/.jsonl.zst)
 Output: cleaned_export/*_chunk_*.json    (ready for step 4 and WordPress)
 """
 
@@ -31,6 +40,9 @@ import logging
 import os
 import re
 import sys
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 
 logging.basicConfig(
     level=logging.INFO,
@@ -400,6 +412,9 @@ def main():
     )
     parser.add_argument("--input", "-i", help="Single input JSON file")
     parser.add_argument("--input-dir", help="Input directory (default: raw_export/)")
+    parser.add_argument("--manifest",
+                        help="Only process the chunks listed in this export manifest "
+                             "(from 2_export.py, e.g. a --delta run)")
     parser.add_argument("--output-dir", default="cleaned_export",
                         help="Output directory (default: cleaned_export/)")
     parser.add_argument("--no-enrich", action="store_true",
@@ -434,16 +449,45 @@ def main():
                         help="Skip section segmentation (not recommended)")
     parser.add_argument("--no-strip-citations", action="store_true",
                         help="Do not strip inline citations during segmentation")
+    parser.add_argument("--seg-cache", default=None,
+                        help="Segmentation cache file (default: segmentation_cache.db)")
+    parser.add_argument("--no-seg-cache", action="store_true",
+                        help="Disable the segmentation cache")
+    parser.add_argument("--rrid-cache", default=None,
+                        help="RRID resolver cache file (default: rrid_cache.db)")
+    parser.add_argument("--no-rrid-cache", action="store_true",
+                        help="Do not persist RRID validation results between runs")
+    parser.add_argument("--oa-store", default=None,
+                        help="Local OA full-text store built by 1_scrape.py --oa-archives "
+                             "(default: pmc_oa_fulltext.sqlite, used if present)")
+    parser.add_argument("--grobid-workers", type=int, default=None,
+                        help="Max PDFs in GROBID at once; match the server's "
+                             "concurrency setting (default: 4)")
+    parser.add_argument("--pdf-cache", default=None,
+                        help="Content-addressed store for downloaded OA PDFs and "
+                             "their GROBID output (default: pdf_cache/)")
     parser.add_argument("--workers", type=int, default=4,
                         help="Number of parallel workers for API enrichment (default: 4)")
+    parser.add_argument("--fetch-workers", type=int, default=4,
+                        help="Concurrent full-text fetches per chunk (default: 4, 1 = sequential)")
+    parser.add_argument("--inflight-chunks", type=int, default=1,
+                        help="Extracted chunks allowed to queue for API enrichment while the "
+                             "next chunk is extracted (default: 1, 0 = no overlap)")
 
     parser.set_defaults(use_pubtator=False)
 
     args = parser.parse_args()
 
+    from pipeline.export.chunk_io import (
+        find_chunk_files,
+        iter_chunk,
+        manifest_chunk_files,
+        with_chunk_format,
+    )
     from pipeline.export.json_exporter import is_protocol_paper, get_protocol_type
     from pipeline.normalization import normalize_tags
     from pipeline.orchestrator import PipelineOrchestrator
+    from pipeline import load_costs
     from pipeline.validation.identifier_normalizer import IdentifierNormalizer
     from pipeline.validation.local_lookup import LocalLookup
     from pipeline.agents.protocol_agent import ProtocolAgent
@@ -454,10 +498,6 @@ def main():
     repo_scanner = ProtocolAgent()
     lookup_root = os.path.join(SCRIPT_DIR, "microhub_lookup_tables")
     ror_path = os.path.join(lookup_root, "ror")
-    institution_scanner = InstitutionAgent(
-        local_lookup=local_lookup,
-        ror_local_path=ror_path if os.path.isdir(ror_path) else None
-    )
 
     # --- Resolve input files ---
     if args.input:
@@ -473,14 +513,25 @@ def main():
         else:
             # Auto-detect: prefer raw_export/, fall back to project root
             raw_export_dir = os.path.join(SCRIPT_DIR, "raw_export")
-            if os.path.isdir(raw_export_dir) and glob.glob(os.path.join(raw_export_dir, "*.json")):
+            if os.path.isdir(raw_export_dir) and (find_chunk_files(raw_export_dir)
+                                                  or glob.glob(os.path.join(raw_export_dir, "*.json"))):
                 input_dir = raw_export_dir
             else:
                 input_dir = SCRIPT_DIR
-        # Try several naming patterns
-        input_files = sorted(glob.glob(os.path.join(input_dir, "*_chunk_*.json")))
-        if not input_files:
-            input_files = sorted(glob.glob(os.path.join(input_dir, "*.json")))
+        if args.manifest:
+            try:
+                input_files = manifest_chunk_files(args.manifest, input_dir)
+            except ValueError as exc:
+                logger.error("%s", exc)
+                sys.exit(1)
+            if not input_files:
+                logger.info("Manifest lists no chunks — nothing to process.")
+                return
+        else:
+            # Try several naming patterns
+            input_files = find_chunk_files(input_dir)
+            if not input_files:
+                input_files = sorted(glob.glob(os.path.join(input_dir, "*.json")))
 
     if not input_files:
         logger.error("No JSON files found! Run step 2 first.")
@@ -496,6 +547,19 @@ def main():
     enricher = None
     if not args.no_enrich:
         dict_path = os.path.join(SCRIPT_DIR, "MASTER_TAG_DICTIONARY.json")
+        rrid_cache_path = None
+        if not args.no_rrid_cache:
+            rrid_cache_path = args.rrid_cache or os.path.join(SCRIPT_DIR, "rrid_cache.db")
+        if args.oa_store:
+            from pipeline.parsing.oa_archive import set_default_store_path
+            set_default_store_path(args.oa_store)
+        if args.pdf_cache:
+            from pipeline.parsing.pdf_store import set_default_store_dir
+            set_default_store_dir(args.pdf_cache)
+        if args.grobid_workers:
+            from pipeline.parsing.grobid_parser import set_grobid_concurrency
+            set_grobid_concurrency(args.grobid_workers)
+        t_build = time.perf_counter()
         enricher = PipelineOrchestrator(
             tag_dictionary_path=dict_path if os.path.exists(dict_path) else None,
             lookup_tables_path=lookup_root if os.path.isdir(lookup_root) else None,
@@ -506,6 +570,20 @@ def main():
             use_role_classifier=not args.no_role_classifier,
             use_three_tier_waterfall=True,
             use_scihub_fallback=not args.no_scihub,
+            rrid_cache_path=rrid_cache_path,
+            local_lookup=local_lookup,
+        )
+        logger.info("Orchestrator built in %.2fs (lookup tables load on first use)",
+                    time.perf_counter() - t_build)
+
+    # Affiliation → ROR rescan shares the orchestrator's institution agent
+    # (and its ROR dump) when one exists.
+    if enricher is not None:
+        institution_scanner = enricher.institution_agent
+    else:
+        institution_scanner = InstitutionAgent(
+            local_lookup=local_lookup,
+            ror_local_path=ror_path if os.path.isdir(ror_path) else None
         )
 
     # --- API enrichment (GitHub, S2, CrossRef) — on by default ---
@@ -519,6 +597,18 @@ def main():
             local_lookup=local_lookup,
         )
 
+    # Section segmenter (inline replacement for standalone step 2b) with
+    # its persistent result cache.
+    seg_module = None
+    seg_cache = None
+    if not args.no_segment:
+        from importlib import import_module as _import_module
+        seg_module = _import_module("2b_segment")
+        if not args.no_seg_cache:
+            seg_cache = seg_module.SegmentationCache(
+                args.seg_cache or seg_module.DEFAULT_CACHE_PATH
+            )
+
     logger.info("=" * 60)
     logger.info("STEP 3 — CLEAN (re-tag + finalize JSON)")
     logger.info("=" * 60)
@@ -526,11 +616,15 @@ def main():
     logger.info("Output dir:  %s", out_dir)
     logger.info("Lookup tables: %s", "found" if os.path.isdir(lookup_root) else "NOT FOUND (using API fallback)")
     logger.info("Segment:     %s", "no (--no-segment)" if args.no_segment else "yes")
+    if not args.no_segment:
+        logger.info("Seg. cache:  %s", seg_cache.path if seg_cache else "off")
     logger.info("Enrich:      %s", "no (--no-enrich)" if args.no_enrich else "yes")
     logger.info("PubTator:    %s", "yes" if args.use_pubtator else "no")
     logger.info("Role class.: %s", "no" if args.no_role_classifier else "yes")
     logger.info("Ollama LLM:  %s", "yes" if args.ollama else "no")
     logger.info("Workers:     %d", args.workers)
+    logger.info("Fetch workers: %d", args.fetch_workers)
+    logger.info("In-flight chunks: %d", args.inflight_chunks)
     logger.info("API enrich:  %s", "yes" if api_enrich else "no")
     if api_enrich:
         logger.info("  OpenAlex:  %s", "no" if args.no_openalex else "yes")
@@ -545,15 +639,9 @@ def main():
     seg_stats = {"existing": 0, "heuristic": 0, "full_text_fallback": 0,
                  "abstract_only": 0, "none": 0, "skipped": 0}
 
-    for input_file in input_files:
-        logger.info("Processing: %s", os.path.basename(input_file))
-
-        with open(input_file, "r", encoding="utf-8") as f:
-            papers = json.load(f)
-        if not isinstance(papers, list):
-            papers = [papers]
-
-        cleaned = []
+    def _extract_chunk(papers):
+        """CPU stage: field repair, segmentation, agent extraction, finalization."""
+        # ---- Pass 1: per-paper preparation (field repair + segmentation) ----
         for paper in papers:
             # Ensure ALL tag list fields exist (may be missing from older exports)
             tag_list_fields = [
@@ -590,15 +678,31 @@ def main():
             # Segments full_text into structured sections, strips citations
             # and references. This prevents over-tagging from introduction
             # and literature review mentions.
-            if not args.no_segment and not paper.get("_segmentation_source"):
-                from importlib import import_module as _import_module
-                _seg = _import_module("2b_segment")
-                _seg.segment_paper(
+            if seg_module is not None and not paper.get("_segmentation_source"):
+                seg_module.segment_paper_cached(
                     paper,
+                    seg_cache,
                     strip_citations=not args.no_strip_citations,
                 )
             src = paper.get("_segmentation_source", "skipped")
             seg_stats[src] = seg_stats.get(src, 0) + 1
+        if seg_cache is not None:
+            seg_cache.flush()
+
+        # ---- Pass 2: extraction + finalization ----
+        # Full-text acquisition (three-tier waterfall / SciHub) runs as a
+        # concurrent prefetch stage; papers are extracted as soon as their
+        # text is ready, API-validated once per unique entity across the
+        # chunk, and slotted back into input order.
+        if enricher is not None:
+            ready = enricher.prefetch_sections(papers, max_workers=args.fetch_workers)
+            processed = enricher.process_chunk(papers, ready)
+        else:
+            processed = ((i, None) for i in range(len(papers)))
+
+        cleaned = [None] * len(papers)
+        for idx, agent_results in processed:
+            paper = papers[idx]
 
             # Preserve original RORs in case rescan can't re-derive them
             # (institution lookup depends on affiliations which may be absent in rescan)
@@ -606,9 +710,7 @@ def main():
 
             # Re-run agents — agent output is authoritative for tag fields
             # (replaces scraper tags that bypassed the RoleClassifier)
-            if enricher is not None:
-                agent_results = enricher.process_paper(paper)
-
+            if agent_results is not None:
                 # Tag fields: agent output REPLACES existing values because
                 # the agent applied role classification and over-tagging
                 # prevention.  Union would re-introduce scraper tags that
@@ -755,8 +857,12 @@ def main():
                 if _seg_key.startswith("_segmented_") or _seg_key.startswith("_segmentation_"):
                     paper.pop(_seg_key, None)
 
-            cleaned.append(paper)
+            cleaned[idx] = paper
+
+        return cleaned
 
+    def _finish_chunk(input_file, cleaned):
+        """Network stage: batch API enrichment, flag refresh, chunk write."""
         # Batch API enrichment (OpenAlex first, S2 citations, then per-paper GH/CrossRef/DataCite/ROR)
         if enricher_api is not None:
             enricher_api.enrich_batch(
@@ -792,13 +898,37 @@ def main():
             paper["has_institutions"] = bool(paper.get("institutions"))
             paper["has_facility"] = paper["has_institutions"]
 
-        # Write output
-        out_file = os.path.join(out_dir, os.path.basename(input_file))
+        # Write output — always plain JSON, whatever the input chunk format
+        out_file = with_chunk_format(os.path.join(out_dir, os.path.basename(input_file)), "json")
         with open(out_file, "w", encoding="utf-8") as f:
             json.dump(cleaned, f, indent=2, ensure_ascii=False, default=str)
 
-        total_papers += len(cleaned)
         logger.info("  → %d papers → %s", len(cleaned), os.path.basename(out_file))
+        return len(cleaned)
+
+    # ---- Chunk scheduler ----
+    # Extraction of chunk N+1 runs on this thread while chunk N's API
+    # enrichment and write run on a single background worker, so chunks
+    # are still enriched and written in input order.  At most
+    # --inflight-chunks extracted chunks wait on enrichment at any time;
+    # 0 runs the two stages back to back.
+    inflight = deque()
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="enrich") as enrich_pool:
+        for input_file in input_files:
+            logger.info("Processing: %s", os.path.basename(input_file))
+
+            papers = list(iter_chunk(input_file))
+
+            cleaned = _extract_chunk(papers)
+            if args.inflight_chunks <= 0:
+                total_papers += _finish_chunk(input_file, cleaned)
+                continue
+            while len(inflight) >= args.inflight_chunks:
+                total_papers += inflight.popleft().result()
+            inflight.append(enrich_pool.submit(_finish_chunk, input_file, cleaned))
+
+        while inflight:
+            total_papers += inflight.popleft().result()
 
     logger.info("")
     logger.info("=" * 60)
@@ -811,6 +941,9 @@ def main():
         logger.info("  Heuristic segmented:  %d", seg_stats.get("heuristic", 0))
         logger.info("  Full-text fallback:   %d", seg_stats.get("full_text_fallback", 0))
         logger.info("  Abstract-only:        %d", seg_stats.get("abstract_only", 0))
+        if seg_cache is not None:
+            logger.info("  Cache hits / misses:  %d / %d", seg_cache.hits, seg_cache.misses)
+            seg_cache.close()
     if enricher is not None:
         logger.info("")
         logger.info("SCIHUB FALLBACK:")
@@ -820,6 +953,20 @@ def main():
         if enricher.scihub_attempted > 0:
             rate = enricher.scihub_success / enricher.scihub_attempted * 100
             logger.info("  Hit rate:             %.1f%%", rate)
+        checked = enricher.sections_analyzed + enricher.sections_skipped
+        if checked:
+            logger.info("")
+            logger.info("AGENT PREFILTER:")
+            logger.info("  Agent-section pairs:  %d", checked)
+            logger.info("  Skipped (no anchors): %d (%.1f%%)",
+                        enricher.sections_skipped,
+                        100.0 * enricher.sections_skipped / checked)
+    costs = load_costs.breakdown()
+    if costs:
+        logger.info("")
+        logger.info("LOAD COSTS:")
+        for component, seconds in costs:
+            logger.info("  %-45s %.2fs", component, seconds)
     logger.info("")
     logger.info("Next step: python 4_validate.py --input-dir %s", out_dir)
 
@@ -21,6 +21,8 @@ Usage:
   python microhub_scraper_v5.py --priority-only      # Only high-value papers
   python microhub_scraper_v5.py --full-text-only     # Only papers with full text
   python microhub_scraper_v5.py --fetch-citations    # Update citations for existing papers
+  python microhub_scraper_v5.py --pipelined          # Concurrent search/fetch/save stages
+  python microhub_scraper_v5.py --incremental        # Only records added since the last run
 
 CHANGES IN v5.0:
 - Added AUTHOR AFFILIATIONS extraction from PubMed XML
@@ -37,11 +39,13 @@ import re
 import logging
 import argparse
 import os
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Set, Tuple, Any
 import xml.etree.ElementTree as ET
 from urllib.parse import urljoin, urlparse, quote
 import hashlib
+import queue
+import threading
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # ============================================================================
@@ -58,6 +62,26 @@ MAX_RETRIES = 3
 RETRY_BASE_DELAY = 1.0  # Base delay in seconds (will be multiplied exponentially)
 RETRY_MAX_DELAY = 30.0  # Maximum delay between retries
 
+# ============================================================================
+# API RATE LIMITS (one shared limiter per service, across threads)
+# ============================================================================
+NCBI_INTERVAL_WITH_KEY = 0.11  # ~10 req/sec with an API key
+NCBI_INTERVAL_NO_KEY = 0.34    # ~3 req/sec without
+SEMANTIC_SCHOLAR_INTERVAL = 0.1
+CROSSREF_INTERVAL = 0.05
+
+# Pipelined mode (--pipelined)
+PIPELINE_FETCH_WORKERS = 3     # Concurrent efetch + parse workers
+PIPELINE_QUEUE_SIZE = 8        # Max batches buffered between stages
+PIPELINE_FETCH_BATCH = 100     # PMIDs per efetch request
+
+# Batched DB writes (PaperBatchWriter)
+DB_BATCH_SIZE = 200            # Flush after this many queued papers...
+DB_BATCH_SECONDS = 5.0         # ...or after this many seconds, whichever first
+
+# Incremental re-scrape (--incremental)
+INCREMENTAL_OVERLAP_DAYS = 1   # Re-search this many days before the last window
+
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(levelname)s - %(message)s'
@@ -203,6 +227,30 @@ def extract_year(text: str) -> Optional[int]:
     return None
 
 
+class RateLimiter:
+    """
+    Thread-safe request spacer for one API.
+
+    Every call to the API waits on the same limiter, so concurrent search
+    and fetch threads together never exceed its budget (for NCBI
+    E-utilities: 3 req/sec without an API key, 10 req/sec with one).
+    """
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    def wait(self):
+        """Block until the next request slot is available."""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
 # ============================================================================
 # DATABASE SCHEMA - COMPREHENSIVE (with affiliations added in v5.0)
 # ============================================================================
@@ -354,7 +402,12 @@ CREATE TABLE IF NOT EXISTS scrape_log (
     skipped INTEGER,
     full_text_fetched INTEGER DEFAULT 0,
     citations_fetched INTEGER DEFAULT 0,
-    timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+
+    -- Incremental re-scrape high-water mark (Entrez date window searched)
+    window_start TEXT,                       -- YYYY/MM/DD, NULL = full history
+    window_end TEXT,                         -- YYYY/MM/DD, NULL = run cut short
+    max_pmid INTEGER
 );
 
 CREATE TABLE IF NOT EXISTS url_validation (
@@ -1377,6 +1430,53 @@ IMAGE_ACQUISITION_SOFTWARE = {
 # SCRAPER CLASS
 # ============================================================================
 
+# Columns stored as JSON arrays in the papers table
+PAPER_JSON_FIELDS = [
+    'microscopy_techniques', 'microscope_brands', 'microscope_models',
+    'image_analysis_software', 'image_acquisition_software',
+    'sample_preparation', 'fluorophores', 'organisms', 'cell_lines',
+    'protocols', 'repositories', 'rrids', 'rors', 'antibodies',
+    'supplementary_materials', 'figures', 'techniques', 'software',
+    'affiliations', 'github_tools',  # v5.0+ fields
+    'reagent_suppliers', 'antibody_sources', 'general_software',
+    'institutions',  # v6.0 fields
+]
+
+PAPER_INSERT_SQL = """
+    INSERT INTO papers (
+        pmid, doi, pmc_id, title, abstract, methods, full_text,
+        authors, journal, year,
+        affiliations,
+        doi_url, pubmed_url, pmc_url,
+        citation_count, influential_citation_count, citation_source, semantic_scholar_id,
+        microscopy_techniques, microscope_brands, microscope_models,
+        image_analysis_software, image_acquisition_software,
+        sample_preparation, fluorophores, organisms, cell_lines,
+        protocols, repositories, github_url, rrids, rors, antibodies,
+        supplementary_materials, figures, figure_count,
+        techniques, software, microscope_brand,
+        reagent_suppliers, antibody_sources, general_software, institutions,
+        has_full_text, has_figures, has_protocols, has_github, has_data, has_affiliations,
+        priority_score, enriched_at, citations_updated_at
+    ) VALUES (
+        ?, ?, ?, ?, ?, ?, ?,
+        ?, ?, ?,
+        ?,
+        ?, ?, ?,
+        ?, ?, ?, ?,
+        ?, ?, ?,
+        ?, ?,
+        ?, ?, ?, ?,
+        ?, ?, ?, ?, ?, ?,
+        ?, ?, ?,
+        ?, ?, ?,
+        ?, ?, ?, ?,
+        ?, ?, ?, ?, ?, ?,
+        ?, datetime('now'), datetime('now')
+    )
+"""
+
+
 class MicroHubScraperV5:
     """Paper scraper with CITATIONS, full text, AFFILIATIONS, and comprehensive extraction."""
 
@@ -1386,6 +1486,11 @@ class MicroHubScraperV5:
         self.db_path = db_path
         self.email = email or 'microhub@example.com'
         self.ncbi_api_key = ncbi_api_key
+        self.ncbi_limiter = RateLimiter(
+            NCBI_INTERVAL_WITH_KEY if ncbi_api_key else NCBI_INTERVAL_NO_KEY
+        )
+        self.s2_limiter = RateLimiter(SEMANTIC_SCHOLAR_INTERVAL)
+        self.crossref_limiter = RateLimiter(CROSSREF_INTERVAL)
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': f'MicroHub/5.0 (Microscopy Database; mailto:{self.email})'
@@ -1421,6 +1526,7 @@ class MicroHubScraperV5:
             'llm_enriched': 0,
             'skipped_no_tags': 0,
         }
+        self._stats_lock = threading.Lock()
 
         self._init_db()
         self._load_known()
@@ -1465,6 +1571,17 @@ class MicroHubScraperV5:
                     conn.execute(f"ALTER TABLE papers ADD COLUMN {col_name} {col_type}")
                 except:
                     pass
+
+        # scrape_log high-water mark columns (incremental re-scrape)
+        cursor.execute("PRAGMA table_info(scrape_log)")
+        log_cols = {row[1] for row in cursor.fetchall()}
+        for col_name, col_type in [('window_start', 'TEXT'), ('window_end', 'TEXT'), ('max_pmid', 'INTEGER')]:
+            if col_name not in log_cols:
+                try:
+                    conn.execute(f"ALTER TABLE scrape_log ADD COLUMN {col_name} {col_type}")
+                except:
+                    pass
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_scrape_log_query ON scrape_log(query)")
         
         conn.commit()
         conn.close()
@@ -1488,6 +1605,11 @@ class MicroHubScraperV5:
         conn.close()
         logger.info(f"Loaded {len(self.known_dois):,} DOIs, {len(self.known_pmids):,} PMIDs")
 
+    def count_stat(self, key: str, n: int = 1):
+        """Add *n* to a stats counter (safe from concurrent fetch workers)."""
+        with self._stats_lock:
+            self.stats[key] += n
+
     def _is_duplicate(self, doi: str, pmid: str) -> bool:
         """Check if paper already exists."""
         if doi and doi.lower() in self.known_dois:
@@ -1513,9 +1635,9 @@ class MicroHubScraperV5:
             # Manual retry with exponential backoff
             for attempt in range(MAX_RETRIES):
                 try:
+                    self.s2_limiter.wait()
                     response = self.session.get(url, params=params, timeout=15)
-                    self.stats['api_calls'] += 1
-                    time.sleep(0.1)  # Rate limit: 100 requests per 5 minutes
+                    self.count_stat('api_calls')
 
                     if response.status_code == 200:
                         data = response.json()
@@ -1570,9 +1692,9 @@ class MicroHubScraperV5:
                 url = f"https://api.crossref.org/works/{quote(doi, safe='')}"
                 headers = {'User-Agent': f'MicroHub/5.0 (mailto:{self.email})'}
 
+                self.crossref_limiter.wait()
                 response = self.session.get(url, headers=headers, timeout=15)
-                self.stats['api_calls'] += 1
-                time.sleep(0.05)  # Polite rate limiting
+                self.count_stat('api_calls')
 
                 if response.status_code == 200:
                     data = response.json()
@@ -1704,14 +1826,14 @@ class MicroHubScraperV5:
         # Try Semantic Scholar first (better data)
         result = self.fetch_citations_semantic_scholar(doi, pmid)
         if result and result.get('citation_count', 0) > 0:
-            self.stats['citations_fetched'] += 1
+            self.count_stat('citations_fetched')
             return result
         
         # Fall back to CrossRef
         if doi:
             result = self.fetch_citations_crossref(doi)
             if result and result.get('citation_count', 0) > 0:
-                self.stats['citations_fetched'] += 1
+                self.count_stat('citations_fetched')
                 return result
         
         return {'citation_count': 0, 'source': None}
@@ -2654,10 +2776,9 @@ Use empty arrays [] for categories with no applicable tags."""
             if self.ncbi_api_key:
                 params['api_key'] = self.ncbi_api_key
 
+            self.ncbi_limiter.wait()
             response = self.session.get(url, params=params, timeout=60)
-            self.stats['api_calls'] += 1
-            # Rate limit: 3 req/sec without key, 10 req/sec with key
-            time.sleep(0.11 if self.ncbi_api_key else 0.34)
+            self.count_stat('api_calls')
 
             if response.status_code != 200:
                 return None
@@ -2773,7 +2894,7 @@ Use empty arrays [] for categories with no applicable tags."""
                 if supp_data:
                     result['supplementary'].append(supp_data)
 
-            self.stats['full_text_fetched'] += 1
+            self.count_stat('full_text_fetched')
             return result
 
         except Exception as e:
@@ -2861,13 +2982,28 @@ Use empty arrays [] for categories with no applicable tags."""
 
     # ========== PUBMED API ==========
 
-    def search_pubmed(self, query: str, max_results: int = 10000) -> List[str]:
-        """Search PubMed."""
+    def search_pubmed(self, query: str, max_results: int = 10000,
+                      mindate: str = None, maxdate: str = None) -> List[str]:
+        """Search PubMed, optionally restricted to an Entrez-date window (YYYY/MM/DD)."""
+        return self._search_pubmed(query, max_results, mindate, maxdate)[0]
+
+    def _search_pubmed(self, query: str, max_results: int = 10000,
+                       mindate: str = None, maxdate: str = None) -> Tuple[List[str], bool]:
+        """``search_pubmed()`` plus whether every wanted PMID was retrieved.
+
+        The flag is False when a request failed or PubMed returned fewer
+        IDs than ``min(count, max_results)``.
+        """
         pmids = []
         batch_size = 500
         retstart = 0
+        total = None
+        failed = False
 
-        logger.info(f"  Searching: {query[:70]}...")
+        if mindate:
+            logger.info(f"  Searching: {query[:70]}... (added {mindate} - {maxdate or 'now'})")
+        else:
+            logger.info(f"  Searching: {query[:70]}...")
 
         while len(pmids) < max_results:
             try:
@@ -2880,20 +3016,26 @@ Use empty arrays [] for categories with no applicable tags."""
                     'retmode': 'json',
                     'sort': 'relevance',
                 }
+                if mindate:
+                    params['datetype'] = 'edat'
+                    params['mindate'] = mindate
+                    params['maxdate'] = maxdate or datetime.now().strftime('%Y/%m/%d')
                 if self.ncbi_api_key:
                     params['api_key'] = self.ncbi_api_key
 
+                self.ncbi_limiter.wait()
                 response = self.session.get(url, params=params, timeout=30)
-                self.stats['api_calls'] += 1
-                # Rate limit: 3 req/sec without key, 10 req/sec with key
-                time.sleep(0.11 if self.ncbi_api_key else 0.34)
+                self.count_stat('api_calls')
 
                 if response.status_code != 200:
+                    logger.warning(f"Search returned status {response.status_code}")
+                    failed = True
                     break
 
                 data = response.json()
                 result = data.get('esearchresult', {})
                 id_list = result.get('idlist', [])
+                total = int(result.get('count', 0))
 
                 if not id_list:
                     break
@@ -2901,22 +3043,29 @@ Use empty arrays [] for categories with no applicable tags."""
                 pmids.extend(id_list)
                 retstart += batch_size
 
-                total = int(result.get('count', 0))
-
                 if len(id_list) < batch_size or len(pmids) >= min(total, max_results):
                     break
 
             except Exception as e:
                 logger.error(f"Search error: {e}")
+                failed = True
                 break
 
-        self.stats['found'] += len(pmids)
-        return pmids[:max_results]
+        self.count_stat('found', len(pmids))
+        complete = (not failed and total is not None
+                    and len(pmids) >= min(total, max_results))
+        return pmids[:max_results], complete
 
     def fetch_papers(self, pmids: List[str], fetch_full_text: bool = True, fetch_cites: bool = True) -> List[Dict]:
         """Fetch paper details with full extraction and citations."""
+        return self._fetch_papers(pmids, fetch_full_text, fetch_cites)[0]
+
+    def _fetch_papers(self, pmids: List[str], fetch_full_text: bool = True,
+                      fetch_cites: bool = True) -> Tuple[List[Dict], bool]:
+        """``fetch_papers()`` plus whether every efetch batch succeeded."""
         papers = []
         batch_size = 100
+        complete = True
 
         for i in range(0, len(pmids), batch_size):
             batch = pmids[i:i+batch_size]
@@ -2931,12 +3080,13 @@ Use empty arrays [] for categories with no applicable tags."""
                 if self.ncbi_api_key:
                     params['api_key'] = self.ncbi_api_key
 
+                self.ncbi_limiter.wait()
                 response = self.session.get(url, params=params, timeout=60)
-                self.stats['api_calls'] += 1
-                # Rate limit: 3 req/sec without key, 10 req/sec with key
-                time.sleep(0.11 if self.ncbi_api_key else 0.34)
+                self.count_stat('api_calls')
 
                 if response.status_code != 200:
+                    logger.warning(f"Fetch returned status {response.status_code}")
+                    complete = False
                     continue
 
                 root = ET.fromstring(response.content)
@@ -2948,9 +3098,10 @@ Use empty arrays [] for categories with no applicable tags."""
 
             except Exception as e:
                 logger.error(f"Fetch error: {e}")
+                complete = False
                 continue
 
-        return papers
+        return papers, complete
 
     def _parse_article(self, article, fetch_full_text: bool = True, fetch_cites: bool = True) -> Optional[Dict]:
         """Parse PubMed article XML with complete extraction, text cleaning, and AFFILIATIONS."""
@@ -2971,7 +3122,7 @@ Use empty arrays [] for categories with no applicable tags."""
 
             # Check duplicate
             if self._is_duplicate(doi, pmid):
-                self.stats['duplicates_skipped'] += 1
+                self.count_stat('duplicates_skipped')
                 return None
 
             # Title - clean text
@@ -3245,28 +3396,28 @@ Use empty arrays [] for categories with no applicable tags."""
             # (all papers come from microscopy-specific PubMed queries,
             #  so they're already relevant — tagging happens in step 3)
             if not title or len(title.strip()) < 10:
-                self.stats['skipped_no_tags'] += 1
+                self.count_stat('skipped_no_tags')
                 logger.debug(f"Skipping paper {pmid}: no title")
                 return None
 
             # Update stats
             if full_methods and len(full_methods) > 200:
-                self.stats['with_methods'] += 1
+                self.count_stat('with_methods')
             if figures:
-                self.stats['with_figures'] += 1
+                self.count_stat('with_figures')
             if protocols:
-                self.stats['with_protocols'] += 1
+                self.count_stat('with_protocols')
             if github_url:
-                self.stats['with_github'] += 1
+                self.count_stat('with_github')
             if repositories:
-                self.stats['with_repos'] += 1
+                self.count_stat('with_repos')
             if rrids:
-                self.stats['with_rrids'] += 1
+                self.count_stat('with_rrids')
             if rors:
-                self.stats['with_rors'] += 1
+                self.count_stat('with_rors')
             # antibodies extracted in step 3
             if affiliations:
-                self.stats['with_affiliations'] += 1  # NEW in v5.0
+                self.count_stat('with_affiliations')  # NEW in v5.0
 
             return paper
 
@@ -3276,6 +3427,40 @@ Use empty arrays [] for categories with no applicable tags."""
 
     # ========== DATABASE ==========
 
+    def _paper_row(self, paper: Dict) -> Tuple:
+        """Serialize list fields to JSON (in place) and build the INSERT parameter tuple."""
+        for field in PAPER_JSON_FIELDS:
+            if field in paper and isinstance(paper[field], list):
+                paper[field] = json.dumps(paper[field])
+
+        return (
+            paper.get('pmid'), paper.get('doi'), paper.get('pmc_id'),
+            paper.get('title'), paper.get('abstract'), paper.get('methods'), paper.get('full_text'),
+            paper.get('authors'), paper.get('journal'), paper.get('year'),
+            paper.get('affiliations', '[]'),  # NEW in v5.0
+            paper.get('doi_url'), paper.get('pubmed_url'), paper.get('pmc_url'),
+            paper.get('citation_count', 0), paper.get('influential_citation_count', 0),
+            paper.get('citation_source'), paper.get('semantic_scholar_id'),
+            paper.get('microscopy_techniques', '[]'), paper.get('microscope_brands', '[]'),
+            paper.get('microscope_models', '[]'),
+            paper.get('image_analysis_software', '[]'), paper.get('image_acquisition_software', '[]'),
+            paper.get('sample_preparation', '[]'), paper.get('fluorophores', '[]'),
+            paper.get('organisms', '[]'), paper.get('cell_lines', '[]'),
+            paper.get('protocols', '[]'), paper.get('repositories', '[]'),
+            paper.get('github_url'), paper.get('rrids', '[]'),
+            paper.get('rors', '[]'), paper.get('antibodies', '[]'),
+            paper.get('supplementary_materials', '[]'),
+            paper.get('figures', '[]'), paper.get('figure_count', 0),
+            paper.get('techniques', '[]'), paper.get('software', '[]'),
+            paper.get('microscope_brand'),
+            paper.get('reagent_suppliers', '[]'), paper.get('antibody_sources', '[]'),
+            paper.get('general_software', '[]'), paper.get('institutions', '[]'),
+            paper.get('has_full_text', False), paper.get('has_figures', False),
+            paper.get('has_protocols', False), paper.get('has_github', False),
+            paper.get('has_data', False), paper.get('has_affiliations', False),  # NEW in v5.0
+            paper.get('priority_score', 0),
+        )
+
     def save_paper(self, paper: Dict) -> Optional[int]:
         """Save paper with all data including affiliations."""
         max_retries = 5
@@ -3285,81 +3470,7 @@ Use empty arrays [] for categories with no applicable tags."""
             try:
                 conn = self._get_conn()
 
-                # Convert lists to JSON
-                json_fields = [
-                    'microscopy_techniques', 'microscope_brands', 'microscope_models',
-                    'image_analysis_software', 'image_acquisition_software',
-                    'sample_preparation', 'fluorophores', 'organisms', 'cell_lines',
-                    'protocols', 'repositories', 'rrids', 'rors', 'antibodies',
-                    'supplementary_materials', 'figures', 'techniques', 'software',
-                    'affiliations', 'github_tools',  # v5.0+ fields
-                    'reagent_suppliers', 'antibody_sources', 'general_software',
-                    'institutions',  # v6.0 fields
-                ]
-
-                for field in json_fields:
-                    if field in paper and isinstance(paper[field], list):
-                        paper[field] = json.dumps(paper[field])
-
-                cursor = conn.execute("""
-                    INSERT INTO papers (
-                        pmid, doi, pmc_id, title, abstract, methods, full_text,
-                        authors, journal, year,
-                        affiliations,
-                        doi_url, pubmed_url, pmc_url,
-                        citation_count, influential_citation_count, citation_source, semantic_scholar_id,
-                        microscopy_techniques, microscope_brands, microscope_models,
-                        image_analysis_software, image_acquisition_software,
-                        sample_preparation, fluorophores, organisms, cell_lines,
-                        protocols, repositories, github_url, rrids, rors, antibodies,
-                        supplementary_materials, figures, figure_count,
-                        techniques, software, microscope_brand,
-                        reagent_suppliers, antibody_sources, general_software, institutions,
-                        has_full_text, has_figures, has_protocols, has_github, has_data, has_affiliations,
-                        priority_score, enriched_at, citations_updated_at
-                    ) VALUES (
-                        ?, ?, ?, ?, ?, ?, ?,
-                        ?, ?, ?,
-                        ?,
-                        ?, ?, ?,
-                        ?, ?, ?, ?,
-                        ?, ?, ?,
-                        ?, ?,
-                        ?, ?, ?, ?,
-                        ?, ?, ?, ?, ?, ?,
-                        ?, ?, ?,
-                        ?, ?, ?,
-                        ?, ?, ?, ?,
-                        ?, ?, ?, ?, ?, ?,
-                        ?, datetime('now'), datetime('now')
-                    )
-                """, (
-                    paper.get('pmid'), paper.get('doi'), paper.get('pmc_id'),
-                    paper.get('title'), paper.get('abstract'), paper.get('methods'), paper.get('full_text'),
-                    paper.get('authors'), paper.get('journal'), paper.get('year'),
-                    paper.get('affiliations', '[]'),  # NEW in v5.0
-                    paper.get('doi_url'), paper.get('pubmed_url'), paper.get('pmc_url'),
-                    paper.get('citation_count', 0), paper.get('influential_citation_count', 0),
-                    paper.get('citation_source'), paper.get('semantic_scholar_id'),
-                    paper.get('microscopy_techniques', '[]'), paper.get('microscope_brands', '[]'),
-                    paper.get('microscope_models', '[]'),
-                    paper.get('image_analysis_software', '[]'), paper.get('image_acquisition_software', '[]'),
-                    paper.get('sample_preparation', '[]'), paper.get('fluorophores', '[]'),
-                    paper.get('organisms', '[]'), paper.get('cell_lines', '[]'),
-                    paper.get('protocols', '[]'), paper.get('repositories', '[]'),
-                    paper.get('github_url'), paper.get('rrids', '[]'),
-                    paper.get('rors', '[]'), paper.get('antibodies', '[]'),
-                    paper.get('supplementary_materials', '[]'),
-                    paper.get('figures', '[]'), paper.get('figure_count', 0),
-                    paper.get('techniques', '[]'), paper.get('software', '[]'),
-                    paper.get('microscope_brand'),
-                    paper.get('reagent_suppliers', '[]'), paper.get('antibody_sources', '[]'),
-                    paper.get('general_software', '[]'), paper.get('institutions', '[]'),
-                    paper.get('has_full_text', False), paper.get('has_figures', False),
-                    paper.get('has_protocols', False), paper.get('has_github', False),
-                    paper.get('has_data', False), paper.get('has_affiliations', False),  # NEW in v5.0
-                    paper.get('priority_score', 0),
-                ))
+                cursor = conn.execute(PAPER_INSERT_SQL, self._paper_row(paper))
 
                 conn.commit()
                 paper_id = cursor.lastrowid
@@ -3370,7 +3481,7 @@ Use empty arrays [] for categories with no applicable tags."""
                 if paper.get('pmid'):
                     self.known_pmids.add(paper['pmid'])
 
-                self.stats['saved'] += 1
+                self.count_stat('saved')
                 conn.close()
                 return paper_id
 
@@ -3386,7 +3497,7 @@ Use empty arrays [] for categories with no applicable tags."""
                     conn.close()
                 return None
             except Exception as e:
-                self.stats['errors'] += 1
+                self.count_stat('errors')
                 logger.debug(f"Save error: {e}")
                 if conn:
                     conn.close()
@@ -3585,13 +3696,130 @@ Use empty arrays [] for categories with no applicable tags."""
     # ========== RUN ==========
 
     def run(self, limit: int = None, priority_only: bool = False,
-            full_text_only: bool = False, fetch_citations: bool = True):
-        """Run scraper with complete extraction."""
+            full_text_only: bool = False, fetch_citations: bool = True,
+            db_batch_size: int = DB_BATCH_SIZE, db_batch_seconds: float = DB_BATCH_SECONDS,
+            incremental: bool = False, overlap_days: int = INCREMENTAL_OVERLAP_DAYS):
+        """
+        Run scraper with complete extraction.
+
+        With ``incremental=True`` each query only searches records added to
+        PubMed since its last completed run (see ``_query_window``).
+        """
+        self._log_banner()
+
+        queries = self._select_queries(priority_only)
+
+        total_saved = 0
+        query_count = 0
+        writer = PaperBatchWriter(self, db_batch_size, db_batch_seconds)
+
+        try:
+            for query, max_results in queries:
+                query_count += 1
+
+                if limit and total_saved >= limit:
+                    break
+
+                remaining = (limit - total_saved) if limit else max_results
+                actual_max = min(max_results, remaining)
+
+                logger.info(f"\n[{query_count}/{len(queries)}] {query[:60]}...")
+
+                mindate, maxdate = self._query_window(writer.conn, query, incremental, overlap_days)
+                pmids, complete = self._search_pubmed(query, actual_max, mindate, maxdate)
+                new_pmids = [p for p in pmids if p not in self.known_pmids]
+
+                if not pmids:
+                    logger.info("  No results")
+                elif not new_pmids:
+                    logger.info(f"  All {len(pmids)} already in database")
+                else:
+                    logger.info(f"  Found {len(pmids)}, {len(new_pmids)} new")
+
+                    papers, fetched = self._fetch_papers(new_pmids, fetch_full_text=True,
+                                                         fetch_cites=fetch_citations)
+                    complete = complete and fetched
+
+                    if full_text_only:
+                        papers = [p for p in papers if p.get('has_full_text')]
+
+                    for paper in papers:
+                        if writer.add(paper, tag=query_count):
+                            total_saved += 1
+
+                        if limit and total_saved >= limit:
+                            break
+
+                # Commit the query's papers so its saved count (and the
+                # high-water mark below) reflect what is actually stored
+                writer.flush()
+                saved_this_query = writer.saved.pop(query_count, 0)
+                if new_pmids:
+                    logger.info(f"  Saved {saved_this_query}, total: {total_saved}")
+
+                # Only advance the high-water mark if the search and every
+                # fetch finished, every paper was written, and the run's
+                # --limit did not cut the query short
+                complete = (complete and actual_max == max_results
+                            and not (limit and total_saved >= limit)
+                            and query_count not in writer.failed)
+                self._log_query(writer.conn, query, len(pmids), saved_this_query,
+                                mindate, maxdate if complete else None, self._max_pmid(pmids))
+        finally:
+            writer.close()
+
+        self._log_summary(query_count)
+        return self.stats
+
+    def _query_window(self, conn, query: str, incremental: bool,
+                      overlap_days: int) -> Tuple[Optional[str], str]:
+        """
+        Return the (mindate, maxdate) Entrez-date window to search for a query.
+
+        ``mindate`` is None for a full-history search. In incremental mode it
+        is the query's last completed ``window_end`` from ``scrape_log``,
+        moved back by ``overlap_days`` so late-indexed records are not missed
+        (overlap is absorbed by the known-PMID dedup).
+        """
+        maxdate = datetime.now().strftime('%Y/%m/%d')
+        if not incremental:
+            return None, maxdate
+        row = conn.execute(
+            "SELECT window_end FROM scrape_log WHERE query = ? AND window_end IS NOT NULL "
+            "AND window_end != '' ORDER BY id DESC LIMIT 1",
+            (query,)
+        ).fetchone()
+        if not row:
+            return None, maxdate
+        start = datetime.strptime(row[0], '%Y/%m/%d') - timedelta(days=overlap_days)
+        return start.strftime('%Y/%m/%d'), maxdate
+
+    @staticmethod
+    def _max_pmid(pmids: List[str]) -> Optional[int]:
+        numeric = [int(p) for p in pmids if str(p).isdigit()]
+        return max(numeric) if numeric else None
+
+    def _log_query(self, conn, query: str, found: int, saved: int,
+                   window_start: Optional[str], window_end: Optional[str],
+                   max_pmid: Optional[int]):
+        """Record a query run and its high-water mark in scrape_log."""
+        conn.execute(
+            "INSERT INTO scrape_log (query, found, saved, skipped, citations_fetched, "
+            "window_start, window_end, max_pmid) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (query, found, saved, found - saved, self.stats['citations_fetched'],
+             window_start, window_end, max_pmid)
+        )
+        conn.commit()
+
+    def _log_banner(self, mode: str = None):
+        """Log the run header (version, rate limit, LLM settings)."""
         logger.info("=" * 70)
         logger.info("MICROHUB PAPER SCRAPER v6.0 - COLLECT + ACQUIRE")
         logger.info("=" * 70)
         logger.info("Features: Full text + CITATIONS + AFFILIATIONS + identifiers")
         logger.info("Tagging deferred to step 3 (3_clean.py)")
+        if mode:
+            logger.info(f"Mode: {mode}")
         if self.ncbi_api_key:
             logger.info("NCBI API key: provided (10 req/sec rate limit)")
         else:
@@ -3600,6 +3828,8 @@ Use empty arrays [] for categories with no applicable tags."""
             logger.info(f"LLM ENRICHMENT ENABLED (model: {LLM_MODEL})")
         logger.info("")
 
+    def _select_queries(self, priority_only: bool = False) -> List[Tuple[str, int]]:
+        """Return the query list, optionally restricted to priority sources."""
         queries = self.get_all_queries()
 
         if priority_only:
@@ -3608,70 +3838,22 @@ Use empty arrays [] for categories with no applicable tags."""
             logger.info(f"Priority mode: {len(queries)} queries")
 
         logger.info(f"Total queries: {len(queries)}")
+        return queries
 
-        total_saved = 0
-        query_count = 0
-
-        for query, max_results in queries:
-            query_count += 1
-
-            if limit and total_saved >= limit:
-                break
-
-            remaining = (limit - total_saved) if limit else max_results
-            actual_max = min(max_results, remaining)
-
-            logger.info(f"\n[{query_count}/{len(queries)}] {query[:60]}...")
-
-            pmids = self.search_pubmed(query, actual_max)
-            if not pmids:
-                logger.info("  No results")
-                continue
-
-            new_pmids = [p for p in pmids if p not in self.known_pmids]
-            if not new_pmids:
-                logger.info(f"  All {len(pmids)} already in database")
-                continue
-
-            logger.info(f"  Found {len(pmids)}, {len(new_pmids)} new")
-
-            papers = self.fetch_papers(new_pmids, fetch_full_text=True, fetch_cites=fetch_citations)
-
-            if full_text_only:
-                papers = [p for p in papers if p.get('has_full_text')]
-
-            saved_this_query = 0
-            for paper in papers:
-                paper_id = self.save_paper(paper)
-                if paper_id:
-                    saved_this_query += 1
-                    total_saved += 1
-                    
-                    # Track GitHub tool references
-                    github_tools = paper.get('github_tools', [])
-                    if isinstance(github_tools, str):
-                        try:
-                            github_tools = json.loads(github_tools)
-                        except:
-                            github_tools = []
-                    for ref in github_tools:
-                        self.track_github_tool(paper_id, ref)
-
-                if limit and total_saved >= limit:
-                    break
-
-            logger.info(f"  Saved {saved_this_query}, total: {total_saved}")
-
-            # Log progress
-            conn = self._get_conn()
-            conn.execute(
-                "INSERT INTO scrape_log (query, found, saved, skipped, citations_fetched) VALUES (?, ?, ?, ?, ?)",
-                (query, len(pmids), saved_this_query, len(pmids) - saved_this_query, self.stats['citations_fetched'])
-            )
-            conn.commit()
-            conn.close()
+    def _track_paper_github_tools(self, paper_id: int, paper: Dict) -> int:
+        """Register every GitHub tool reference of a freshly saved paper."""
+        github_tools = paper.get('github_tools', [])
+        if isinstance(github_tools, str):
+            try:
+                github_tools = json.loads(github_tools)
+            except:
+                github_tools = []
+        for ref in github_tools:
+            self.track_github_tool(paper_id, ref)
+        return len(github_tools)
 
-        # Final stats
+    def _log_summary(self, query_count: int):
+        """Log final scrape statistics."""
         logger.info("\n" + "=" * 70)
         logger.info("SCRAPING COMPLETE - v6.0 COLLECT + ACQUIRE")
         logger.info("=" * 70)
@@ -3696,9 +3878,393 @@ Use empty arrays [] for categories with no applicable tags."""
         logger.info(f"Errors: {self.stats['errors']}")
         logger.info(f"API calls: {self.stats['api_calls']:,}")
 
+    # ========== PIPELINED RUN ==========
+
+    def run_pipelined(self, limit: int = None, priority_only: bool = False,
+                      full_text_only: bool = False, fetch_citations: bool = True,
+                      fetch_workers: int = PIPELINE_FETCH_WORKERS,
+                      queue_size: int = PIPELINE_QUEUE_SIZE,
+                      db_batch_size: int = DB_BATCH_SIZE,
+                      db_batch_seconds: float = DB_BATCH_SECONDS,
+                      incremental: bool = False,
+                      overlap_days: int = INCREMENTAL_OVERLAP_DAYS):
+        """
+        Run the scraper as three concurrent stages joined by bounded queues:
+
+            search (1 thread) -> fetch + parse (N threads) -> save (this thread)
+
+        All esearch/efetch calls share ``self.ncbi_limiter``, so the stages
+        together stay within the NCBI budget while parsing, citation lookups
+        and DB writes overlap with network waits. PMIDs are deduplicated
+        across queries before fetching; each PMID is credited to the first
+        query that returned it.
+        """
+        self._log_banner(mode=f"pipelined ({fetch_workers} fetch workers)")
+
+        queries = self._select_queries(priority_only)
+
+        fetch_q: "queue.Queue" = queue.Queue(maxsize=queue_size)
+        save_q: "queue.Queue" = queue.Queue(maxsize=queue_size)
+        stop = threading.Event()
+        search_done = threading.Event()
+
+        found_per_query = [0] * len(queries)
+        windows: List[Optional[Tuple[Optional[str], str]]] = [None] * len(queries)
+        searched_ok = [False] * len(queries)
+        fetch_failed = [False] * len(queries)
+        max_pmids: List[Optional[int]] = [None] * len(queries)
+        claimed: Set[str] = set()
+        searched = [0]
+
+        def put(q, item):
+            # Give up on the put once a stage has signalled a stop, so
+            # upstream threads never block on a queue nobody drains.
+            while not stop.is_set():
+                try:
+                    q.put(item, timeout=0.5)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def search_stage():
+            conn = self._get_conn()
+            try:
+                for idx, (query, max_results) in enumerate(queries):
+                    if stop.is_set():
+                        break
+                    searched[0] = idx + 1
+                    actual_max = min(max_results, limit) if limit else max_results
+                    logger.info(f"\n[{idx + 1}/{len(queries)}] {query[:60]}...")
+
+                    windows[idx] = self._query_window(conn, query, incremental, overlap_days)
+                    pmids, searched_ok[idx] = self._search_pubmed(query, actual_max, *windows[idx])
+                    found_per_query[idx] = len(pmids)
+                    max_pmids[idx] = self._max_pmid(pmids)
+                    new_pmids = []
+                    for pmid in pmids:
+                        if pmid in self.known_pmids:
+                            continue
+                        if pmid in claimed:
+                            self.count_stat('duplicates_skipped')
+                            continue
+                        claimed.add(pmid)
+                        new_pmids.append(pmid)
+
+                    logger.info(f"  Found {len(pmids)}, {len(new_pmids)} new")
+
+                    for i in range(0, len(new_pmids), PIPELINE_FETCH_BATCH):
+                        if not put(fetch_q, (idx, new_pmids[i:i + PIPELINE_FETCH_BATCH])):
+                            break
+            except Exception as e:
+                logger.error(f"Search stage error: {e}")
+            finally:
+                conn.close()
+                search_done.set()
+
+        def fetch_stage():
+            # Workers exit once the search stage is done and the queue is
+            # drained, or as soon as a stop is signalled.
+            try:
+                while not stop.is_set():
+                    try:
+                        idx, batch = fetch_q.get(timeout=0.5)
+                    except queue.Empty:
+                        if search_done.is_set():
+                            break
+                        continue
+                    try:
+                        papers, fetched = self._fetch_papers(batch, fetch_full_text=True,
+                                                             fetch_cites=fetch_citations)
+                    except Exception as e:
+                        # Keep the worker alive; the batch is lost for this run
+                        logger.error(f"Fetch stage error: {e}")
+                        fetch_failed[idx] = True
+                        continue
+                    if not fetched:
+                        fetch_failed[idx] = True
+                    if full_text_only:
+                        papers = [p for p in papers if p.get('has_full_text')]
+                    put(save_q, (idx, papers))
+            except BaseException:
+                stop.set()
+                raise
+
+        search_thread = threading.Thread(target=search_stage, name='scrape-search', daemon=True)
+        fetch_threads = [
+            threading.Thread(target=fetch_stage, name=f'scrape-fetch-{i}', daemon=True)
+            for i in range(fetch_workers)
+        ]
+        threads = [search_thread] + fetch_threads
+        for t in threads:
+            t.start()
+
+        # ---- Save stage (single writer, runs on this thread) ----
+        writer = PaperBatchWriter(self, db_batch_size, db_batch_seconds)
+        total_saved = 0
+        try:
+            # A fetch worker's puts are all queued before it exits, so the
+            # queue is complete once every worker is gone.
+            while any(t.is_alive() for t in fetch_threads) or not save_q.empty():
+                try:
+                    item = save_q.get(timeout=min(writer.max_seconds, 0.5))
+                except queue.Empty:
+                    writer.flush_if_due()
+                    continue
+                if stop.is_set():
+                    continue
+                idx, papers = item
+                for paper in papers:
+                    if writer.add(paper, tag=idx):
+                        total_saved += 1
+                    if limit and total_saved >= limit:
+                        stop.set()
+                        break
+                logger.info(f"  Queued {total_saved:,} papers for saving")
+        except BaseException:
+            stop.set()
+            raise
+        finally:
+            writer.close()
+
+        for t in threads:
+            t.join()
+
+        # All papers are committed at this point; a query's high-water mark
+        # advances only if its search and every fetch batch finished, all
+        # its papers were written, and --limit did not stop the run early
+        conn = self._get_conn()
+        for i, (query, max_results) in enumerate(queries[:searched[0]]):
+            if windows[i] is None:
+                continue  # search stage failed before reaching this query
+            mindate, maxdate = windows[i]
+            complete = (searched_ok[i] and not fetch_failed[i]
+                        and not stop.is_set() and not (limit and limit < max_results)
+                        and i not in writer.failed)
+            self._log_query(conn, query, found_per_query[i], writer.saved.get(i, 0),
+                            mindate, maxdate if complete else None, max_pmids[i])
+        conn.close()
+
+        self._log_summary(searched[0])
         return self.stats
 
 
+class PaperBatchWriter:
+    """
+    Buffered writer for the scraper's papers and GitHub tool links.
+
+    Reuses a single connection and commits papers plus their
+    ``github_tools`` / ``paper_github_tools`` rows in one ``executemany``
+    transaction every ``batch_size`` papers or ``max_seconds`` seconds,
+    instead of one connection and commit per paper. Each flush logs its
+    throughput.
+
+    ``add()`` returns False for papers already known (by PMID or DOI) or
+    already queued, matching the IntegrityError path of ``save_paper()``;
+    call ``close()`` to flush the tail. Identifiers join the scraper's
+    known sets only once their papers are committed. Papers may carry a
+    *tag* (the query index): ``saved`` counts committed papers per tag,
+    and ``failed`` holds tags with a paper that could not be written.
+    """
+
+    def __init__(self, scraper: 'MicroHubScraperV5',
+                 batch_size: int = DB_BATCH_SIZE,
+                 max_seconds: float = DB_BATCH_SECONDS):
+        self.scraper = scraper
+        self.batch_size = max(1, batch_size)
+        self.max_seconds = max_seconds
+        self.conn = scraper._get_conn()
+        self.pending: List[Tuple[Dict, Any]] = []
+        self.batches = 0
+        self.saved: Dict[Any, int] = {}
+        self.failed: Set[Any] = set()
+        self._pending_dois: Set[str] = set()
+        self._pending_pmids: Set[str] = set()
+        self._first_pending_at = 0.0
+
+    def add(self, paper: Dict, tag: Any = None) -> bool:
+        """Queue a paper for the next batch; flush when the batch is due."""
+        doi = (paper.get('doi') or '').lower()
+        pmid = paper.get('pmid')
+        if (self.scraper._is_duplicate(doi, pmid)
+                or (doi and doi in self._pending_dois)
+                or (pmid and pmid in self._pending_pmids)):
+            return False
+
+        if doi:
+            self._pending_dois.add(doi)
+        if pmid:
+            self._pending_pmids.add(pmid)
+
+        if not self.pending:
+            self._first_pending_at = time.monotonic()
+        self.pending.append((paper, tag))
+        if len(self.pending) >= self.batch_size:
+            self.flush()
+        else:
+            self.flush_if_due()
+        return True
+
+    def flush_if_due(self):
+        """Flush when the oldest queued paper has waited ``max_seconds``."""
+        if self.pending and time.monotonic() - self._first_pending_at >= self.max_seconds:
+            self.flush()
+
+    def flush(self):
+        """Write all queued papers and their tool links in one transaction."""
+        if not self.pending:
+            return
+        batch, self.pending = self.pending, []
+        self._pending_dois.clear()
+        self._pending_pmids.clear()
+        started = time.monotonic()
+
+        for attempt in range(MAX_RETRIES + 2):
+            try:
+                links = self._write_batch(batch)
+                break
+            except sqlite3.OperationalError as e:
+                self.conn.rollback()
+                if 'locked' in str(e) and attempt < MAX_RETRIES + 1:
+                    time.sleep(min(RETRY_BASE_DELAY * (2 ** attempt), RETRY_MAX_DELAY))
+                    continue
+                logger.warning(f"Batch write failed ({e}); falling back to per-paper saves")
+                links = self._write_individually(batch)
+                break
+            except Exception as e:
+                self.conn.rollback()
+                logger.warning(f"Batch write failed ({e}); falling back to per-paper saves")
+                links = self._write_individually(batch)
+                break
+
+        elapsed = time.monotonic() - started
+        self.batches += 1
+        rate = len(batch) / elapsed if elapsed > 0 else float('inf')
+        logger.info(
+            f"  DB batch {self.batches}: {len(batch)} papers, {links} tool links "
+            f"in {elapsed:.2f}s ({rate:,.0f} papers/s)"
+        )
+
+    def _write_batch(self, batch: List[Tuple[Dict, Any]]) -> int:
+        """Insert papers and tool links; returns the number of tool links written."""
+        conn = self.conn
+        papers = [paper for paper, _ in batch]
+        rows = [self.scraper._paper_row(paper) for paper in papers]
+        # One transaction: committed on success, rolled back on any error
+        with conn:
+            conn.executemany(PAPER_INSERT_SQL, rows)
+
+            # Resolve the new paper ids by PMID so tool links can reference them
+            pmids = [paper['pmid'] for paper in papers if paper.get('pmid')]
+            paper_ids: Dict[str, int] = {}
+            for i in range(0, len(pmids), 500):
+                chunk = pmids[i:i + 500]
+                placeholders = ','.join('?' * len(chunk))
+                paper_ids.update(conn.execute(
+                    f"SELECT pmid, id FROM papers WHERE pmid IN ({placeholders})", chunk
+                ).fetchall())
+
+            refs = []
+            for paper in papers:
+                paper_id = paper_ids.get(paper.get('pmid'))
+                github_tools = paper.get('github_tools', [])
+                if isinstance(github_tools, str):
+                    try:
+                        github_tools = json.loads(github_tools)
+                    except:
+                        github_tools = []
+                if paper_id:
+                    refs.extend((paper_id, ref) for ref in github_tools)
+
+            if refs:
+                self._write_tool_links(refs)
+
+        for paper, tag in batch:
+            if paper.get('doi'):
+                self.scraper.known_dois.add(paper['doi'].lower())
+            if paper.get('pmid'):
+                self.scraper.known_pmids.add(paper['pmid'])
+            self.saved[tag] = self.saved.get(tag, 0) + 1
+        self.scraper.count_stat('saved', len(batch))
+        return len(refs)
+
+    def _write_tool_links(self, refs: List[Tuple[int, Dict]]):
+        """Batched equivalent of ``track_github_tool()`` for many references."""
+        conn = self.conn
+        full_names = sorted({ref['full_name'].lower() for _, ref in refs})
+
+        def lookup_ids() -> Dict[str, int]:
+            ids = {}
+            for i in range(0, len(full_names), 500):
+                chunk = full_names[i:i + 500]
+                placeholders = ','.join('?' * len(chunk))
+                for tool_id, full_name in conn.execute(
+                    f"SELECT id, full_name FROM github_tools WHERE full_name IN ({placeholders})", chunk
+                ):
+                    ids.setdefault(full_name, tool_id)
+            return ids
+
+        tool_ids = lookup_ids()
+        new_tools = {}
+        for _, ref in refs:
+            full_name = ref['full_name'].lower()
+            if full_name not in tool_ids and full_name not in new_tools:
+                new_tools[full_name] = (ref['url'], ref['owner'], ref['repo_name'], full_name)
+        if new_tools:
+            conn.executemany("""
+                INSERT OR IGNORE INTO github_tools (repo_url, owner, repo_name, full_name, paper_count)
+                VALUES (?, ?, ?, ?, 0)
+            """, list(new_tools.values()))
+            tool_ids = lookup_ids()
+
+        counts: Dict[int, int] = {}
+        link_rows = []
+        introduces = []
+        for paper_id, ref in refs:
+            tool_id = tool_ids.get(ref['full_name'].lower())
+            if tool_id is None:
+                continue
+            counts[tool_id] = counts.get(tool_id, 0) + 1
+            relationship = ref.get('relationship', 'uses')
+            link_rows.append((paper_id, tool_id, relationship, ref.get('context', '')))
+            if relationship == 'introduces':
+                introduces.append((paper_id, tool_id))
+
+        conn.executemany("""
+            UPDATE github_tools
+            SET paper_count = paper_count + ?,
+                updated_at = CURRENT_TIMESTAMP
+            WHERE id = ?
+        """, [(n, tool_id) for tool_id, n in counts.items()])
+        conn.executemany("""
+            INSERT OR IGNORE INTO paper_github_tools (paper_id, github_tool_id, relationship, context)
+            VALUES (?, ?, ?, ?)
+        """, link_rows)
+        if introduces:
+            conn.executemany("""
+                UPDATE github_tools SET original_paper_id = ? WHERE id = ? AND original_paper_id IS NULL
+            """, introduces)
+
+    def _write_individually(self, batch: List[Tuple[Dict, Any]]) -> int:
+        """Per-paper fallback so one bad row cannot drop a whole batch."""
+        links = 0
+        for paper, tag in batch:
+            paper_id = self.scraper.save_paper(paper)
+            if paper_id:
+                self.saved[tag] = self.saved.get(tag, 0) + 1
+                links += self.scraper._track_paper_github_tools(paper_id, paper)
+            else:
+                self.failed.add(tag)
+        return links
+
+    def close(self):
+        """Flush remaining papers and release the connection."""
+        try:
+            self.flush()
+        finally:
+            self.conn.close()
+
+
 def main():
     parser = argparse.ArgumentParser(description='MicroHub Scraper v5.0 - With Affiliations')
     parser.add_argument('--db', default='microhub.db', help='Database path')
@@ -3709,6 +4275,18 @@ def main():
     parser.add_argument('--no-citations', action='store_true', help='Skip citation fetching (faster)')
     parser.add_argument('--update-citations', action='store_true', help='Update citations for existing papers')
     parser.add_argument('--update-limit', type=int, help='Limit papers for citation update')
+    parser.add_argument('--pipelined', action='store_true',
+                        help='Run search, fetch and save as concurrent stages sharing one NCBI rate budget')
+    parser.add_argument('--fetch-workers', type=int, default=PIPELINE_FETCH_WORKERS,
+                        help=f'Concurrent fetch workers in --pipelined mode (default: {PIPELINE_FETCH_WORKERS})')
+    parser.add_argument('--incremental', action='store_true',
+                        help='Only search records added to PubMed since each query\'s last completed run')
+    parser.add_argument('--overlap-days', type=int, default=INCREMENTAL_OVERLAP_DAYS,
+                        help=f'Days of overlap with the previous window in --incremental mode (default: {INCREMENTAL_OVERLAP_DAYS})')
+    parser.add_argument('--db-batch-size', type=int, default=DB_BATCH_SIZE,
+                        help=f'Papers per DB write transaction (default: {DB_BATCH_SIZE})')
+    parser.add_argument('--db-batch-seconds', type=float, default=DB_BATCH_SECONDS,
+                        help=f'Max seconds a paper waits before its batch is flushed (default: {DB_BATCH_SECONDS})')
 
     # NCBI API key (increases PubMed rate limit from 3 to 10 req/sec)
     parser.add_argument('--ncbi-api-key', type=str, default=None,
@@ -3775,12 +4353,28 @@ def main():
                 logger.info(f"  {t['full_name']} - {t['paper_count']} papers, ★{stars}, {health}{archived}")
     elif args.update_citations:
         scraper.update_citations_for_existing(limit=args.update_limit)
+    elif args.pipelined:
+        scraper.run_pipelined(
+            limit=args.limit,
+            priority_only=args.priority_only,
+            full_text_only=args.full_text_only,
+            fetch_citations=not args.no_citations,
+            fetch_workers=max(1, args.fetch_workers),
+            db_batch_size=args.db_batch_size,
+            db_batch_seconds=args.db_batch_seconds,
+            incremental=args.incremental,
+            overlap_days=args.overlap_days
+        )
     else:
         scraper.run(
             limit=args.limit,
             priority_only=args.priority_only,
             full_text_only=args.full_text_only,
-            fetch_citations=not args.no_citations
+            fetch_citations=not args.no_citations,
+            db_batch_size=args.db_batch_size,
+            db_batch_seconds=args.db_batch_seconds,
+            incremental=args.incremental,
+            overlap_days=args.overlap_days
         )
 
 
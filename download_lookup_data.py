@@ -10,11 +10,20 @@ Run this ONCE (or periodically to refresh). Downloads:
 
 Files are stored in: microhub_lookup_tables/
 
+Each table is written as a compact, indexed lookup store
+(``<table>_lookup.sqlite``, see pipeline/validation/lookup_store.py) that
+the pipeline opens in milliseconds instead of parsing a large JSON file.
+The store carries a format version; re-run this script after upgrading if
+the pipeline reports a version mismatch.
+
 Usage:
     python download_lookup_data.py                  # download all
     python download_lookup_data.py --only ror       # download just ROR
     python download_lookup_data.py --only taxonomy   # download just NCBI taxonomy
     python download_lookup_data.py --dir /path/to/dir  # custom directory
+    python download_lookup_data.py --json           # also write legacy JSON tables
+    python download_lookup_data.py --compact fpbase/fpbase_name_lookup.json
+                                                    # convert existing JSON tables
 """
 
 import argparse
@@ -38,15 +47,31 @@ except ImportError:
     logger.error("'requests' package required: pip install requests")
     sys.exit(1)
 
+from pipeline.validation.cell_line_gazetteer import normalized_index
+from pipeline.validation.lookup_store import (
+    FORMAT_VERSION, compact_json_lookup, store_path_for, write_lookup_store,
+)
+
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 DEFAULT_DIR = os.path.join(SCRIPT_DIR, "microhub_lookup_tables")
 
 
+def _write_lookup(output_dir: str, filename: str, index: dict, name: str,
+                  write_json: bool = False, alt_index: dict = None) -> str:
+    """Write *index* as a lookup store (and, optionally, legacy JSON)."""
+    json_path = os.path.join(output_dir, filename)
+    if write_json:
+        with open(json_path, "w", encoding="utf-8") as f:
+            json.dump(index, f, ensure_ascii=False)
+    return write_lookup_store(store_path_for(json_path), index,
+                              alt_index=alt_index, name=name)
+
+
 # ======================================================================
 # 1. ROR Data Dump
 # ======================================================================
 
-def download_ror(output_dir: str) -> str:
+def download_ror(output_dir: str, write_json: bool = False) -> str:
     """Download the latest ROR data dump from Zenodo.
 
     ROR publishes versioned data dumps as JSON-zipped archives.
@@ -181,9 +206,8 @@ def download_ror(output_dir: str) -> str:
                 if acr and len(acr) > 1:
                     index[acr] = entry
 
-    out_path = os.path.join(output_dir, "ror_lookup.json")
-    with open(out_path, "w", encoding="utf-8") as f:
-        json.dump(index, f, ensure_ascii=False)
+    out_path = _write_lookup(output_dir, "ror_lookup.json", index, "ror",
+                             write_json=write_json)
 
     # Clean up zip
     os.remove(zip_path)
@@ -197,7 +221,7 @@ def download_ror(output_dir: str) -> str:
 # 2. Cellosaurus
 # ======================================================================
 
-def download_cellosaurus(output_dir: str) -> str:
+def download_cellosaurus(output_dir: str, write_json: bool = False) -> str:
     """Download Cellosaurus cell line database and build lookup.
 
     Source: ExPASy FTP (cellosaurus.txt)
@@ -267,9 +291,11 @@ def download_cellosaurus(output_dir: str) -> str:
             elif line.startswith("CA   "):
                 current["category"] = line[5:].strip()
 
-    out_path = os.path.join(output_dir, "cellosaurus_lookup.json")
-    with open(out_path, "w", encoding="utf-8") as f:
-        json.dump(index, f, ensure_ascii=False)
+    # Normalized names ("hek-293" → "hek293") go in the store's alternate
+    # key space for the cell line gazetteer.
+    out_path = _write_lookup(output_dir, "cellosaurus_lookup.json", index,
+                             "cellosaurus", write_json=write_json,
+                             alt_index=normalized_index(index))
 
     # Clean up raw file (180 MB)
     os.remove(raw_path)
@@ -282,7 +308,7 @@ def download_cellosaurus(output_dir: str) -> str:
 # 3. NCBI Taxonomy
 # ======================================================================
 
-def download_taxonomy(output_dir: str) -> str:
+def download_taxonomy(output_dir: str, write_json: bool = False) -> str:
     """Download NCBI taxonomy names.dmp and build lookup.
 
     Source: NCBI FTP (taxdump.tar.gz)
@@ -332,8 +358,12 @@ def download_taxonomy(output_dir: str) -> str:
                     rank = parts[2].strip().rstrip("\t|")
                     ranks[tax_id] = rank
 
-    # Parse names.dmp
+    # Parse names.dmp in a single pass.  Only species and below (plus key
+    # genera) are indexed, so scientific names are needed for those tax IDs
+    # only; they are filled in once the whole file has been read.
     logger.info("Parsing taxonomy names...")
+    indexed_ranks = ("species", "subspecies", "varietas", "forma",
+                     "genus", "strain")
     index = {}
     scientific_names = {}  # tax_id → scientific_name
 
@@ -343,34 +373,20 @@ def download_taxonomy(output_dir: str) -> str:
             if len(parts) < 4:
                 continue
             tax_id = int(parts[0].strip())
+            rank = ranks.get(tax_id, "")
+            if rank not in indexed_ranks:
+                continue
             name = parts[1].strip()
             name_class = parts[3].strip().rstrip("\t|")
 
             if name_class == "scientific name":
                 scientific_names[tax_id] = name
 
-    # Build index from scientific names + synonyms
-    # Re-read for all names
-    with open(names_path, "r") as f:
-        for line in f:
-            parts = line.strip().rstrip("\t|").split("\t|\t")
-            if len(parts) < 4:
-                continue
-            tax_id = int(parts[0].strip())
-            name = parts[1].strip()
-            name_class = parts[3].strip().rstrip("\t|")
-
-            # Only index species and below, plus key genera
-            rank = ranks.get(tax_id, "")
-            if rank not in ("species", "subspecies", "varietas", "forma",
-                            "genus", "strain"):
-                continue
-
             key = name.lower()
             if key and len(key) > 2:
                 entry = {
                     "tax_id": tax_id,
-                    "scientific_name": scientific_names.get(tax_id, name),
+                    "scientific_name": name,
                     "name_class": name_class,
                     "rank": rank,
                 }
@@ -378,9 +394,12 @@ def download_taxonomy(output_dir: str) -> str:
                 if key not in index or name_class == "scientific name":
                     index[key] = entry
 
-    out_path = os.path.join(output_dir, "taxonomy_lookup.json")
-    with open(out_path, "w", encoding="utf-8") as f:
-        json.dump(index, f, ensure_ascii=False)
+    for entry in index.values():
+        entry["scientific_name"] = scientific_names.get(
+            entry["tax_id"], entry["scientific_name"])
+
+    out_path = _write_lookup(output_dir, "taxonomy_lookup.json", index,
+                             "taxonomy", write_json=write_json)
 
     # Clean up
     os.remove(tar_path)
@@ -396,7 +415,7 @@ def download_taxonomy(output_dir: str) -> str:
 # 4. FPbase Fluorescent Proteins
 # ======================================================================
 
-def download_fpbase(output_dir: str) -> str:
+def download_fpbase(output_dir: str, write_json: bool = False) -> str:
     """Download all fluorescent proteins from FPbase API.
 
     Output: { "protein name (lowercase)": {"name": "...", "ex_max": 488, "em_max": 509, ...} }
@@ -451,9 +470,8 @@ def download_fpbase(output_dir: str) -> str:
         params = {}  # next URL already includes params
         time.sleep(0.3)  # Be polite
 
-    out_path = os.path.join(output_dir, "fpbase_lookup.json")
-    with open(out_path, "w", encoding="utf-8") as f:
-        json.dump(index, f, ensure_ascii=False)
+    out_path = _write_lookup(output_dir, "fpbase_lookup.json", index, "fpbase",
+                             write_json=write_json)
 
     logger.info("FPbase index: %d name variants from %d proteins",
                 len(index), len(set(v["name"] for v in index.values())))
@@ -476,8 +494,22 @@ def main():
         "--only", choices=["ror", "cellosaurus", "taxonomy", "fpbase"],
         help="Download only one dataset",
     )
+    parser.add_argument(
+        "--json", action="store_true",
+        help="Also write the legacy *_lookup.json tables next to the stores",
+    )
+    parser.add_argument(
+        "--compact", nargs="+", metavar="JSON",
+        help="Convert existing name → record JSON tables (e.g. "
+             "fpbase/fpbase_name_lookup.json) into lookup stores and exit",
+    )
     args = parser.parse_args()
 
+    if args.compact:
+        for json_path in args.compact:
+            compact_json_lookup(json_path)
+        return
+
     os.makedirs(args.dir, exist_ok=True)
     logger.info("Output directory: %s", args.dir)
 
@@ -489,11 +521,11 @@ def main():
     }
 
     if args.only:
-        downloaders[args.only](args.dir)
+        downloaders[args.only](args.dir, write_json=args.json)
     else:
         for name, func in downloaders.items():
             try:
-                func(args.dir)
+                func(args.dir, write_json=args.json)
             except Exception as e:
                 logger.error("Failed to download %s: %s", name, e)
             print()
@@ -501,6 +533,7 @@ def main():
     # Write metadata
     meta = {
         "downloaded_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "format_version": FORMAT_VERSION,
         "files": os.listdir(args.dir),
     }
     with open(os.path.join(args.dir, "metadata.json"), "w") as f:
@@ -8,7 +8,35 @@ resolve conflicts when multiple agents tag the same span.
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional
+from typing import Dict, FrozenSet, Iterable, List, Optional
+
+# Characters outside ASCII that re.IGNORECASE treats as equal to an ASCII
+# letter: after str.lower(), "İ" becomes "i" + U+0307 and "K" becomes "k";
+# "ı" and "ſ" need mapping explicitly.
+_CASEFOLD_FIXES = {0x131: "i", 0x17F: "s", 0x307: None}
+
+
+def _lower_for_scan(text: str) -> str:
+    """Lowercase *text* so ASCII anchors match it as re.IGNORECASE would."""
+    lowered = text.lower()
+    if not lowered.isascii():
+        lowered = lowered.translate(_CASEFOLD_FIXES)
+    return lowered
+
+
+def scan_anchors(text: str, anchors: Iterable[str]) -> FrozenSet[str]:
+    """Return the lowercase *anchors* present in *text*, matched as
+    re.IGNORECASE would.
+
+    One lowercasing pass, then a C-level substring probe per anchor — far
+    cheaper than running each pattern's regex over the text.  Agents use
+    the result to skip patterns whose required literals are absent.
+    """
+    lowered = _lower_for_scan(text)
+    return frozenset(a for a in anchors if a in lowered)
+
+
+_UNSET = object()
 
 
 @dataclass
@@ -37,6 +65,26 @@ class BaseAgent(ABC):
 
     name: str = "base"
 
+    def prefilter(self) -> Optional[Iterable[str]]:
+        """Lowercase literals at least one of which occurs in any text this
+        agent can extract from — a cheap necessary condition checked by
+        can_match().  None (the default) means the agent always runs.
+        """
+        return None
+
+    def can_match(self, text: str) -> bool:
+        """False when *text* cannot yield any extraction from this agent."""
+        anchors = self.__dict__.get("_prefilter_anchors", _UNSET)
+        if anchors is _UNSET:
+            anchors = self.prefilter()
+            if anchors is not None:
+                anchors = tuple(anchors)
+            self._prefilter_anchors = anchors
+        if anchors is None:
+            return True
+        lowered = _lower_for_scan(text)
+        return any(a in lowered for a in anchors)
+
     @abstractmethod
     def analyze(self, text: str, section: str = None) -> List[Extraction]:
         """Extract entities from *text*.
@@ -5,12 +5,17 @@ Detects common cell lines used in microscopy research, including
 immortalised lines, primary cultures, and stem cells.
 
 All canonical names use the FULL expanded form, never acronyms.
+
+Patterns are gated by literal anchors (CELL_LINE_ANCHORS): one lowercase
+scan of the text finds which anchors occur, and only the patterns whose
+anchors are present run their regex.  Resolving a canonical name to its
+Cellosaurus record is pipeline.validation.cell_line_gazetteer's job.
 """
 
 import re
-from typing import Dict, List
+from typing import Dict, FrozenSet, List, Tuple
 
-from .base_agent import BaseAgent, Extraction
+from .base_agent import BaseAgent, Extraction, scan_anchors
 
 # ======================================================================
 # Cell line patterns → canonical full names (no acronyms)
@@ -105,14 +110,120 @@ CELL_LINE_PATTERNS: Dict[str, tuple] = {
 }
 
 
+# ======================================================================
+# Pattern anchors
+# ======================================================================
+
+# Lowercase literals at least one of which occurs in every match of the
+# same-named pattern (after lowercasing).  A pattern whose anchors are all
+# absent from the text cannot match, so analyze() skips its regex.  Keep
+# the keys identical to CELL_LINE_PATTERNS.
+CELL_LINE_ANCHORS: Dict[str, Tuple[str, ...]] = {
+    "HeLa (Henrietta Lacks)": ("hela",),
+    "Human Embryonic Kidney 293": ("293",),
+    "Human Embryonic Kidney 293T": ("293",),
+    "Human Osteosarcoma U2OS": ("os",),
+    "African Green Monkey Kidney COS-7": ("cos",),
+    "Human Lung Adenocarcinoma A549": ("a549",),
+    "Human Breast Adenocarcinoma MCF-7": ("mcf",),
+    "NIH 3T3 Mouse Fibroblast": ("3t3",),
+    "Chinese Hamster Ovary": ("cho",),
+    "Madin-Darby Canine Kidney": ("mdck",),
+    "Vero (African Green Monkey Kidney)": ("vero",),
+    "Human Neuroblastoma SH-SY5Y": ("sy5y",),
+    "Rat Pheochromocytoma PC-12": ("pc",),
+    "Mouse Embryonic Fibroblast": ("mef", "fibroblast"),
+    "Induced Pluripotent Stem Cell": ("ipsc", "pluripotent"),
+    "Embryonic Stem Cell": ("esc", "embryonic"),
+    "Primary Neurons": ("neuron",),
+    "Primary Cardiomyocytes": ("cardiomyocyte",),
+    "Primary Hepatocytes": ("hepatocyte",),
+
+    "Human T-cell Leukemia Jurkat": ("jurkat",),
+    "Human Chronic Myelogenous Leukemia K562": ("562",),
+    "Human Hepatocellular Carcinoma HepG2": ("hep",),
+    "Human Colorectal Adenocarcinoma Caco-2": ("caco",),
+    "Human Umbilical Vein Endothelial Cell": ("huvec",),
+    "Human Colorectal Adenocarcinoma HT-29": ("ht",),
+    "Human Colorectal Carcinoma HCT116": ("hct",),
+    "Human Breast Adenocarcinoma MDA-MB-231": ("mda",),
+    "Human Acute Monocytic Leukemia THP-1": ("thp",),
+    "Human Promyelocytic Leukemia HL-60": ("hl",),
+    "Mouse Neuroblastoma Neuro-2a": ("neuro", "n2a"),
+    "Mouse Myoblast C2C12": ("c2c12",),
+    "Mouse Fibroblast L929": ("929",),
+    "Baby Hamster Kidney BHK-21": ("bhk",),
+    "Human Colorectal Adenocarcinoma DLD-1": ("dld",),
+    "Human Colorectal Adenocarcinoma SW480": ("480",),
+    "Human Breast Carcinoma SK-BR-3": ("sk",),
+    "Human Pancreatic Carcinoma PANC-1": ("panc",),
+    "Human Mammary Epithelial MCF-10A": ("mcf",),
+    "Human Fetal Lung Fibroblast IMR-90": ("imr",),
+    "Human Fetal Lung Fibroblast WI-38": ("38",),
+    "Human Foreskin Fibroblast BJ": ("bj",),
+    "Mouse Mammary Carcinoma 4T1": ("4t1",),
+    "Mouse Lewis Lung Carcinoma LLC": ("llc",),
+    "Mouse Melanoma B16": ("b16",),
+    "Mouse Colon Carcinoma CT26": ("ct",),
+    "Mouse Macrophage RAW 264.7": ("raw",),
+    "Human Cervical Carcinoma SiHa": ("siha",),
+    "Human Retinal Pigment Epithelium ARPE-19": ("arpe",),
+    "Human Embryonic Kidney Lenti-X 293T": ("lenti",),
+    "Rat Glioma C6": ("c6",),
+    "Dog Kidney MDCK-II": ("mdck",),
+    "Human Prostate Cancer PC-3": ("pc",),
+    "Human Prostate Cancer LNCaP": ("lncap",),
+    "Human Glioblastoma U-87 MG": ("87",),
+    "Human Glioblastoma U-251 MG": ("251",),
+    "Human Non-Small Cell Lung Cancer NCI-H460": ("h460",),
+    "Human T Lymphoblast CCRF-CEM": ("ccrf",),
+
+    "Primary T Cells": ("cell",),
+    "Primary B Cells": ("cell",),
+    "Primary Natural Killer Cells": ("cell",),
+    "Primary Macrophages": ("macrophage",),
+    "Primary Dendritic Cells": ("dendritic",),
+    "Primary Neutrophils": ("neutrophil",),
+    "Primary Fibroblasts": ("fibroblast",),
+    "Primary Keratinocytes": ("keratinocyte",),
+    "Primary Endothelial Cells": ("endothelial",),
+    "Primary Astrocytes": ("astrocyte",),
+    "Primary Microglia": ("microglia",),
+    "Primary Oligodendrocytes": ("oligodendrocyte",),
+    "Primary Epithelial Cells": ("epithelial",),
+    "Primary Mesenchymal Stem Cells": ("msc", "mesenchymal"),
+    "Neural Stem Cells": ("nsc", "neural"),
+    "Hematopoietic Stem Cells": ("hsc", "hematopoietic"),
+    "Primary Monocytes": ("monocyte",),
+    "Primary Osteoblasts": ("osteoblast",),
+    "Primary Osteoclasts": ("osteoclast",),
+    "Primary Chondrocytes": ("chondrocyte",),
+    "Primary Podocytes": ("podocyte",),
+    "Primary Schwann Cells": ("schwann",),
+    "Primary Muscle Satellite Cells": ("satellite",),
+}
+
+_ALL_ANCHORS: FrozenSet[str] = frozenset(
+    a for group in CELL_LINE_ANCHORS.values() for a in group
+)
+
+
 class CellLineAgent(BaseAgent):
     """Extract cell line mentions from text."""
 
     name = "cell_line"
 
+    def prefilter(self):
+        return _ALL_ANCHORS
+
     def analyze(self, text: str, section: str = None) -> List[Extraction]:
         results: List[Extraction] = []
+        found = scan_anchors(text, _ALL_ANCHORS)
+        if not found:
+            return results
         for canonical, (pattern, base_conf) in CELL_LINE_PATTERNS.items():
+            if found.isdisjoint(CELL_LINE_ANCHORS[canonical]):
+                continue
             for m in pattern.finditer(text):
                 conf = base_conf
                 if section in ("methods", "materials"):
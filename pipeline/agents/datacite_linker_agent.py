@@ -10,9 +10,15 @@ Discovers paper-dataset links through two complementary approaches:
 Also applies regex patterns to data availability statements for
 biomedical-specific accession formats (EMPIAR, EMDB, PDB, GEO, SRA, etc.).
 
+DataCite records and ScholeXplorer links are cached per DOI for the
+agent's lifetime.  prefetch() fills those caches for a whole chunk with
+multi-DOI DataCite searches and concurrent ScholeXplorer lookups, so the
+per-paper calls that follow are served without further requests.
+
 Usage:
     from pipeline.agents.datacite_linker_agent import DataCiteLinkerAgent
     agent = DataCiteLinkerAgent()
+    agent.prefetch(["10.1038/...", "10.1016/..."])      # optional, per chunk
     links = agent.find_dataset_links(doi="10.1038/...", text="...")
 """
 
@@ -20,7 +26,8 @@ import logging
 import re
 import threading
 import time
-from typing import Any, Dict, List, Optional, Set
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 from urllib.parse import quote
 
 logger = logging.getLogger(__name__)
@@ -34,6 +41,14 @@ except ImportError:
 _DATACITE_BASE = "https://api.datacite.org"
 _SCHOLEXPLORER_BASE = "https://api.scholexplorer.openaire.eu/v2/Links"
 
+# DOIs per DataCite search request in prefetch()
+_DATACITE_BATCH_SIZE = 50
+# Concurrent requests in prefetch(); request starts are still spaced by
+# _rate_limit(), so this only overlaps response latency.
+_PREFETCH_WORKERS = 4
+# Only the attributes _links_from_datacite() reads
+_DATACITE_FIELDS = "doi,types,titles,relatedIdentifiers"
+
 # DataCite DOI prefixes for major data repositories
 _DATACITE_PREFIXES = {
     "10.5281": "Zenodo",
@@ -104,10 +119,53 @@ class DataCiteLinkerAgent:
 
     name = "datacite_linker"
 
-    def __init__(self):
+    def __init__(self, prefetch_workers: int = _PREFETCH_WORKERS):
         self._last_call = 0.0
         self._delay = 0.3
         self._lock = threading.Lock()
+        self._prefetch_workers = max(1, prefetch_workers)
+
+        # Shared per-DOI caches (keyed by lowercased clean DOI).  A DataCite
+        # entry of None means DataCite has no record for the DOI.  Failed
+        # requests are never cached.
+        self._cache_lock = threading.Lock()
+        self._datacite_records: Dict[str, Optional[Dict]] = {}
+        self._scholex_links: Dict[str, List[Dict[str, Any]]] = {}
+
+    def prefetch(self, dois: Iterable[str]) -> None:
+        """Resolve DataCite and ScholeXplorer data for many DOIs at once.
+
+        DataCite records are fetched with multi-DOI search queries of up to
+        _DATACITE_BATCH_SIZE DOIs; ScholeXplorer has no batch endpoint, so
+        its lookups run on a small thread pool.  DOIs already cached are
+        skipped.  Results for DOIs whose request fails are left uncached and
+        fetched individually by find_dataset_links(), as before.
+        """
+        if not HAS_REQUESTS:
+            return
+
+        unique: Dict[str, str] = {}
+        for doi in dois:
+            doi = self._clean_doi(doi)
+            if doi:
+                unique.setdefault(doi.lower(), doi)
+        with self._cache_lock:
+            dc_todo = [d for k, d in unique.items() if k not in self._datacite_records]
+            sx_todo = [d for k, d in unique.items() if k not in self._scholex_links]
+        if not dc_todo and not sx_todo:
+            return
+
+        batches = [dc_todo[i:i + _DATACITE_BATCH_SIZE]
+                   for i in range(0, len(dc_todo), _DATACITE_BATCH_SIZE)]
+        t0 = time.time()
+        with ThreadPoolExecutor(max_workers=self._prefetch_workers) as pool:
+            futures = [pool.submit(self._fetch_datacite_batch, b) for b in batches]
+            futures += [pool.submit(self._query_scholexplorer, d) for d in sx_todo]
+            for fut in futures:
+                fut.result()
+        logger.info("  Dataset links prefetched: %d DataCite DOIs in %d request(s), "
+                    "%d ScholeXplorer lookups in %.1fs",
+                    len(dc_todo), len(batches), len(sx_todo), time.time() - t0)
 
     def find_dataset_links(self, *, doi: str = None,
                            text: str = None) -> List[Dict[str, Any]]:
@@ -170,69 +228,129 @@ class DataCiteLinkerAgent:
         if not doi:
             return []
 
+        ok, attrs = self._datacite_record(doi)
+        if not ok or attrs is None:
+            return []
+
+        try:
+            return self._links_from_datacite(doi, attrs)
+        except Exception as exc:
+            logger.debug("DataCite error for %s: %s", doi, exc)
+            return []
+
+    def _datacite_record(self, doi: str, timeout: int = 15) -> Tuple[bool, Optional[Dict]]:
+        """Return ``(ok, attributes)`` for a clean DOI, from cache when possible.
+
+        ``ok`` is False when the request failed; ``attributes`` is None when
+        DataCite has no record for the DOI.
+        """
+        key = doi.lower()
+        with self._cache_lock:
+            if key in self._datacite_records:
+                return True, self._datacite_records[key]
+
         self._rate_limit()
         try:
             resp = requests.get(
                 f"{_DATACITE_BASE}/dois/{quote(doi, safe='')}",
-                timeout=15,
+                timeout=timeout,
             )
+            if resp.status_code == 404:
+                attrs = None
+            elif resp.status_code != 200:
+                return False, None
+            else:
+                attrs = resp.json().get("data", {}).get("attributes", {})
+        except Exception as exc:
+            logger.debug("DataCite error for %s: %s", doi, exc)
+            return False, None
 
+        with self._cache_lock:
+            self._datacite_records[key] = attrs
+        return True, attrs
+
+    def _fetch_datacite_batch(self, dois: List[str]) -> None:
+        """Cache DataCite records for up to _DATACITE_BATCH_SIZE clean DOIs."""
+        query = " OR ".join(
+            'doi:"%s"' % d.replace("\\", "\\\\").replace('"', '\\"') for d in dois
+        )
+        self._rate_limit()
+        try:
+            resp = requests.get(
+                f"{_DATACITE_BASE}/dois",
+                params={
+                    "query": query,
+                    "page[size]": len(dois),
+                    "fields[dois]": _DATACITE_FIELDS,
+                    "disable-facets": "true",
+                },
+                timeout=30,
+            )
             if resp.status_code != 200:
-                return []
+                logger.debug("DataCite batch query returned HTTP %d", resp.status_code)
+                return
+            found: Dict[str, Dict] = {}
+            for record in resp.json().get("data", []):
+                attrs = record.get("attributes", {}) or {}
+                record_doi = (attrs.get("doi") or record.get("id") or "").lower()
+                if record_doi:
+                    found[record_doi] = attrs
+        except Exception as exc:
+            logger.debug("DataCite batch error (%d DOIs): %s", len(dois), exc)
+            return
 
-            data = resp.json().get("data", {})
-            attrs = data.get("attributes", {})
+        with self._cache_lock:
+            for doi in dois:
+                self._datacite_records[doi.lower()] = found.get(doi.lower())
 
-            links: List[Dict[str, Any]] = []
+    def _links_from_datacite(self, doi: str, attrs: Dict) -> List[Dict[str, Any]]:
+        """Build dataset links from a DataCite record's attributes."""
+        links: List[Dict[str, Any]] = []
 
-            # Check if this DOI itself is a dataset
-            resource_type = (attrs.get("types", {}).get(
-                "resourceTypeGeneral", ""
-            )).lower()
+        # Check if this DOI itself is a dataset
+        resource_type = (attrs.get("types", {}).get(
+            "resourceTypeGeneral", ""
+        )).lower()
+
+        if resource_type == "dataset":
+            links.append({
+                "accession": doi,
+                "repository": self._repo_from_doi_prefix(doi),
+                "url": f"https://doi.org/{doi}",
+                "source": "datacite",
+                "relation_type": "self_dataset",
+                "title": attrs.get("titles", [{}])[0].get("title", "")
+                if attrs.get("titles") else "",
+            })
+
+        # Traverse relatedIdentifiers
+        for rel in attrs.get("relatedIdentifiers", []):
+            rel_type = rel.get("relationType", "")
+            rel_id = rel.get("relatedIdentifier", "")
+            rel_id_type = rel.get("relatedIdentifierType", "")
+
+            if not rel_id or not rel_type:
+                continue
+
+            if rel_type in _DATASET_RELATIONS:
+                url = rel_id
+                if rel_id_type.upper() == "DOI" and not rel_id.startswith("http"):
+                    url = f"https://doi.org/{rel_id}"
+                elif rel_id_type.upper() == "URL":
+                    pass  # already a URL
+                elif rel_id_type.upper() == "PMID":
+                    url = f"https://pubmed.ncbi.nlm.nih.gov/{rel_id}"
 
-            if resource_type == "dataset":
                 links.append({
-                    "accession": doi,
-                    "repository": self._repo_from_doi_prefix(doi),
-                    "url": f"https://doi.org/{doi}",
+                    "accession": rel_id,
+                    "repository": self._repo_from_doi_prefix(rel_id)
+                    if rel_id_type.upper() == "DOI" else "Unknown",
+                    "url": url,
                     "source": "datacite",
-                    "relation_type": "self_dataset",
-                    "title": attrs.get("titles", [{}])[0].get("title", "")
-                    if attrs.get("titles") else "",
+                    "relation_type": rel_type,
                 })
 
-            # Traverse relatedIdentifiers
-            for rel in attrs.get("relatedIdentifiers", []):
-                rel_type = rel.get("relationType", "")
-                rel_id = rel.get("relatedIdentifier", "")
-                rel_id_type = rel.get("relatedIdentifierType", "")
-
-                if not rel_id or not rel_type:
-                    continue
-
-                if rel_type in _DATASET_RELATIONS:
-                    url = rel_id
-                    if rel_id_type.upper() == "DOI" and not rel_id.startswith("http"):
-                        url = f"https://doi.org/{rel_id}"
-                    elif rel_id_type.upper() == "URL":
-                        pass  # already a URL
-                    elif rel_id_type.upper() == "PMID":
-                        url = f"https://pubmed.ncbi.nlm.nih.gov/{rel_id}"
-
-                    links.append({
-                        "accession": rel_id,
-                        "repository": self._repo_from_doi_prefix(rel_id)
-                        if rel_id_type.upper() == "DOI" else "Unknown",
-                        "url": url,
-                        "source": "datacite",
-                        "relation_type": rel_type,
-                    })
-
-            return links
-
-        except Exception as exc:
-            logger.debug("DataCite error for %s: %s", doi, exc)
-            return []
+        return links
 
     # ------------------------------------------------------------------
     # OpenAIRE ScholeXplorer
@@ -247,6 +365,12 @@ class DataCiteLinkerAgent:
         if not doi:
             return []
 
+        key = doi.lower()
+        with self._cache_lock:
+            cached = self._scholex_links.get(key)
+        if cached is not None:
+            return list(cached)
+
         self._rate_limit()
         try:
             resp = requests.get(
@@ -299,7 +423,9 @@ class DataCiteLinkerAgent:
                         "title": target_title,
                     })
 
-            return links
+            with self._cache_lock:
+                self._scholex_links[key] = links
+            return list(links)
 
         except Exception as exc:
             logger.debug("ScholeXplorer error for %s: %s", doi, exc)
@@ -351,25 +477,12 @@ class DataCiteLinkerAgent:
             if doi.startswith(prefix):
                 return True
 
-        # Query DataCite to check resourceTypeGeneral
+        # Query DataCite (or the shared record cache) for resourceTypeGeneral
         if HAS_REQUESTS:
-            self._rate_limit()
-            try:
-                resp = requests.get(
-                    f"{_DATACITE_BASE}/dois/{quote(doi, safe='')}",
-                    timeout=10,
-                )
-                if resp.status_code == 200:
-                    resource_type = (
-                        resp.json()
-                        .get("data", {})
-                        .get("attributes", {})
-                        .get("types", {})
-                        .get("resourceTypeGeneral", "")
-                    )
-                    return resource_type.lower() == "dataset"
-            except Exception:
-                pass
+            ok, attrs = self._datacite_record(doi, timeout=10)
+            if ok and attrs is not None:
+                resource_type = attrs.get("types", {}).get("resourceTypeGeneral", "")
+                return resource_type.lower() == "dataset"
 
         return False
 
@@ -14,6 +14,7 @@ import re
 import time
 from typing import Any, Dict, List, Optional
 
+from .. import load_costs
 from .base_agent import BaseAgent, Extraction
 
 logger = logging.getLogger(__name__)
@@ -218,8 +219,8 @@ class InstitutionAgent(BaseAgent):
         super().__init__()
         self._ror_local_index: Dict[str, str] = {}
         self._ror_loaded = False
-        if ror_local_path:
-            self._load_ror(ror_local_path)
+        self._ror_loader = load_costs.LazyLoad(
+            "ROR dump (institution agent)", self._load_ror, ror_local_path or None)
 
     def _load_ror(self, path: str) -> None:
         """Load local ROR dump and index organization names to ROR IDs."""
@@ -356,6 +357,7 @@ class InstitutionAgent(BaseAgent):
                     continue
                 # Try local ROR lookup first
                 ror_result = None
+                self._ror_loader.ensure()
                 if self._ror_loaded:
                     local_ror_id = self._ror_local_index.get(name.lower())
                     if local_ror_id:
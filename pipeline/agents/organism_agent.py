@@ -139,6 +139,10 @@ class OrganismAgent(BaseAgent):
 
     name = "organism"
 
+    def prefilter(self):
+        # analyze() only matches these names, verbatim
+        return tuple(ORGANISM_LATIN)
+
     def analyze(self, text: str, section: str = None) -> List[Extraction]:
         # Latin name matching only — no common names
         return self._deduplicate(self._latin_match(text, section))
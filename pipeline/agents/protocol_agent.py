@@ -7,12 +7,16 @@ Detects:
   - RRIDs (Research Resource Identifiers)
   - ROR IDs (Research Organization Registry)
   - GitHub repository URLs
+
+Every pattern is gated by literal anchors: one cheap case-insensitive scan
+finds which anchors occur in the text, and only patterns whose anchors are
+present run their full regex (see _scan_anchors()).
 """
 
 import re
-from typing import Dict, List
+from typing import Dict, FrozenSet, List, Tuple
 
-from .base_agent import BaseAgent, Extraction
+from .base_agent import BaseAgent, Extraction, scan_anchors
 
 # ======================================================================
 # Protocol patterns
@@ -399,6 +403,11 @@ _DATA_URL_FALLBACK = re.compile(
     re.I,
 )
 
+# Bare doi.org URLs, classified by DOI prefix when no specific pattern hit
+_DOI_URL_RE = re.compile(
+    r"(?:https?://)?doi\.org/(10\.\d{4,}/[\w./-]+)", re.I
+)
+
 _URL_DOMAIN_TO_NAME = {
     "zenodo": "Zenodo",
     "figshare": "Figshare",
@@ -576,25 +585,138 @@ def _resolve_overlaps(extractions: List[Extraction]) -> List[Extraction]:
     return result
 
 
+# ======================================================================
+# Anchor pre-scan
+# Each entry lists lowercase literals of which every match of the pattern
+# contains at least one (case-insensitively).  A text that contains none
+# of a pattern's anchors cannot match it, so the pattern is skipped.
+# Keep these in sync when editing the patterns above.
+# ======================================================================
+
+# "<prefix>0".."<prefix>9" — anchors for accession alternatives like ds\d{6}
+def _digit_anchors(prefix: str) -> Tuple[str, ...]:
+    return tuple(f"{prefix}{d}" for d in range(10))
+
+
+_PROTOCOL_ANCHORS: Dict[str, Tuple[str, ...]] = {
+    "protocols.io": ("protocol",),
+    "Bio-protocol": ("protocol",),
+    "Nature Protocols": ("protocol",),
+    "STAR Protocols": ("protocol",),
+    "JoVE": ("jove", "visualized"),
+    "Current Protocols": ("protocol",),
+    "Methods in Molecular Biology": ("molecular",),
+    "Methods in Enzymology": ("enzymology",),
+    "Cold Spring Harbor Protocols": ("protocol",),
+    "MethodsX": ("methodsx",),
+    "Biotechniques": ("biotechniques",),
+    "Protocol Exchange": ("protocol",),
+}
+
+_REPOSITORY_ANCHORS: Dict[str, Tuple[str, ...]] = {
+    "GitHub": ("github.com",),
+    "GitLab": ("gitlab.com",),
+    "Bitbucket": ("bitbucket.org",),
+    "Zenodo": ("zenodo",),
+    "Figshare": ("figshare",),
+    "Dryad": ("dryad",),
+    "OSF": ("osf", "framework"),
+    "Code Ocean": ("ocean",),
+    "Mendeley Data": ("mendeley", "10.17632"),
+    "EMPIAR": ("empiar",),
+    "EMDB": ("emd",),
+    "PDB": ("pdb", "rcsb"),
+    "BioImage Archive": ("bioimage", "s-biad"),
+    "IDR": ("resource", "idr"),
+    "OMERO": ("omero",),
+    "SSBD": ("ssbd",),
+    "GEO": ("gse", "omnibus", "gov/geo"),
+    "SRA": ("sra", "srp", "srx", "srr", "prjna", "archive", "bioproject"),
+    "ArrayExpress": ("arrayexpress", "e-"),
+    "ENA": ("ena", "nucleotide", "prje"),
+    "PRIDE": ("pride", "pxd"),
+    "ProteomeXchange": ("proteomexchange",),
+    "BioStudies": ("biostudies", "s-bsst"),
+    "Dataverse": ("dataverse", "10.7910"),
+    "GigaDB": ("gigadb", "10.5524"),
+    "Hugging Face": ("huggingface.co",),
+    "DANDI": ("dandi",),
+    "NeuroMorpho": ("neuromorpho",),
+    "OpenNeuro": ("openneuro",) + _digit_anchors("ds"),
+    "Synapse": ("synapse",) + _digit_anchors("syn"),
+    "ScienceDB": ("sciencedb", "bank"),
+    "AWS Open Data": ("opendata.aws",),
+    "Cell Image Library": ("library", "cil:", "cil "),
+    "BioModels": ("biomodel", "biomd") + _digit_anchors("model"),
+    "BioImage Model Zoo": ("bioimage",),
+    "JCB DataViewer": ("dataviewer",),
+}
+
+_MISC_ANCHORS: Dict[str, Tuple[str, ...]] = {
+    "data_url_fallback": (
+        "zenodo", "figshare", "dryad", "osf", "omero", "openmicroscopy",
+        "synapse", "dandiarchive", "idr", "dataverse", "huggingface",
+        "codeocean", "openneuro", "neuromorpho", "sciencedb", "empiar",
+        "gigadb", "cellimagelibrary", "bioimage", "biomodels",
+        "jcb-dataviewer", "rcsb", "mendeley", "flowrepository",
+        "metabolights", "metabolomexchange", "ebi.ac.uk/",
+    ),
+    "doi_url": ("doi.org",),
+    "rrid": ("rrid",),
+    "rrid_standalone": ("ab_", "scr_", "cvcl_", "addgene_"),
+    "ror": ("ror",),
+    "github_url": ("github.com",),
+    "protocol_url": ("protocol", "doi.org", "jove", "nprot"),
+}
+
+
+_ALL_ANCHORS: FrozenSet[str] = frozenset(
+    a
+    for table in (_PROTOCOL_ANCHORS, _REPOSITORY_ANCHORS, _MISC_ANCHORS)
+    for group in table.values()
+    for a in group
+)
+
+
+def _scan_anchors(text: str) -> FrozenSet[str]:
+    """Return the protocol/repository anchors present in *text*."""
+    return scan_anchors(text, _ALL_ANCHORS)
+
+
+def _gate_open(found: FrozenSet[str], table: Dict[str, Tuple[str, ...]], key: str) -> bool:
+    """True when any anchor of pattern *key* in *table* occurs in the text."""
+    return not found.isdisjoint(table[key])
+
+
 class ProtocolAgent(BaseAgent):
     """Extract protocol references, data repositories, RRIDs, and RORs."""
 
     name = "protocol"
 
+    def prefilter(self):
+        # Every matcher is gated by these anchors (see _scan_anchors())
+        return _ALL_ANCHORS
+
     def analyze(self, text: str, section: str = None) -> List[Extraction]:
+        found = _scan_anchors(text)
         results: List[Extraction] = []
-        results.extend(self._match_protocols(text, section))
-        results.extend(self._match_repositories(text, section))
-        results.extend(self._match_rrids(text, section))
-        results.extend(self._match_rors(text, section))
-        results.extend(self._match_github_urls(text, section))
-        results.extend(self._match_protocol_urls(text, section))
+        results.extend(self._match_protocols(text, section, found))
+        results.extend(self._match_repositories(text, section, found))
+        results.extend(self._match_rrids(text, section, found))
+        results.extend(self._match_rors(text, section, found))
+        results.extend(self._match_github_urls(text, section, found))
+        results.extend(self._match_protocol_urls(text, section, found))
         return self._deduplicate(results)
 
     # ------------------------------------------------------------------
-    def _match_protocols(self, text: str, section: str = None) -> List[Extraction]:
+    def _match_protocols(self, text: str, section: str = None,
+                         found: FrozenSet[str] = None) -> List[Extraction]:
+        if found is None:
+            found = _scan_anchors(text)
         extractions: List[Extraction] = []
         for canonical, (pattern, base_conf) in PROTOCOL_PATTERNS.items():
+            if not _gate_open(found, _PROTOCOL_ANCHORS, canonical):
+                continue
             for m in pattern.finditer(text):
                 extractions.append(Extraction(
                     text=m.group(0),
@@ -608,9 +730,14 @@ class ProtocolAgent(BaseAgent):
         return extractions
 
     # ------------------------------------------------------------------
-    def _match_repositories(self, text: str, section: str = None) -> List[Extraction]:
+    def _match_repositories(self, text: str, section: str = None,
+                            found: FrozenSet[str] = None) -> List[Extraction]:
+        if found is None:
+            found = _scan_anchors(text)
         extractions: List[Extraction] = []
         for repo_type, (pattern, base_conf) in REPOSITORY_PATTERNS.items():
+            if not _gate_open(found, _REPOSITORY_ANCHORS, repo_type):
+                continue
             for m in pattern.finditer(text):
                 meta = {"canonical": repo_type}
                 matched = m.group(0).rstrip(".,;)")
@@ -648,7 +775,11 @@ class ProtocolAgent(BaseAgent):
                 ))
 
         # Fallback: scan for any URL containing a known data repo domain
-        for m in _DATA_URL_FALLBACK.finditer(text):
+        fallback_matches = (
+            _DATA_URL_FALLBACK.finditer(text)
+            if _gate_open(found, _MISC_ANCHORS, "data_url_fallback") else ()
+        )
+        for m in fallback_matches:
             url = m.group(0).rstrip(".,;)")
             # Skip if already captured by specific patterns above
             if any(e.metadata.get("url", "").rstrip("/") == url.rstrip("/")
@@ -669,10 +800,11 @@ class ProtocolAgent(BaseAgent):
 
         # Catch doi.org URLs that weren't matched by specific repo patterns.
         # In data availability sections, these often point to datasets.
-        _DOI_URL_RE = re.compile(
-            r"(?:https?://)?doi\.org/(10\.\d{4,}/[\w./-]+)", re.I
+        doi_url_matches = (
+            _DOI_URL_RE.finditer(text)
+            if _gate_open(found, _MISC_ANCHORS, "doi_url") else ()
         )
-        for m in _DOI_URL_RE.finditer(text):
+        for m in doi_url_matches:
             url = f"https://doi.org/{m.group(1).rstrip('.,;)')}"
             doi_str = m.group(1).rstrip(".,;)")
             # Skip if already captured
@@ -708,12 +840,19 @@ class ProtocolAgent(BaseAgent):
         return extractions
 
     # ------------------------------------------------------------------
-    def _match_rrids(self, text: str, section: str = None) -> List[Extraction]:
+    def _match_rrids(self, text: str, section: str = None,
+                     found: FrozenSet[str] = None) -> List[Extraction]:
+        if found is None:
+            found = _scan_anchors(text)
         extractions: List[Extraction] = []
         seen_ids: set = set()
 
         # Primary: standard RRID:PREFIX_ID format
-        for m in _RRID_PATTERN.finditer(text):
+        primary = (
+            _RRID_PATTERN.finditer(text)
+            if _gate_open(found, _MISC_ANCHORS, "rrid") else ()
+        )
+        for m in primary:
             rrid_id = m.group(1)
             if rrid_id in seen_ids:
                 continue
@@ -737,7 +876,8 @@ class ProtocolAgent(BaseAgent):
 
         # Secondary: standalone identifiers (AB_123456, SCR_123456, etc.)
         # Only in methods/materials to avoid false positives
-        if section in ("methods", "materials", "data_availability", "full_text"):
+        if (section in ("methods", "materials", "data_availability", "full_text")
+                and _gate_open(found, _MISC_ANCHORS, "rrid_standalone")):
             for m in _RRID_STANDALONE_PATTERN.finditer(text):
                 rrid_id = m.group(1)
                 if rrid_id in seen_ids:
@@ -763,8 +903,13 @@ class ProtocolAgent(BaseAgent):
         return extractions
 
     # ------------------------------------------------------------------
-    def _match_rors(self, text: str, section: str = None) -> List[Extraction]:
+    def _match_rors(self, text: str, section: str = None,
+                    found: FrozenSet[str] = None) -> List[Extraction]:
+        if found is None:
+            found = _scan_anchors(text)
         extractions: List[Extraction] = []
+        if not _gate_open(found, _MISC_ANCHORS, "ror"):
+            return extractions
         for pattern in _ROR_PATTERNS:
             for m in pattern.finditer(text):
                 ror_id = m.group(1)
@@ -783,8 +928,13 @@ class ProtocolAgent(BaseAgent):
         return extractions
 
     # ------------------------------------------------------------------
-    def _match_github_urls(self, text: str, section: str = None) -> List[Extraction]:
+    def _match_github_urls(self, text: str, section: str = None,
+                           found: FrozenSet[str] = None) -> List[Extraction]:
+        if found is None:
+            found = _scan_anchors(text)
         extractions: List[Extraction] = []
+        if not _gate_open(found, _MISC_ANCHORS, "github_url"):
+            return extractions
         for m in _GITHUB_URL_PATTERN.finditer(text):
             full_name = m.group(1).rstrip(".,;)")
             url = f"https://github.com/{full_name}"
@@ -800,8 +950,13 @@ class ProtocolAgent(BaseAgent):
         return extractions
 
     # ------------------------------------------------------------------
-    def _match_protocol_urls(self, text: str, section: str = None) -> List[Extraction]:
+    def _match_protocol_urls(self, text: str, section: str = None,
+                             found: FrozenSet[str] = None) -> List[Extraction]:
+        if found is None:
+            found = _scan_anchors(text)
         extractions: List[Extraction] = []
+        if not _gate_open(found, _MISC_ANCHORS, "protocol_url"):
+            return extractions
         for m in _PROTOCOL_URL_PATTERN.finditer(text):
             url = m.group(0)
             if not url.startswith("http"):
@@ -21,6 +21,7 @@ import logging
 import time
 from typing import Dict, List, Optional, Set
 
+from .. import load_costs
 from .base_agent import BaseAgent, Extraction
 
 logger = logging.getLogger(__name__)
@@ -109,11 +110,8 @@ class PubTatorAgent(BaseAgent):
         self._cache: Dict[str, List[Extraction]] = {}
         self._local_annotations: Dict[str, List[Dict]] = {}
         self._local_loaded = False
-        self._local_path = local_path
-
-    def _ensure_local_loaded(self) -> None:
-        if not self._local_loaded and self._local_path:
-            self._load_local(self._local_path)
+        self._local_loader = load_costs.LazyLoad(
+            "PubTator entity summaries", self._load_local, local_path or None)
 
     def _load_local(self, path: str):
         """Load PubTator entity summary files into a PMID-indexed lookup.
@@ -252,7 +250,7 @@ class PubTatorAgent(BaseAgent):
         if pmid in self._cache:
             return self._cache[pmid]
 
-        self._ensure_local_loaded()
+        self._local_loader.ensure()
 
         # LOCAL FIRST
         if self._local_loaded and pmid in self._local_annotations:
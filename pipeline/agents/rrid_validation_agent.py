@@ -15,11 +15,18 @@ Cross-referencing:
   - If an RRID resolves to an antibody, checks that the paper mentions
     the target protein or host species
   - If an RRID resolves to software, checks against the software tags
+
+Resolver results are kept in a SQLite cache (see RRIDCache) that is
+updated one row per lookup, so it survives crashes and can be shared by
+concurrent runs.  Only genuine not-found answers (404, or no hits) are
+stored as negatives, and those expire after NEGATIVE_TTL_DAYS; transient
+resolver errors are remembered for the current run only.
 """
 
 import json
 import logging
-import os
+import sqlite3
+import threading
 import time
 from typing import Any, Dict, List, Optional, Set
 
@@ -32,6 +39,72 @@ except ImportError:
     HAS_REQUESTS = False
 
 
+# "Not found" answers (a 404, or a 200 with no hits) are re-checked after
+# this long, since RRIDs are registered continuously.  Other resolver errors
+# are not persisted; they count as a miss for the current run only.
+NEGATIVE_TTL_DAYS = 30
+
+
+class RRIDCache:
+    """SQLite-backed RRID resolver cache shared across chunks, runs and processes.
+
+    One row per RRID; ``result`` is the JSON resolver payload or NULL for a
+    negative result.  Every put() is its own small transaction in WAL mode,
+    so a crash loses at most the lookup in flight and other processes see
+    new rows immediately.
+    """
+
+    def __init__(self, path: str, negative_ttl_days: float = NEGATIVE_TTL_DAYS):
+        self.path = path
+        self._negative_ttl = negative_ttl_days * 86400
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=30.0, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS rrid_cache ("
+            " rrid TEXT PRIMARY KEY,"
+            " result TEXT,"
+            " fetched_at REAL NOT NULL)"
+        )
+        self._conn.commit()
+
+    def get(self, rrid: str):
+        """Return ``(found, result)``; expired negative entries count as not found."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT result, fetched_at FROM rrid_cache WHERE rrid = ?", (rrid,)
+            ).fetchone()
+        if row is None:
+            return False, None
+        result, fetched_at = row
+        if result is None:
+            if time.time() - fetched_at > self._negative_ttl:
+                return False, None
+            return True, None
+        return True, json.loads(result)
+
+    def put(self, rrid: str, result: Optional[Dict]) -> None:
+        payload = json.dumps(result) if result is not None else None
+        try:
+            with self._lock:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO rrid_cache (rrid, result, fetched_at) "
+                    "VALUES (?, ?, ?)",
+                    (rrid, payload, time.time()),
+                )
+                self._conn.commit()
+        except sqlite3.Error as exc:
+            logger.debug("Failed to write RRID cache entry %s: %s", rrid, exc)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM rrid_cache").fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
 class RRIDValidationAgent:
     """Validate RRIDs against SciCrunch."""
 
@@ -40,29 +113,32 @@ class RRIDValidationAgent:
     def __init__(self, cache_path: str = None):
         self._cache: Dict[str, Optional[Dict]] = {}
         self._cache_path = cache_path
+        self._store: Optional[RRIDCache] = None
         self._last_call = 0.0
         self._delay = 0.5
         self._exhausted = False
 
-        # Load persistent cache if available
-        if cache_path and os.path.exists(cache_path):
+        # Persistent cache (SQLite) if a path was given
+        if cache_path:
             try:
-                with open(cache_path, "r") as f:
-                    self._cache = json.load(f)
-                logger.info("RRID cache loaded: %d entries", len(self._cache))
-            except Exception:
-                pass
+                self._store = RRIDCache(cache_path)
+                logger.info("RRID cache: %s (%d entries)", cache_path, len(self._store))
+            except sqlite3.Error as exc:
+                logger.warning("RRID cache unavailable (%s): %s", cache_path, exc)
 
     def save_cache(self):
-        """Persist the RRID validation cache to disk."""
-        if not self._cache_path:
-            return
-        try:
-            with open(self._cache_path, "w") as f:
-                json.dump(self._cache, f, indent=2)
-            logger.info("RRID cache saved: %d entries", len(self._cache))
-        except Exception as exc:
-            logger.debug("Failed to save RRID cache: %s", exc)
+        """Persist the RRID validation cache to disk.
+
+        Entries are written as they are resolved; kept for callers that
+        still flush explicitly at the end of a run.
+        """
+        if self._store is not None:
+            logger.info("RRID cache saved: %d entries", len(self._store))
+
+    def _remember(self, rrid: str, result: Optional[Dict]) -> None:
+        self._cache[rrid] = result
+        if self._store is not None:
+            self._store.put(rrid, result)
 
     def validate(self, paper: Dict[str, Any]) -> Dict[str, Any]:
         """Validate all RRIDs in a paper.  Mutates in-place."""
@@ -130,6 +206,11 @@ class RRIDValidationAgent:
 
         if rrid in self._cache:
             return self._cache[rrid]
+        if self._store is not None:
+            found, result = self._store.get(rrid)
+            if found:
+                self._cache[rrid] = result
+                return result
 
         elapsed = time.time() - self._last_call
         if elapsed < self._delay:
@@ -147,14 +228,20 @@ class RRIDValidationAgent:
                 self._exhausted = True
                 return None
 
+            if resp.status_code == 404:
+                self._remember(rrid, None)
+                return None
             if resp.status_code != 200:
+                # Transient resolver failure: skip this RRID for the rest
+                # of the run, but do not persist it as a negative
+                logger.debug("SciCrunch returned %d for %s", resp.status_code, rrid)
                 self._cache[rrid] = None
                 return None
 
             data = resp.json()
             hits = data.get("hits", {}).get("hits", [])
             if not hits:
-                self._cache[rrid] = None
+                self._remember(rrid, None)
                 return None
 
             source = hits[0].get("_source", {})
@@ -164,7 +251,7 @@ class RRIDValidationAgent:
                 "type": item.get("types", [""])[0] if item.get("types") else "",
                 "vendor": item.get("vendor", {}).get("name", "") if isinstance(item.get("vendor"), dict) else "",
             }
-            self._cache[rrid] = result
+            self._remember(rrid, result)
             return result
 
         except Exception as exc:
@@ -163,12 +163,33 @@ _ABBREV_CONTEXT: List[Tuple[re.Pattern, str]] = [
     (re.compile(r"\bholograph\w+\b", re.I), "Holographic Microscopy"),
 ]
 
+# Lowercase literals at least one of which every pattern above requires
+# (for a pattern with alternatives, every alternative contains one).
+# Keep in step with the pattern lists when adding a technique.
+_TECHNIQUE_ANCHORS: Tuple[str, ...] = (
+    # mandatory words of the expansion patterns
+    "microscop", "imaging", "image", "nanoscop", "tomograph", "spectroscop",
+    "stimulated", "stochastic", "photobleaching", "resonance", "raman",
+    "harmonic", "reflection", "focused", "block", "sheet", "interference",
+    "screening", "optogenetic", "immunofluorescen", "particle", "flux",
+    "saturable", "optic", "stack", "deconvolution", "holograph",
+    # context words and abbreviations of the abbreviation patterns
+    "grid", "section", "analysis", "micrograph", "airyscan", "confocal",
+    "spinning", "cryo", "storm", "paint", "resolft", "sofi", "flim", "frap",
+    "fret", "fcs", "afm", "clem", "oct", "tirf", "fib", "smlm", "shg", "cars",
+    "srs", "flip", "clsm", "lscm", "lsfm", "spim", "sbf", "immunoem", "exm",
+    "hcs",
+)
+
 
 class TechniqueAgent(BaseAgent):
     """Extract microscopy technique mentions from text."""
 
     name = "technique"
 
+    def prefilter(self):
+        return _TECHNIQUE_ANCHORS
+
     def analyze(self, text: str, section: str = None) -> List[Extraction]:
         results: List[Extraction] = []
 
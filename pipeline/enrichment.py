@@ -194,7 +194,8 @@ class Enricher:
         Pipeline order follows the recommended architecture:
           1. OpenAlex first-call enrichment (institutions, topics, citations, OA)
           2. Semantic Scholar batch citations (supplemental, 500/request)
-          3. Per-paper GitHub, CrossRef, DataCite, ROR (where needed)
+          3. Per-paper GitHub, CrossRef, DataCite, ROR (where needed);
+             DataCite/ScholeXplorer lookups are prefetched for the chunk
         """
         if not HAS_REQUESTS:
             logger.warning("requests library not installed — skipping API enrichment")
@@ -215,6 +216,16 @@ class Enricher:
             or fetch_crossref_metadata or validate_repo_dois
         )
         if any_per_paper and papers:
+            # Resolve DataCite/ScholeXplorer links for the whole chunk up
+            # front; _enrich_datacite() then reads the agent's DOI caches.
+            if fetch_datacite:
+                dois = [p.get("doi") for p in papers if p.get("doi")]
+                if dois:
+                    try:
+                        self.datacite_agent.prefetch(dois)
+                    except Exception as exc:
+                        logger.warning("  Dataset-link prefetch failed: %s", exc)
+
             def _enrich_one(paper):
                 if fetch_github and not self._gh_exhausted:
                     self._enrich_github_tools(paper)
@@ -0,0 +1,315 @@
+"""
+Streaming reader and writer for the pipeline's chunk files.
+
+Steps 2, 2b and 3 exchange ``*_chunk_*.json`` files: one JSON array of paper
+dicts, pretty-printed with ``indent=2``.  Loading a chunk with ``json.load``
+holds every paper (full texts included) in memory at once; these helpers
+read and write one paper at a time while producing byte-identical files.
+
+Between stages, chunks may instead be compressed JSON Lines — one compact
+paper per line — chosen by file suffix (see CHUNK_FORMATS).  They are a
+fraction of the size and parse line by line.  ``.jsonl.zst`` needs the
+optional ``zstandard`` package; step 3's WordPress output is always JSON.
+
+An export manifest (``<base>_manifest.json``, written by step 2) lists the
+chunk files one export produced, so later steps can process just those —
+for a delta export, only the papers that changed.  Without a manifest,
+delta chunks (``*_delta_*``) are skipped.
+
+Usage:
+    from pipeline.export.chunk_io import iter_chunk, ChunkWriter
+    with ChunkWriter(out_path) as writer:
+        for paper in iter_chunk(in_path):
+            writer.write(paper)
+"""
+
+import glob
+import gzip
+import io
+import json
+import logging
+import os
+from typing import IO, Any, Dict, Iterator, List, Optional
+
+try:
+    import zstandard
+    HAS_ZSTD = True
+except ImportError:
+    HAS_ZSTD = False
+
+logger = logging.getLogger(__name__)
+
+# Chunk format name → file suffix
+CHUNK_FORMATS = {
+    "json": ".json",
+    "jsonl.gz": ".jsonl.gz",
+    "jsonl.zst": ".jsonl.zst",
+}
+_GZIP_LEVEL = 6
+_ZSTD_LEVEL = 3
+
+_READ_BLOCK = 1 << 20  # 1 MiB
+_WHITESPACE = " \t\n\r"
+
+MANIFEST_VERSION = 1
+MANIFEST_SUFFIX = "_manifest.json"
+# Delta exports name their chunks <base>_delta_<watermark>_chunk_N
+DELTA_MARKER = "_delta_"
+
+
+def chunk_format(path: str) -> str:
+    """Return the CHUNK_FORMATS name for *path* (``"json"`` if unknown)."""
+    for fmt, suffix in CHUNK_FORMATS.items():
+        if fmt != "json" and path.endswith(suffix):
+            return fmt
+    return "json"
+
+
+def with_chunk_format(path: str, fmt: str) -> str:
+    """Return *path* with its chunk suffix replaced by the one for *fmt*."""
+    suffix = CHUNK_FORMATS[chunk_format(path)]
+    if path.endswith(suffix):
+        path = path[:-len(suffix)]
+    return path + CHUNK_FORMATS[fmt]
+
+
+def find_chunk_files(directory: str, include_delta: bool = False) -> List[str]:
+    """Return the ``*_chunk_*`` files in *directory*, in any chunk format.
+
+    A chunk present in more than one format is returned once, in its most
+    recently written format, with a warning.  Delta-export chunks share the
+    directory with the full export they update, so they are left out unless
+    *include_delta* is set — a run over the whole directory would otherwise
+    see their papers twice.  Select them through the export manifest
+    instead (manifest_chunk_files).
+    """
+    suffixes = tuple(CHUNK_FORMATS.values())
+    by_stem: Dict[str, List[str]] = {}
+    for path in glob.glob(os.path.join(directory, "*_chunk_*")):
+        if not path.endswith(suffixes):
+            continue
+        if not include_delta and DELTA_MARKER in os.path.basename(path):
+            continue
+        stem = path[:-len(CHUNK_FORMATS[chunk_format(path)])]
+        by_stem.setdefault(stem, []).append(path)
+
+    files = []
+    for stem, paths in by_stem.items():
+        if len(paths) > 1:
+            # The same chunk in several formats (e.g. an earlier run with
+            # another --chunk-format): reading all would duplicate papers.
+            paths.sort(key=os.path.getmtime, reverse=True)
+            logger.warning("Chunk %s exists as %s; using the newest, %s",
+                           os.path.basename(stem),
+                           ", ".join(os.path.basename(p) for p in paths),
+                           os.path.basename(paths[0]))
+        files.append(paths[0])
+    return sorted(files)
+
+
+def _open_text(path: str, mode: str, fmt: str) -> IO[str]:
+    if fmt == "jsonl.gz":
+        return gzip.open(path, mode + "t", encoding="utf-8", compresslevel=_GZIP_LEVEL)
+    if fmt == "jsonl.zst":
+        if not HAS_ZSTD:
+            raise ImportError(".jsonl.zst chunks need the zstandard package "
+                              "(pip install zstandard)")
+        raw = open(path, mode + "b")
+        if mode == "w":
+            stream = zstandard.ZstdCompressor(level=_ZSTD_LEVEL).stream_writer(raw)
+        else:
+            stream = zstandard.ZstdDecompressor().stream_reader(raw)
+        return io.TextIOWrapper(stream, encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
+def iter_chunk(path: str) -> Iterator[Dict[str, Any]]:
+    """Yield the papers of a chunk file one at a time.
+
+    A JSON chunk must hold a JSON array; a single top-level object is
+    yielded as a one-paper chunk (as ``json.load`` callers used to wrap it).
+    Raises ``json.JSONDecodeError`` on malformed input, like ``json.load``.
+    """
+    fmt = chunk_format(path)
+    if fmt != "json":
+        with _open_text(path, "r", fmt) as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+        return
+
+    decoder = json.JSONDecoder()
+    with open(path, "r", encoding="utf-8") as f:
+        buf = f.read(_READ_BLOCK)
+        pos = _skip_ws(buf, 0)
+        if pos < len(buf) and buf[pos] != "[":
+            # Not an array: parse the whole document as before
+            yield json.loads(buf + f.read())
+            return
+        if pos >= len(buf):
+            json.loads(buf)  # raises the same error json.load would
+            return
+        pos += 1
+        expect_value = True
+        first = True
+        eof = False
+        while True:
+            pos = _skip_ws(buf, pos)
+            if pos >= len(buf):
+                if eof:
+                    raise json.JSONDecodeError("Unterminated array", buf, pos)
+                more = f.read(max(_READ_BLOCK, len(buf)))
+                eof = not more
+                buf = buf[pos:] + more
+                pos = 0
+                continue
+            ch = buf[pos]
+            if ch == "]" and (first or not expect_value):
+                rest = buf[pos + 1:] + f.read()
+                if rest.strip(_WHITESPACE):
+                    raise json.JSONDecodeError(
+                        "Extra data", rest, len(rest) - len(rest.lstrip(_WHITESPACE)))
+                return
+            if not expect_value:
+                if ch != ",":
+                    raise json.JSONDecodeError("Expecting ',' delimiter", buf, pos)
+                pos += 1
+                expect_value = True
+                continue
+            try:
+                value, end = decoder.raw_decode(buf, pos)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+                end = -1
+            # A value not yet followed by a delimiter may be truncated at
+            # the buffer end (e.g. "12" of "12.5"); decode it again once
+            # more text is in.
+            if end < 0 or (not eof and _next_char(buf, end) not in (",", "]")):
+                more = f.read(max(_READ_BLOCK, len(buf) - pos))
+                eof = not more
+                buf = buf[pos:] + more
+                pos = 0
+                continue
+            yield value
+            first = False
+            expect_value = False
+            pos = end
+            if pos > _READ_BLOCK:
+                buf = buf[pos:]
+                pos = 0
+
+
+def _next_char(buf: str, pos: int) -> str:
+    pos = _skip_ws(buf, pos)
+    return buf[pos] if pos < len(buf) else ""
+
+
+def _skip_ws(buf: str, pos: int) -> int:
+    n = len(buf)
+    while pos < n and buf[pos] in _WHITESPACE:
+        pos += 1
+    return pos
+
+
+class ChunkWriter:
+    """Write papers to a chunk file one at a time, in the format its suffix names.
+
+    A JSON chunk is byte-identical to
+    ``json.dump(papers, f, indent=2, ensure_ascii=False, default=str)``.
+    Papers go to a temporary file that replaces *path* on close(), so a
+    chunk being rewritten in place can still be read while it is written.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.count = 0
+        self._format = chunk_format(path)
+        self._tmp_path = "%s.%d.tmp" % (path, os.getpid())
+        self._f = _open_text(self._tmp_path, "w", self._format)
+
+    def write(self, paper: Dict[str, Any]) -> None:
+        if self._format != "json":
+            self._f.write(json.dumps(paper, ensure_ascii=False, default=str,
+                                     separators=(",", ":")) + "\n")
+            self.count += 1
+            return
+        text = json.dumps(paper, indent=2, ensure_ascii=False, default=str)
+        # JSON strings never contain raw newlines, so re-indenting by line
+        # reproduces the nesting json.dump gives list items.
+        self._f.write(("[\n  " if self.count == 0 else ",\n  ")
+                      + text.replace("\n", "\n  "))
+        self.count += 1
+
+    def close(self) -> None:
+        if self._f.closed:
+            return
+        if self._format == "json":
+            self._f.write("\n]" if self.count else "[]")
+        self._f.close()
+        os.replace(self._tmp_path, self.path)
+
+    def __enter__(self) -> "ChunkWriter":
+        return self
+
+    def abort(self) -> None:
+        """Discard everything written; *path* is left untouched."""
+        if not self._f.closed:
+            self._f.close()
+            os.remove(self._tmp_path)
+
+    def __exit__(self, exc_type, *exc) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+
+# ======================================================================
+# Export manifests
+# ======================================================================
+
+def read_manifest(path: str) -> Optional[Dict[str, Any]]:
+    """Return the manifest at *path*, or None if it is missing or unreadable."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as exc:
+        logger.warning("Export manifest %s unreadable (%s); ignoring it", path, exc)
+        return None
+    return manifest if isinstance(manifest, dict) else None
+
+
+def write_manifest(path: str, manifest: Dict[str, Any]) -> None:
+    """Write *manifest* to *path* atomically."""
+    tmp_path = "%s.%d.tmp" % (path, os.getpid())
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+
+def manifest_chunk_files(path: str, input_dir: str) -> List[str]:
+    """Return the chunk files listed in the manifest at *path*, in order.
+
+    Chunks are looked up in *input_dir* by name, in whichever chunk format
+    is there — names are kept across steps, so step 2's manifest also
+    selects the matching step 2b output.  Raises ``ValueError`` if the
+    manifest cannot be read.
+    """
+    manifest = read_manifest(path)
+    if manifest is None:
+        raise ValueError("cannot read export manifest %s" % path)
+    files = []
+    for name in manifest.get("chunks", []):
+        name = os.path.basename(name)
+        candidates = [os.path.join(input_dir, name)] + [
+            with_chunk_format(os.path.join(input_dir, name), fmt) for fmt in CHUNK_FORMATS
+        ]
+        found = next((c for c in candidates if os.path.exists(c)), None)
+        if found:
+            files.append(found)
+        else:
+            logger.warning("Manifest chunk %s not found in %s", name, input_dir)
+    return files
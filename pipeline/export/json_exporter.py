@@ -14,10 +14,22 @@ import logging
 import os
 import re
 import sqlite3
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 from urllib.parse import urlparse
 
+from pipeline.export.chunk_io import (
+    CHUNK_FORMATS,
+    DELTA_MARKER,
+    MANIFEST_SUFFIX,
+    MANIFEST_VERSION,
+    ChunkWriter,
+    read_manifest,
+    write_manifest,
+)
+
 logger = logging.getLogger(__name__)
 
 _OA_STATUSES = {"gold", "green", "bronze", "hybrid", "diamond", "open", "oa"}
@@ -31,6 +43,56 @@ _AMBIGUOUS_PLATE_READER_BRANDS = {
     "molecular devices", "biotek", "tecan", "bmg labtech", "bmg", "fluostar", "clariostar"
 }
 
+# Columns _build_paper_dict() and _update_stats() read.  full_text stays in
+# even with strip_full_text: data_availability is extracted from it first.
+_EXPORT_COLUMNS = (
+    "id", "pmid", "doi", "pmc_id", "semantic_scholar_id", "title", "abstract",
+    "methods", "full_text", "authors", "journal", "year", "affiliations",
+    "institutions", "facility", "facilities", "imaging_facility",
+    "citation_count", "influential_citation_count", "citation_source",
+    "openalex_id", "oa_status", "oa_url", "is_open_access", "openalex_topics",
+    "openalex_institutions", "fields_of_study", "fwci", "doi_url",
+    "pubmed_url", "pmc_url", "pdf_url", "github_url", "microscopy_techniques",
+    "techniques", "tags", "microscope_brands", "microscope_models",
+    "reagent_suppliers", "image_analysis_software",
+    "image_acquisition_software", "general_software", "software",
+    "sample_preparation", "fluorophores", "organisms", "antibody_sources",
+    "cell_lines", "imaging_modalities", "staining_methods", "lasers",
+    "detectors", "objectives", "filters", "embedding_methods",
+    "fixation_methods", "mounting_media", "protocols", "repositories",
+    "supplementary_materials", "rrids", "rors", "references", "antibodies",
+    "figures", "figure_count", "has_full_text", "has_figures",
+    "has_protocols", "has_github", "has_data", "has_affiliations",
+    "has_institutions", "links_validated", "tag_source", "priority_score",
+    "created_at", "updated_at", "enriched_at", "citations_updated_at",
+    "validated_at", "full_text_fetched_at",
+)
+
+# Export order; the index below serves both the sort and the keyset cursor.
+_EXPORT_ORDER = "citation_count DESC, priority_score DESC, year DESC, id"
+_EXPORT_ORDER_INDEX = "idx_papers_export_order"
+_EXPORT_PAGE_SIZE = 1000
+
+# Change log behind delta exports.  Every insert or update of a paper moves
+# it to the end of paper_changes, so "seq > watermark" selects the papers
+# touched since an export that recorded that watermark — whichever code
+# path wrote them.  (A plain INSERT after the DELETE, because an outer
+# INSERT OR IGNORE would override a REPLACE inside the trigger.)
+_CHANGE_LOG_SQL = """
+CREATE TABLE IF NOT EXISTS paper_changes (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    paper_id INTEGER NOT NULL UNIQUE
+);
+CREATE TRIGGER IF NOT EXISTS trg_paper_changes_insert AFTER INSERT ON papers BEGIN
+    DELETE FROM paper_changes WHERE paper_id = NEW.id;
+    INSERT INTO paper_changes (paper_id) VALUES (NEW.id);
+END;
+CREATE TRIGGER IF NOT EXISTS trg_paper_changes_update AFTER UPDATE ON papers BEGIN
+    DELETE FROM paper_changes WHERE paper_id = NEW.id;
+    INSERT INTO paper_changes (paper_id) VALUES (NEW.id);
+END;
+"""
+
 
 # ======================================================================
 # Protocol classification (ported from cleanup_and_retag.py v3.7)
@@ -259,6 +321,9 @@ class JsonExporter:
         chunk_size: int = 500,
         enricher=None,
         strip_full_text: bool = False,
+        workers: int = 1,
+        delta: bool = False,
+        chunk_format: str = "json",
     ) -> int:
         """Export papers to JSON with ALL fields.
 
@@ -267,6 +332,22 @@ class JsonExporter:
         enricher : PipelineOrchestrator, optional
             If provided, re-runs the agent pipeline on each paper to refresh
             tag extractions.  Pass ``None`` to export existing DB values.
+        workers : int
+            Processes that build and write chunks while rows are read.
+            Chunk contents, numbering and stats do not depend on it.
+        delta : bool
+            Export only papers added or changed since the export recorded in
+            ``<output>_manifest.json``, into ``<output>_delta_<watermark>_chunk_N``
+            files.  Falls back to a full export when there is no usable
+            watermark (first run, other filters, no change log).  Only a
+            delta export installs the change log (a table and two triggers
+            on ``papers``) in the database.
+        chunk_format : str
+            A CHUNK_FORMATS name; ``"jsonl.gz"`` writes compressed JSON
+            Lines chunks for steps 2b and 3 instead of indented JSON.
+
+        Every export writes that manifest: the chunk files it produced and
+        the change-log watermark the next delta export starts from.
         """
         logger.info("=" * 60)
         logger.info("MICROHUB JSON EXPORTER v6.0 - AGENT PIPELINE")
@@ -279,14 +360,46 @@ class JsonExporter:
         # GitHub tools (same logic as v5.1)
         github_tools_map, github_tools_summary = self._load_github_tools(conn)
 
+        base_name = output_path.replace(".json", "")
+        manifest_path = base_name + MANIFEST_SUFFIX
+        filters = {
+            "full_text_only": full_text_only,
+            "with_citations_only": with_citations_only,
+            "min_citations": min_citations,
+            "with_protocols_only": with_protocols_only,
+            "with_github_only": with_github_only,
+            "methods_only": methods_only,
+            "strip_full_text": strip_full_text,
+            "enriched": enricher is not None,
+            "chunk_format": chunk_format,
+        }
+
+        # Read the watermark before any rows: papers changed while we export
+        # are then picked up again by the next delta rather than missed.
+        # Only --delta installs the change log in the DB; a full export just
+        # records the watermark of one that is already there.
+        if delta:
+            watermark = self._ensure_change_log(conn)
+        else:
+            watermark = self._change_log_watermark(conn)
+        since = None
+        if delta:
+            since = self._delta_since(read_manifest(manifest_path), watermark, filters)
+
         # Build query
         conditions = []
+        params: List[Any] = []
+        if since is not None:
+            logger.info("Delta export: papers changed since watermark %d", since)
+            conditions.append("id IN (SELECT paper_id FROM paper_changes WHERE seq > ?)")
+            params.append(since)
         if full_text_only:
             conditions.append("has_full_text = 1")
         if with_citations_only:
             conditions.append("citation_count > 0")
         if min_citations > 0:
-            conditions.append(f"citation_count >= {min_citations}")
+            conditions.append("citation_count >= ?")
+            params.append(min_citations)
         if with_protocols_only:
             conditions.append("has_protocols = 1")
         if with_github_only:
@@ -296,60 +409,94 @@ class JsonExporter:
 
         where = " AND ".join(conditions) if conditions else "1=1"
 
-        total = conn.execute(f"SELECT COUNT(*) FROM papers WHERE {where}").fetchone()[0]
+        total = conn.execute(f"SELECT COUNT(*) FROM papers WHERE {where}", params).fetchone()[0]
         logger.info("Total papers matching criteria: %d", total)
 
-        query = f"""
-            SELECT * FROM papers WHERE {where}
-            ORDER BY citation_count DESC, priority_score DESC, year DESC
-        """
-        if limit:
-            query += f" LIMIT {limit}"
-
-        cursor = conn.execute(query)
+        # The enricher's agents may read any column; otherwise fetch only
+        # what the paper dict is built from.
+        columns = self._export_columns(conn, all_columns=enricher is not None)
+        rows = self._iter_rows(conn, columns, where, params, limit)
 
-        base_name = output_path.replace(".json", "")
-        chunk_num = 1
-        chunk_papers: List[Dict] = []
+        chunk_base = f"{base_name}{DELTA_MARKER}{watermark}" if since is not None else base_name
+        chunk_suffix = CHUNK_FORMATS[chunk_format]
+        chunk_num = 0
+        chunk_rows: List[Dict] = []
         papers_written = 0
         created_files: List[str] = []
 
         stats = self._init_stats()
 
-        for row in cursor:
-            row_dict = dict(row)
-
-            # Optionally re-run agents for fresh tags
-            if enricher is not None:
-                agent_results = enricher.process_paper(row_dict)
-                row_dict = self._merge_agent_results(row_dict, agent_results)
-
-            paper = self._build_paper_dict(row_dict, github_tools_map,
-                                           strip_full_text=strip_full_text)
-            self._update_stats(stats, paper, row_dict)
-
-            chunk_papers.append(paper)
-            papers_written += 1
-
-            if papers_written % 5000 == 0:
-                logger.info("Processed %d papers...", papers_written)
+        # Rows are read (and enriched) here; whole chunks go to the pool to
+        # be built and written.  Results are collected in chunk order, with
+        # at most a couple of chunks per worker in flight.
+        pool = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+        max_pending = workers * 2 if pool is not None else 0
+        pending = deque()
+
+        def _submit(rows: List[Dict], filename: str):
+            tools = {r.get("id"): github_tools_map[r.get("id")]
+                     for r in rows if r.get("id") in github_tools_map}
+            if pool is None:
+                return self._write_chunk(rows, filename, tools, strip_full_text)
+            return pool.submit(self._write_chunk, rows, filename, tools, strip_full_text)
+
+        def _collect():
+            nonlocal papers_written
+            num, result = pending.popleft()
+            if isinstance(result, Future):
+                result = result.result()
+            filename, count, chunk_stats = result
+            self._merge_stats(stats, chunk_stats)
+            created_files.append(filename)
+            if count >= chunk_size:
+                logger.info("Saved chunk %d: %s (%d papers)", num, filename, count)
+            else:
+                logger.info("Saved: %s (%d papers)", filename, count)
+            if (papers_written + count) // 5000 > papers_written // 5000:
+                logger.info("Processed %d papers...", papers_written + count)
+            papers_written += count
 
-            if len(chunk_papers) >= chunk_size:
-                fn = f"{base_name}_chunk_{chunk_num}.json"
-                self._save_chunk(chunk_papers, fn)
-                created_files.append(fn)
-                logger.info("Saved chunk %d: %s (%d papers)", chunk_num, fn, len(chunk_papers))
+        try:
+            for row in rows:
+                row_dict = dict(row)
+
+                # Optionally re-run agents for fresh tags
+                if enricher is not None:
+                    agent_results = enricher.process_paper(row_dict)
+                    row_dict = self._merge_agent_results(row_dict, agent_results)
+
+                chunk_rows.append(row_dict)
+                if len(chunk_rows) >= chunk_size:
+                    chunk_num += 1
+                    pending.append((chunk_num, _submit(chunk_rows, f"{chunk_base}_chunk_{chunk_num}{chunk_suffix}")))
+                    chunk_rows = []
+                    while len(pending) > max_pending:
+                        _collect()
+
+            if chunk_rows:
                 chunk_num += 1
-                chunk_papers = []
-
-        if chunk_papers:
-            fn = f"{base_name}_chunk_{chunk_num}.json"
-            self._save_chunk(chunk_papers, fn)
-            created_files.append(fn)
-            logger.info("Saved: %s (%d papers)", fn, len(chunk_papers))
+                pending.append((chunk_num, _submit(chunk_rows, f"{chunk_base}_chunk_{chunk_num}{chunk_suffix}")))
+            while pending:
+                _collect()
+        finally:
+            if pool is not None:
+                pool.shutdown(cancel_futures=True)
 
         conn.close()
 
+        write_manifest(manifest_path, {
+            "format_version": MANIFEST_VERSION,
+            "mode": "delta" if since is not None else "full",
+            "since": since,
+            # A limited export leaves papers behind, so it cannot anchor a delta
+            "watermark": None if limit else watermark,
+            "filters": filters,
+            "papers": papers_written,
+            "chunks": [os.path.basename(f) for f in created_files],
+            "exported_at": datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ"),
+        })
+        logger.info("Manifest: %s", manifest_path)
+
         # GitHub tools summary
         tools_fn = f"{base_name}_github_tools.json"
         if github_tools_summary:
@@ -361,6 +508,148 @@ class JsonExporter:
         self._print_stats(stats, papers_written, created_files)
         return papers_written
 
+    # ------------------------------------------------------------------
+    # Row paging
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _export_columns(conn, all_columns: bool = False) -> List[str]:
+        """Return the papers columns to select, in table order."""
+        table_columns = [r[1] for r in conn.execute("PRAGMA table_info(papers)")]
+        if all_columns:
+            return table_columns
+        wanted = set(_EXPORT_COLUMNS)
+        return [c for c in table_columns if c in wanted]
+
+    @staticmethod
+    def _ensure_export_index(conn) -> bool:
+        """Create the index matching the export order; False if unavailable."""
+        try:
+            conn.execute(
+                f"CREATE INDEX IF NOT EXISTS {_EXPORT_ORDER_INDEX} ON papers"
+                "(citation_count DESC, priority_score DESC, year DESC)"
+            )
+            conn.commit()
+            return True
+        except sqlite3.OperationalError as exc:
+            logger.warning("Export index unavailable (%s); sorting without it", exc)
+            return False
+
+    @staticmethod
+    def _ensure_change_log(conn) -> Optional[int]:
+        """Install the paper change log; return its current watermark.
+
+        Returns None when the log cannot be created (e.g. a read-only DB).
+        """
+        try:
+            conn.executescript(_CHANGE_LOG_SQL)
+            return conn.execute("SELECT COALESCE(MAX(seq), 0) FROM paper_changes").fetchone()[0]
+        except sqlite3.OperationalError as exc:
+            logger.warning("Paper change log unavailable (%s); delta export disabled", exc)
+            return None
+
+    @staticmethod
+    def _change_log_watermark(conn) -> Optional[int]:
+        """Return the change log's current watermark, or None if the DB has
+        no change log.  Leaves the schema untouched."""
+        try:
+            return conn.execute("SELECT COALESCE(MAX(seq), 0) FROM paper_changes").fetchone()[0]
+        except sqlite3.OperationalError:
+            return None
+
+    @staticmethod
+    def _delta_since(previous: Optional[Dict], watermark: Optional[int],
+                     filters: Dict) -> Optional[int]:
+        """Return the watermark a delta export starts from, or None for a
+        full export (logging why)."""
+        if watermark is None:
+            return None
+        if not previous or previous.get("watermark") is None:
+            logger.info("No previous export watermark — running a full export")
+            return None
+        if previous.get("filters") != filters:
+            logger.info("Export options differ from the previous export — running a full export")
+            return None
+        if previous["watermark"] > watermark:
+            logger.warning("Previous watermark %d is ahead of the database (%d); "
+                           "running a full export", previous["watermark"], watermark)
+            return None
+        return previous["watermark"]
+
+    @staticmethod
+    def _keyset_ranges(last) -> List[Tuple[str, List[Any]]]:
+        """Return the index ranges holding the rows that sort after *last*.
+
+        The ranges are disjoint and listed in export order; each one is an
+        equality prefix plus one range (or IS NULL) term on the export-order
+        index, so SQLite seeks straight to it.  NULLs sort last under DESC:
+        a NULL sort key is only followed by rows that tie on it.
+        """
+        sort_cols = ("citation_count", "priority_score", "year")
+        ranges = [(
+            " AND ".join([f"{c} IS ?" for c in sort_cols] + ["id > ?"]),
+            [last[c] for c in sort_cols] + [last["id"]],
+        )]
+        for depth in range(len(sort_cols) - 1, -1, -1):
+            col = sort_cols[depth]
+            if last[col] is None:
+                continue
+            prefix = [f"{c} IS ?" for c in sort_cols[:depth]]
+            prefix_params = [last[c] for c in sort_cols[:depth]]
+            ranges.append((" AND ".join(prefix + [f"{col} < ?"]), prefix_params + [last[col]]))
+            ranges.append((" AND ".join(prefix + [f"{col} IS NULL"]), prefix_params))
+        return ranges
+
+    def _iter_rows(self, conn, columns: List[str], where: str,
+                   params: List[Any], limit: Optional[int]) -> Iterator[sqlite3.Row]:
+        """Yield matching rows in export order, one keyset page at a time.
+
+        Each page resumes after the last row of the previous one, walking the
+        export-order index instead of sorting the whole table up front.
+        """
+        source = "papers"
+        if self._ensure_export_index(conn):
+            source += f" INDEXED BY {_EXPORT_ORDER_INDEX}"
+        select = "SELECT %s FROM %s" % (", ".join(f'"{c}"' for c in columns), source)
+
+        remaining = limit if limit and limit > 0 else None
+        ranges = [("1=1", [])]
+        while remaining is None or remaining > 0:
+            page_size = _EXPORT_PAGE_SIZE if remaining is None else min(_EXPORT_PAGE_SIZE, remaining)
+            fetched = 0
+            last = None
+            for clause, range_params in ranges:
+                for row in conn.execute(
+                    f"{select} WHERE ({where}) AND {clause} ORDER BY {_EXPORT_ORDER} LIMIT ?",
+                    params + range_params + [page_size - fetched],
+                ):
+                    yield row
+                    fetched += 1
+                    last = row
+                if fetched >= page_size:
+                    break
+            if fetched < page_size:
+                return
+            if remaining is not None:
+                remaining -= fetched
+            ranges = self._keyset_ranges(last)
+
+    def _write_chunk(self, rows: List[Dict], filename: str, github_tools_map: Dict,
+                     strip_full_text: bool) -> Tuple[str, int, Dict]:
+        """Build the paper dicts for *rows* and write them as one chunk file.
+
+        Runs in a worker process when export() is given several workers.
+        Returns ``(filename, papers written, stats for this chunk)``.
+        """
+        stats = self._init_stats()
+        with ChunkWriter(filename) as writer:
+            for row_dict in rows:
+                paper = self._build_paper_dict(row_dict, github_tools_map,
+                                               strip_full_text=strip_full_text)
+                self._update_stats(stats, paper, row_dict)
+                writer.write(paper)
+        return filename, writer.count, stats
+
     # ------------------------------------------------------------------
     # Build the EXACT paper dict that WordPress expects
     # ------------------------------------------------------------------
@@ -801,11 +1090,6 @@ class JsonExporter:
     # Stats & file writing
     # ------------------------------------------------------------------
 
-    @staticmethod
-    def _save_chunk(papers: List[Dict], filename: str):
-        with open(filename, "w", encoding="utf-8") as f:
-            json.dump(papers, f, indent=2, ensure_ascii=False, default=str)
-
     @staticmethod
     def _init_stats() -> Dict:
         return {
@@ -828,6 +1112,11 @@ class JsonExporter:
             "from_methods": 0, "from_title_abstract": 0,
         }
 
+    @staticmethod
+    def _merge_stats(stats: Dict, chunk_stats: Dict):
+        for key, value in chunk_stats.items():
+            stats[key] = stats.get(key, 0) + value
+
     @staticmethod
     def _update_stats(stats: Dict, paper: Dict, row_dict: Dict):
         cc = paper.get("citation_count", 0) or 0
@@ -12,8 +12,11 @@ import json
 import logging
 import os
 import re
+import time
 from typing import Dict, List, Optional, Set
 
+from . import load_costs
+
 logger = logging.getLogger(__name__)
 
 _PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -36,6 +39,7 @@ def load_kb(kb_dir: str = None) -> Dict:
     if _kb is not None:
         return _kb
 
+    start = time.perf_counter()
     kb_dir = kb_dir or _DEFAULT_KB_DIR
     _kb = {
         "systems": [],
@@ -94,6 +98,7 @@ def load_kb(kb_dir: str = None) -> Dict:
     # Build derived indexes
     _build_indexes(_kb)
 
+    load_costs.record("Microscope knowledge base", time.perf_counter() - start)
     return _kb
 
 
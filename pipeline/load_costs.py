@@ -0,0 +1,75 @@
+"""
+Start-up cost accounting for lazily loaded components.
+
+Lookup tables, ontology dumps and API clients are loaded on first use
+rather than when the orchestrator is built.  Each load is timed here so a
+run can report where its start-up time actually went.
+
+Usage:
+    from pipeline import load_costs
+    with load_costs.timed("ROR dump (institution agent)"):
+        index = _parse_dump(path)
+    loader = load_costs.LazyLoad("FPbase lookup", self._load_local, path)
+    loader.ensure()   # loads (and times) on the first call only
+    for component, seconds in load_costs.breakdown():
+        print(component, seconds)
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Tuple
+
+_lock = threading.Lock()
+_costs: Dict[str, float] = {}
+
+
+def record(component: str, seconds: float) -> None:
+    """Add *seconds* to the running total for *component*."""
+    with _lock:
+        _costs[component] = _costs.get(component, 0.0) + seconds
+
+
+@contextmanager
+def timed(component: str) -> Iterator[None]:
+    """Time the enclosed block and record it under *component*."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record(component, time.perf_counter() - start)
+
+
+class LazyLoad:
+    """Call ``load(source)`` once, on the first ensure(), timed as *component*.
+
+    Thread-safe: concurrent first callers wait for the one load.  A
+    *source* of None means there is nothing to load.
+    """
+
+    def __init__(self, component: str, load: Callable[[Any], None], source: Any):
+        self.component = component
+        self._load = load
+        self._source = source
+        self._lock = threading.Lock()
+
+    def ensure(self) -> None:
+        if self._source is None:
+            return
+        with self._lock:
+            if self._source is not None:
+                with timed(self.component):
+                    self._load(self._source)
+                self._source = None
+
+
+def breakdown() -> List[Tuple[str, float]]:
+    """Return ``(component, seconds)`` pairs, most expensive first."""
+    with _lock:
+        return sorted(_costs.items(), key=lambda item: item[1], reverse=True)
+
+
+def reset() -> None:
+    """Forget all recorded costs."""
+    with _lock:
+        _costs.clear()
@@ -12,7 +12,9 @@ import logging
 import os
 import re
 import json
-from typing import Any, Dict, List, Optional, Set
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
 from .agents.base_agent import Extraction
 from .agents.technique_agent import TechniqueAgent
@@ -24,24 +26,21 @@ from .agents.sample_prep_agent import SamplePrepAgent
 from .agents.cell_line_agent import CellLineAgent
 from .agents.protocol_agent import ProtocolAgent
 from .agents.institution_agent import InstitutionAgent
-from .agents.pubtator_agent import PubTatorAgent
-from .agents.ollama_agent import OllamaVerificationAgent
-from .agents.openalex_agent import OpenAlexAgent
-from .agents.datacite_linker_agent import DataCiteLinkerAgent
 from .agents.rrid_validation_agent import RRIDValidationAgent
 from .parsing.section_extractor import PaperSections, from_pubmed_dict, three_tier_waterfall
 from .validation.tag_validator import TagValidator
 from .validation.api_validator import ApiValidator
 from .validation.identifier_normalizer import IdentifierNormalizer
-from .validation.ror_v2_client import RORv2Client
 from .validation.ontology_normalizer import OntologyNormalizer
 from .validation.local_lookup import LocalLookup
 from .role_classifier import RoleClassifier, EntityRole
+from . import load_costs
 
 logger = logging.getLogger(__name__)
 
 _PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 _DEFAULT_LOOKUP_PATH = os.path.join(_PROJECT_ROOT, "microhub_lookup_tables")
+_DEFAULT_RRID_CACHE_PATH = os.path.join(_PROJECT_ROOT, "rrid_cache.db")
 
 
 class PipelineOrchestrator:
@@ -55,25 +54,41 @@ class PipelineOrchestrator:
                  ollama_model: str = None,
                  use_role_classifier: bool = True,
                  use_three_tier_waterfall: bool = True,
-                 use_scihub_fallback: bool = True):
-
+                 use_scihub_fallback: bool = True,
+                 rrid_cache_path: Optional[str] = _DEFAULT_RRID_CACHE_PATH,
+                 local_lookup: Optional[LocalLookup] = None):
+        """
+        Parameters
+        ----------
+        local_lookup : LocalLookup, optional
+            Shared lookup-table index.  Pass the caller's instance so the
+            tables are loaded once per process; a new one is created when
+            omitted.
+
+        Components backed by large data files or network clients (the
+        institution agent's ROR dump, PubTator, the API validator, the
+        ontology normalizer, the RRID resolver) are built on first use, so
+        disabled or unused features cost nothing at start-up.  Their load
+        times are recorded in ``pipeline.load_costs``.
+        """
         if lookup_tables_path is None and os.path.isdir(_DEFAULT_LOOKUP_PATH):
             lookup_tables_path = _DEFAULT_LOOKUP_PATH
             logger.info("Auto-detected lookup tables at: %s", lookup_tables_path)
 
         # Resolve lookup table subdirectories
         lt = lookup_tables_path or ""
-        fpbase_path = os.path.join(lt, "fpbase") if lt else None
-        cellosaurus_path = os.path.join(lt, "cellosaurus") if lt else None
-        taxonomy_path = os.path.join(lt, "ncbi_taxonomy") if lt else None
-        ror_path = os.path.join(lt, "ror") if lt else None
-        fbbi_path = os.path.join(lt, "fbbi_ontology") if lt else None
-        pubtator_path = os.path.join(lt, "pubtator3") if lt else None
-
-        # Local-first lookup tables (ROR, Cellosaurus, Taxonomy, FPbase)
-        self.local_lookup = LocalLookup(lookup_dir=lt if lt else None)
-
-        # Extraction agents
+        self._fpbase_path = os.path.join(lt, "fpbase") if lt else None
+        self._cellosaurus_path = os.path.join(lt, "cellosaurus") if lt else None
+        self._taxonomy_path = os.path.join(lt, "ncbi_taxonomy") if lt else None
+        self._ror_path = os.path.join(lt, "ror") if lt else None
+        self._fbbi_path = os.path.join(lt, "fbbi_ontology") if lt else None
+        self._pubtator_path = os.path.join(lt, "pubtator3") if lt else None
+
+        # Local-first lookup tables (ROR, Cellosaurus, Taxonomy, FPbase);
+        # indexes load on first lookup
+        self.local_lookup = local_lookup or LocalLookup(lookup_dir=lt if lt else None)
+
+        # Extraction agents (pattern tables only — cheap to build)
         self.technique_agent = TechniqueAgent()
         self.equipment_agent = EquipmentAgent()
         self.fluorophore_agent = FluorophoreAgent()
@@ -82,22 +97,21 @@ class PipelineOrchestrator:
         self.sample_prep_agent = SamplePrepAgent()
         self.cell_line_agent = CellLineAgent()
         self.protocol_agent = ProtocolAgent()
-        self.institution_agent = InstitutionAgent(
-            local_lookup=self.local_lookup,
-            ror_local_path=ror_path,
-        )
 
-        # Supplemental: PubTator NLP-based extraction (with local lookup)
-        self.pubtator_agent = PubTatorAgent(
-            local_path=pubtator_path
-        ) if use_pubtator else None
-
-        # Ollama LLM verification (reads Methods, cross-checks regex results)
-        self.ollama_agent = None
-        if use_ollama:
-            self.ollama_agent = OllamaVerificationAgent(
-                model=ollama_model or None
-            )
+        # Lazily built components (see the properties below)
+        self._use_pubtator = use_pubtator
+        self._use_api_validation = use_api_validation
+        self._use_ollama = use_ollama
+        self._ollama_model = ollama_model
+        self._rrid_cache_path = rrid_cache_path
+        self._institution_agent = None
+        self._pubtator_agent = None
+        self._ollama_agent = None
+        self._api_validator = None
+        self._ror_client = None
+        self._ontology_normalizer = None
+        self._rrid_validator = None
+        self._init_lock = threading.Lock()
 
         # Role classifier for over-tagging prevention
         self.role_classifier = RoleClassifier() if use_role_classifier else None
@@ -106,33 +120,121 @@ class PipelineOrchestrator:
         self.use_three_tier_waterfall = use_three_tier_waterfall
         self.use_scihub_fallback = use_scihub_fallback
 
-        # SciHub stats (tracked per orchestrator lifetime)
+        # SciHub stats (tracked per orchestrator lifetime; updated from
+        # prefetch threads, hence the lock)
         self.scihub_attempted = 0
         self.scihub_success = 0
         self.scihub_segmented = 0
+        self._stats_lock = threading.Lock()
 
-        # Validation (with local lookups)
+        # Agent × section pairs run vs. skipped by the agents' prefilters
+        # (see BaseAgent.can_match())
+        self.sections_analyzed = 0
+        self.sections_skipped = 0
+
+        # Validation
         self.tag_validator = TagValidator(tag_dictionary_path)
-        self.api_validator = ApiValidator(
-            local_lookup=self.local_lookup,
-            fpbase_path=fpbase_path,
-            cellosaurus_path=cellosaurus_path,
-            taxonomy_path=taxonomy_path,
-        ) if use_api_validation else None
         self.id_normalizer = IdentifierNormalizer()
 
-        # ROR client (with local lookup)
-        self.ror_client = RORv2Client(local_path=ror_path, local_lookup=self.local_lookup)
+    # ------------------------------------------------------------------
+    # Lazily built components
+    # ------------------------------------------------------------------
 
-        # FBbi ontology normalization (with local lookup)
-        self.ontology_normalizer = OntologyNormalizer(local_path=fbbi_path)
+    @property
+    def institution_agent(self):
+        """Lazy-initialize the institution agent (loads the ROR dump on use)."""
+        if self._institution_agent is None:
+            with self._init_lock:
+                if self._institution_agent is None:
+                    self._institution_agent = InstitutionAgent(
+                        local_lookup=self.local_lookup,
+                        ror_local_path=self._ror_path,
+                    )
+        return self._institution_agent
+
+    @property
+    def pubtator_agent(self):
+        """Lazy-initialize PubTator NLP extraction (None when disabled)."""
+        if self._pubtator_agent is None and self._use_pubtator:
+            with self._init_lock:
+                if self._pubtator_agent is None:
+                    from .agents.pubtator_agent import PubTatorAgent
+                    self._pubtator_agent = PubTatorAgent(local_path=self._pubtator_path)
+        return self._pubtator_agent
+
+    @property
+    def ollama_agent(self):
+        """Lazy-initialize Ollama LLM verification (None when disabled).
+
+        Reads Methods and cross-checks the regex results.
+        """
+        if self._ollama_agent is None and self._use_ollama:
+            with self._init_lock:
+                if self._ollama_agent is None:
+                    from .agents.ollama_agent import OllamaVerificationAgent
+                    self._ollama_agent = OllamaVerificationAgent(
+                        model=self._ollama_model or None
+                    )
+        return self._ollama_agent
+
+    @property
+    def api_validator(self):
+        """Lazy-initialize API validation with local lookups (None when disabled)."""
+        if self._api_validator is None and self._use_api_validation:
+            with self._init_lock:
+                if self._api_validator is None:
+                    with load_costs.timed("API validator"):
+                        self._api_validator = ApiValidator(
+                            local_lookup=self.local_lookup,
+                            fpbase_path=self._fpbase_path,
+                            cellosaurus_path=self._cellosaurus_path,
+                            taxonomy_path=self._taxonomy_path,
+                        )
+        return self._api_validator
+
+    @property
+    def ror_client(self):
+        """Lazy-initialize the ROR v2 client (with local lookup)."""
+        if self._ror_client is None:
+            with self._init_lock:
+                if self._ror_client is None:
+                    from .validation.ror_v2_client import RORv2Client
+                    self._ror_client = RORv2Client(
+                        local_path=self._ror_path, local_lookup=self.local_lookup,
+                    )
+        return self._ror_client
+
+    @property
+    def ontology_normalizer(self):
+        """Lazy-initialize FBbi ontology normalization (with local lookup)."""
+        if self._ontology_normalizer is None:
+            with self._init_lock:
+                if self._ontology_normalizer is None:
+                    self._ontology_normalizer = OntologyNormalizer(
+                        local_path=self._fbbi_path
+                    )
+        return self._ontology_normalizer
 
-        # RRID validation agent (validates RRIDs against SciCrunch,
-        # cross-references against paper's software/cell line tags)
-        self.rrid_validator = RRIDValidationAgent()
+    @property
+    def rrid_validator(self):
+        """Lazy-initialize the RRID validation agent.
+
+        Validates RRIDs against SciCrunch and cross-references them against
+        the paper's software/cell line tags.  Resolver answers persist in
+        rrid_cache_path across runs.
+        """
+        if self._rrid_validator is None:
+            with self._init_lock:
+                if self._rrid_validator is None:
+                    with load_costs.timed("RRID resolver cache"):
+                        self._rrid_validator = RRIDValidationAgent(
+                            cache_path=self._rrid_cache_path
+                        )
+        return self._rrid_validator
 
     # ------------------------------------------------------------------
-    def process_paper(self, paper: Dict[str, Any]) -> Dict[str, Any]:
+    def process_paper(self, paper: Dict[str, Any],
+                      sections: Optional[PaperSections] = None) -> Dict[str, Any]:
         """Process a single paper dict and return agent-enriched results.
 
         Parameters
@@ -140,67 +242,66 @@ class PipelineOrchestrator:
         paper : dict
             A paper dict from the database (or existing JSON export).
             Must contain at least ``title`` and ``abstract``.
+        sections : PaperSections, optional
+            Sections already obtained via ``acquire_sections()`` (e.g. by
+            ``prefetch_sections()``).  Acquired here when omitted.
 
         Returns
         -------
         dict
             Extraction results keyed by category, ready for the exporter.
         """
-        # If paper has _segmented_* fields (from inline segmentation), use those
-        has_segmented = any(
-            paper.get(f"_segmented_{f}")
-            for f in ("methods", "results", "discussion", "figures",
-                       "data_availability")
-        )
+        if sections is None:
+            sections = self.acquire_sections(paper)
 
-        if has_segmented:
-            sections = self._build_from_segmented(paper)
-        elif self.use_three_tier_waterfall:
-            # Full-text acquisition: three-tier waterfall, with SciHub DOI fallback
-            sections = three_tier_waterfall(paper)
-        else:
-            sections = from_pubmed_dict(paper)
+        results = self._extract(paper, sections)
 
-        # SciHub DOI fallback — always try if the paper has no full text,
-        # regardless of what segments exist.  Segments derived from an
-        # abstract-only paper are thin; SciHub can provide the real body.
-        paper_has_fulltext = bool(
-            (paper.get("full_text") or "").strip()
-        )
-        if self.use_scihub_fallback and not paper_has_fulltext:
-            doi = paper.get("doi", "") or ""
-            if doi:
-                self.scihub_attempted += 1
-                from .parsing.scihub_fetcher import fetch_fulltext_via_scihub
-                scihub_text = fetch_fulltext_via_scihub(doi)
-                if scihub_text:
-                    self.scihub_success += 1
-                    # Segment the SciHub text so agents get methods/results,
-                    # not the raw full blob (which would cause over-tagging
-                    # from introduction/literature review sections).
-                    from .parsing.section_extractor import segment_fulltext
-                    seg = segment_fulltext(scihub_text)
-                    if seg.has_methods:
-                        self.scihub_segmented += 1
-                        sections = PaperSections(
-                            title=sections.title or paper.get("title", ""),
-                            abstract=sections.abstract or paper.get("abstract", ""),
-                            methods=seg.methods,
-                            results=seg.results or sections.results,
-                            discussion=seg.discussion or sections.discussion,
-                            figures=seg.figures or sections.figures,
-                            data_availability=seg.data_availability or sections.data_availability,
-                            full_text=scihub_text,
-                            metadata=paper,
-                        )
-                    else:
-                        # Could not segment — use full text as fallback
-                        sections.full_text = scihub_text
-                    logger.info(
-                        "SciHub fallback: DOI %s → %d chars (segmented=%s)",
-                        doi, len(scihub_text), "yes" if seg.has_methods else "no",
-                    )
+        # Post-extraction: validate tags against authoritative APIs
+        if self.api_validator:
+            self.api_validator.validate_paper(results)
+
+        return self._finish(paper, results)
+
+    def process_chunk(self, papers: List[Dict[str, Any]],
+                      ready: Optional[Iterable[Tuple[int, PaperSections]]] = None
+                      ) -> Iterator[Tuple[int, Dict[str, Any]]]:
+        """Process a chunk of papers, validating shared entities once.
+
+        Same results as calling ``process_paper()`` on each paper, but the
+        API validation runs as one chunk-level pass: every unique
+        fluorophore, RRID, ROR, organism and cell line across the chunk is
+        looked up once (see ``ApiValidator.validate_papers()``), so the
+        cost scales with the chunk's vocabulary rather than its size.
+
+        Parameters
+        ----------
+        papers : list of dict
+            The chunk's paper dicts.
+        ready : iterable of (index, PaperSections), optional
+            Sections per paper, e.g. from ``prefetch_sections()``.
+            Acquired sequentially when omitted.
+
+        Yields
+        ------
+        (index, results)
+            In the order *ready* produced the papers.
+        """
+        if ready is None:
+            ready = ((i, self.acquire_sections(paper))
+                     for i, paper in enumerate(papers))
+
+        extracted = [(idx, self._extract(papers[idx], sections))
+                     for idx, sections in ready]
+
+        if self.api_validator:
+            self.api_validator.validate_papers([results for _, results in extracted])
+
+        for idx, results in extracted:
+            yield idx, self._finish(papers[idx], results)
 
+    def _extract(self, paper: Dict[str, Any],
+                 sections: PaperSections) -> Dict[str, Any]:
+        """Agent extraction, PubTator merge and tag-dictionary filtering."""
         results = self._run_agents(sections, paper)
 
         # Supplemental: PubTator NLP-based extraction for papers with PMIDs
@@ -216,14 +317,14 @@ class PipelineOrchestrator:
                 results[category] = self.tag_validator.filter_valid(
                     category, results[category]
                 )
+        return results
 
-        # Post-extraction: validate tags against authoritative APIs
-        if self.api_validator:
-            self.api_validator.validate_paper(results)
-
+    def _finish(self, paper: Dict[str, Any],
+                results: Dict[str, Any]) -> Dict[str, Any]:
+        """Post-validation steps: RRIDs, Ollama, ontology, identifiers, rescans."""
         # Post-extraction: validate RRIDs against SciCrunch and
         # cross-reference with extracted software/cell line tags
-        if self.rrid_validator and results.get("rrids"):
+        if results.get("rrids") and self.rrid_validator:
             self.rrid_validator.validate(results)
 
         # Post-extraction: Ollama LLM verification of Methods section
@@ -242,7 +343,7 @@ class PipelineOrchestrator:
         # The _role_classification report is already in results if enabled.
 
         # Post-extraction: FBbi ontology normalization for techniques
-        if self.ontology_normalizer and results.get("microscopy_techniques"):
+        if results.get("microscopy_techniques") and self.ontology_normalizer:
             results["_technique_ontology"] = (
                 self.ontology_normalizer.enrich_techniques(
                     results["microscopy_techniques"]
@@ -264,6 +365,114 @@ class PipelineOrchestrator:
 
         return results
 
+    def acquire_sections(self, paper: Dict[str, Any]) -> PaperSections:
+        """Build the paper's sections, fetching full text when needed.
+
+        Uses step-2b ``_segmented_*`` fields when present; otherwise runs
+        the three-tier waterfall, then the SciHub DOI fallback for papers
+        without full text.  This is the network-bound part of
+        ``process_paper()`` and is safe to call from worker threads.
+        """
+        if self._has_segmented(paper):
+            sections = self._build_from_segmented(paper)
+        elif self.use_three_tier_waterfall:
+            # Full-text acquisition: three-tier waterfall, with SciHub DOI fallback
+            sections = three_tier_waterfall(paper)
+        else:
+            sections = from_pubmed_dict(paper)
+
+        # SciHub DOI fallback — always try if the paper has no full text,
+        # regardless of what segments exist.  Segments derived from an
+        # abstract-only paper are thin; SciHub can provide the real body.
+        paper_has_fulltext = bool(
+            (paper.get("full_text") or "").strip()
+        )
+        if self.use_scihub_fallback and not paper_has_fulltext:
+            doi = paper.get("doi", "") or ""
+            if doi:
+                with self._stats_lock:
+                    self.scihub_attempted += 1
+                from .parsing.scihub_fetcher import fetch_fulltext_via_scihub
+                scihub_text = fetch_fulltext_via_scihub(doi)
+                if scihub_text:
+                    with self._stats_lock:
+                        self.scihub_success += 1
+                    # Segment the SciHub text so agents get methods/results,
+                    # not the raw full blob (which would cause over-tagging
+                    # from introduction/literature review sections).
+                    from .parsing.section_extractor import segment_fulltext
+                    seg = segment_fulltext(scihub_text)
+                    if seg.has_methods:
+                        with self._stats_lock:
+                            self.scihub_segmented += 1
+                        sections = PaperSections(
+                            title=sections.title or paper.get("title", ""),
+                            abstract=sections.abstract or paper.get("abstract", ""),
+                            methods=seg.methods,
+                            results=seg.results or sections.results,
+                            discussion=seg.discussion or sections.discussion,
+                            figures=seg.figures or sections.figures,
+                            data_availability=seg.data_availability or sections.data_availability,
+                            full_text=scihub_text,
+                            metadata=paper,
+                        )
+                    else:
+                        # Could not segment — use full text as fallback
+                        sections.full_text = scihub_text
+                    logger.info(
+                        "SciHub fallback: DOI %s → %d chars (segmented=%s)",
+                        doi, len(scihub_text), "yes" if seg.has_methods else "no",
+                    )
+
+        return sections
+
+    def needs_fulltext_fetch(self, paper: Dict[str, Any]) -> bool:
+        """True if ``acquire_sections()`` will make network calls for this paper."""
+        if not self._has_segmented(paper) and self.use_three_tier_waterfall:
+            return True
+        return bool(
+            self.use_scihub_fallback
+            and not (paper.get("full_text") or "").strip()
+            and paper.get("doi")
+        )
+
+    def prefetch_sections(self, papers: List[Dict[str, Any]],
+                          max_workers: int = 4) -> Iterator[Tuple[int, PaperSections]]:
+        """Acquire sections for a chunk of papers concurrently.
+
+        Fetches are submitted to worker threads first; papers that need no
+        network access are then yielded while those run, followed by the
+        fetched papers in completion order, so extraction of ready papers
+        overlaps with slow Europe PMC / GROBID / SciHub responses.  A fetch
+        that fails yields the paper's abstract-only sections instead.
+        """
+        pending = []
+        if max_workers > 1:
+            pending = [i for i, paper in enumerate(papers) if self.needs_fulltext_fetch(paper)]
+        if not pending:
+            for i, paper in enumerate(papers):
+                yield i, self.acquire_sections(paper)
+            return
+
+        fetched = set(pending)
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futures = {
+                pool.submit(self.acquire_sections, papers[i]): i
+                for i in pending
+            }
+            for i, paper in enumerate(papers):
+                if i not in fetched:
+                    yield i, self.acquire_sections(paper)
+            for future in as_completed(futures):
+                i = futures[future]
+                try:
+                    sections = future.result()
+                except Exception as exc:
+                    logger.warning("Full-text fetch failed for %s (%s); using abstract only",
+                                   papers[i].get("doi") or papers[i].get("pmid") or "paper", exc)
+                    sections = from_pubmed_dict(papers[i])
+                yield i, sections
+
     def process_sections(self, sections: PaperSections) -> Dict[str, Any]:
         """Process pre-parsed PaperSections."""
         return self._run_agents(sections, sections.metadata)
@@ -654,10 +863,22 @@ class PipelineOrchestrator:
     # ------------------------------------------------------------------
 
     def _run_on_sections(self, agent, sections: PaperSections) -> List[Extraction]:
-        """Run an agent over all available sections and merge results."""
+        """Run an agent over all available sections and merge results.
+
+        Sections that fail the agent's prefilter cannot yield an extraction
+        and are skipped without running its patterns.
+        """
         all_exts: List[Extraction] = []
+        analyzed = skipped = 0
         for text, sec_type in self._section_texts(sections):
+            if not agent.can_match(text):
+                skipped += 1
+                continue
+            analyzed += 1
             all_exts.extend(agent.analyze(text, sec_type))
+        with self._stats_lock:
+            self.sections_analyzed += analyzed
+            self.sections_skipped += skipped
         return agent._deduplicate(all_exts)
 
     @staticmethod
@@ -671,20 +892,23 @@ class PipelineOrchestrator:
         yield from sections.taggable_sections()
 
     @staticmethod
-    def _build_from_segmented(paper: Dict[str, Any]) -> PaperSections:
+    def _has_segmented(paper: Dict[str, Any]) -> bool:
+        """True if the paper carries _segmented_* fields (step 2b / inline)."""
+        return any(
+            paper.get(f"_segmented_{f}")
+            for f in ("methods", "results", "discussion", "figures",
+                       "data_availability")
+        )
+
+    @classmethod
+    def _build_from_segmented(cls, paper: Dict[str, Any]) -> PaperSections:
         """Build PaperSections from _segmented_* fields added by step 2b.
 
         If segmented fields are present, uses them for methods/results/etc.
         instead of the raw full_text.  This ensures agents only see
         citation-stripped, reference-stripped, introduction-excluded text.
         """
-        has_segmented = any(
-            paper.get(f"_segmented_{f}")
-            for f in ("methods", "results", "discussion", "figures",
-                       "data_availability")
-        )
-
-        if has_segmented:
+        if cls._has_segmented(paper):
             return PaperSections(
                 title=paper.get("title", "") or "",
                 abstract=paper.get("abstract", "") or "",
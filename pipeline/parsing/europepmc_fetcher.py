@@ -19,11 +19,14 @@ Usage:
 """
 
 import logging
-import re
 import time
 import xml.etree.ElementTree as ET
 from typing import Any, Dict, List, Optional, Tuple
 
+from .. import rate_limit
+from .heading_classifier import classify_heading
+from .oa_archive import OAFullTextStore, default_oa_store
+
 logger = logging.getLogger(__name__)
 
 try:
@@ -35,9 +38,6 @@ except ImportError:
 # Europe PMC REST API base
 _EPMC_BASE = "https://www.ebi.ac.uk/europepmc/webservices/rest"
 
-# Rate limiting -- Europe PMC has no formal limit but recommends reasonable use
-_REQUEST_DELAY = 0.2
-
 
 def _retry_get(url: str, params: Dict = None, retries: int = 3,
                timeout: int = 30, accept: str = None) -> Optional["requests.Response"]:
@@ -49,6 +49,7 @@ def _retry_get(url: str, params: Dict = None, retries: int = 3,
         headers["Accept"] = accept
     for attempt in range(retries):
         try:
+            rate_limit.wait_for_url(url)
             resp = requests.get(url, params=params, headers=headers, timeout=timeout)
             if resp.status_code == 200:
                 return resp
@@ -82,43 +83,22 @@ _JATS_SECTION_TYPE_MAP = {
     "data availability": "data_availability",
 }
 
-# Heading-based fallback classification
-_HEADING_PATTERNS = {
-    "methods": re.compile(
-        r"method|material|experimental|procedure|microscopy|imaging|"
-        r"sample\s+prep|staining|immunofluorescence|cell\s+culture",
-        re.I,
-    ),
-    "results": re.compile(r"result|finding", re.I),
-    "introduction": re.compile(r"introduction|background", re.I),
-    "discussion": re.compile(r"discussion|conclusion|summary", re.I),
-    "data_availability": re.compile(
-        r"data\s+(?:and\s+(?:code|software)\s+)?availability|"
-        r"code\s+availability|accession\s+(?:codes?|numbers?)",
-        re.I,
-    ),
-    "figures": re.compile(r"figure|fig\.|table", re.I),
-    "references": re.compile(r"references?|bibliography|works\s+cited", re.I),
-}
-
-
 class EuropePMCFetcher:
-    """Fetch and parse full-text articles from Europe PMC."""
+    """Fetch and parse full-text articles from Europe PMC.
 
-    def __init__(self):
-        self._last_call = 0.0
+    Full-text XML is served from a local open-access archive store
+    (see oa_archive) when the article is in it; only misses go to the API.
+    """
 
-    def _rate_limit(self):
-        elapsed = time.time() - self._last_call
-        if elapsed < _REQUEST_DELAY:
-            time.sleep(_REQUEST_DELAY - elapsed)
+    def __init__(self, local_store: Optional[OAFullTextStore] = None):
+        self._local_store = local_store if local_store is not None else default_oa_store()
 
     # ------------------------------------------------------------------
     # Full-text retrieval
     # ------------------------------------------------------------------
 
     def fetch_fulltext_xml(self, pmc_id: str) -> Optional[str]:
-        """Fetch JATS XML full text from Europe PMC.
+        """Fetch JATS XML full text, from the local OA store or Europe PMC.
 
         Parameters
         ----------
@@ -134,9 +114,13 @@ class EuropePMCFetcher:
         if not pmc_id:
             return None
 
-        self._rate_limit()
+        if self._local_store is not None:
+            xml_text = self._local_store.get_xml(pmc_id)
+            if xml_text is not None:
+                logger.debug("Europe PMC: %s served from local OA archive", pmc_id)
+                return xml_text
+
         resp = _retry_get(f"{_EPMC_BASE}/{pmc_id}/fullTextXML")
-        self._last_call = time.time()
 
         if resp is None:
             return None
@@ -156,85 +140,22 @@ class EuropePMCFetcher:
 
     @staticmethod
     def parse_jats_xml(xml_text: str) -> List[Dict[str, str]]:
-        """Parse JATS XML into structured section dicts."""
-        sections: List[Dict[str, str]] = []
+        """Parse JATS XML into structured section dicts.
+
+        Streams the document through expat (see _JatsSectionCollector)
+        instead of building an element tree.  Returns, in order: abstracts,
+        body sections with paragraph text, then one "Figure Captions" and
+        one "Table Captions" section.
+        """
+        collector = _JatsSectionCollector()
+        parser = ET.XMLParser(target=collector)
         try:
-            root = ET.fromstring(xml_text)
+            parser.feed(xml_text)
+            parser.close()
         except ET.ParseError:
             logger.warning("Failed to parse JATS XML")
-            return sections
-
-        # Abstract
-        for abstract in root.findall(".//abstract"):
-            text = _recursive_text(abstract).strip()
-            if text:
-                sections.append({
-                    "heading": "Abstract",
-                    "text": text,
-                    "type": "abstract",
-                })
-
-        # Body sections -- use sec-type attribute first, then heading heuristic
-        for sec in root.findall(".//body//sec"):
-            heading_el = sec.find("title")
-            heading = _element_text(heading_el) if heading_el is not None else ""
-
-            # Collect paragraph text (skip nested <sec> elements)
-            paragraphs = []
-            for p in sec.findall("p"):
-                t = _recursive_text(p).strip()
-                if t:
-                    paragraphs.append(t)
-            if not paragraphs:
-                continue
-
-            # Determine section type
-            sec_type = sec.get("sec-type", "")
-            section_type = _JATS_SECTION_TYPE_MAP.get(
-                sec_type.lower(), _classify_heading(heading)
-            )
-
-            sections.append({
-                "heading": heading,
-                "text": " ".join(paragraphs),
-                "type": section_type,
-            })
-
-        # Figure captions
-        fig_captions = []
-        for fig in root.findall(".//fig"):
-            caption = fig.find("caption")
-            if caption is not None:
-                text = _recursive_text(caption).strip()
-                if text:
-                    label_el = fig.find("label")
-                    label = _element_text(label_el) if label_el is not None else ""
-                    fig_captions.append(f"{label} {text}".strip())
-        if fig_captions:
-            sections.append({
-                "heading": "Figure Captions",
-                "text": " ".join(fig_captions),
-                "type": "figures",
-            })
-
-        # Table captions
-        table_captions = []
-        for table_wrap in root.findall(".//table-wrap"):
-            caption = table_wrap.find("caption")
-            if caption is not None:
-                text = _recursive_text(caption).strip()
-                if text:
-                    label_el = table_wrap.find("label")
-                    label = _element_text(label_el) if label_el is not None else ""
-                    table_captions.append(f"{label} {text}".strip())
-        if table_captions:
-            sections.append({
-                "heading": "Table Captions",
-                "text": " ".join(table_captions),
-                "type": "figures",  # treat same as figures
-            })
-
-        return sections
+            return []
+        return collector.sections()
 
     # ------------------------------------------------------------------
     # Annotations API
@@ -265,9 +186,7 @@ class EuropePMCFetcher:
         if types:
             params["type"] = ",".join(types)
 
-        self._rate_limit()
         resp = _retry_get(f"{_EPMC_BASE}/annotations", params=params)
-        self._last_call = time.time()
 
         if resp is None:
             return []
@@ -315,7 +234,6 @@ class EuropePMCFetcher:
         -------
         dict with keys: results (list), next_cursor (str or None), hit_count (int)
         """
-        self._rate_limit()
         resp = _retry_get(
             f"{_EPMC_BASE}/search",
             params={
@@ -326,7 +244,6 @@ class EuropePMCFetcher:
                 "format": "json",
             },
         )
-        self._last_call = time.time()
 
         if resp is None:
             return {"results": [], "next_cursor": None, "hit_count": 0}
@@ -406,22 +323,131 @@ class EuropePMCFetcher:
 
 
 # ======================================================================
-# XML helpers
+# Streaming JATS section extraction
 # ======================================================================
 
-def _element_text(el: Optional[ET.Element]) -> str:
-    if el is None:
-        return ""
-    return "".join(el.itertext()).strip()
+_JATS_WATCHED_TAGS = frozenset(("abstract", "body", "sec", "fig", "table-wrap"))
+_PLAIN_FRAME = (None, None)
 
 
-def _recursive_text(el: ET.Element) -> str:
-    return "".join(el.itertext())
+class _JatsSectionCollector:
+    """XMLParser target that collects JATS section text as the XML streams.
 
+    No element tree is built.  Character data is kept only while inside
+    an element whose text is wanted — an <abstract>, the <title> and <p>
+    children of a <sec> under <body>, the <caption> and <label> of a
+    <fig> or <table-wrap> — and is joined once when that element closes.
+    Everything else (table bodies, reference lists, formulas) is dropped
+    as it is read.  Each record is filled in when its element closes, in a
+    slot reserved when it opened, so records keep document order.
 
-def _classify_heading(heading: str) -> str:
-    """Classify a section heading into a standard type."""
-    for stype, pattern in _HEADING_PATTERNS.items():
-        if pattern.search(heading):
-            return stype
-    return "other"
+    Each text equals ``"".join(el.itertext()).strip()`` of the same element
+    in a fully built tree.
+    """
+
+    def __init__(self):
+        # One (kind, state) frame per open element
+        self._stack: List[Tuple[Optional[str], Any]] = []
+        self._buffers: List[List[str]] = []
+        self._body_depth = 0
+        self._abstracts: List[str] = []
+        self._secs: List[Optional[Dict[str, str]]] = []
+        self._captions: Dict[str, List[Optional[str]]] = {"fig": [], "table-wrap": []}
+
+    def start(self, tag: str, attrib: Dict[str, str]) -> None:
+        stack = self._stack
+        # Fast path for the vast majority of elements.  Like a ".//abstract"
+        # search, the root element itself is never a match.
+        if not stack or (tag not in _JATS_WATCHED_TAGS
+                         and stack[-1][0] not in ("sec", "float")):
+            stack.append(_PLAIN_FRAME)
+            return
+        parent_kind, parent_state = stack[-1]
+        kind, state = None, None
+        if tag == "abstract":
+            kind, state = "abstract", len(self._abstracts)
+            self._abstracts.append("")
+        elif tag == "body":
+            kind = "body"
+            self._body_depth += 1
+        elif tag == "sec" and self._body_depth:
+            kind = "sec"
+            state = {"slot": len(self._secs), "sec_type": attrib.get("sec-type", ""),
+                     "heading": None, "paragraphs": []}
+            self._secs.append(None)
+        elif tag in self._captions:
+            kind = "float"
+            state = {"slot": len(self._captions[tag]), "caption": None, "label": None}
+            self._captions[tag].append(None)
+        elif parent_kind == "sec":
+            if tag == "p" or (tag == "title" and parent_state["heading"] is None):
+                kind = tag
+                if tag == "title":
+                    parent_state["heading"] = ""
+        elif parent_kind == "float" and tag in ("caption", "label"):
+            if parent_state[tag] is None:
+                kind = tag
+                parent_state[tag] = ""
+        if kind in ("abstract", "p", "title", "caption", "label"):
+            self._buffers.append([])
+        stack.append((kind, state))
+
+    def data(self, text: str) -> None:
+        for buf in self._buffers:
+            buf.append(text)
+
+    def end(self, tag: str) -> None:
+        kind, state = self._stack.pop()
+        if kind is None:
+            return
+        if kind == "body":
+            self._body_depth -= 1
+            return
+        if kind == "sec":
+            if state["paragraphs"]:
+                heading = state["heading"] or ""
+                self._secs[state["slot"]] = {
+                    "heading": heading,
+                    "text": " ".join(state["paragraphs"]),
+                    "type": _JATS_SECTION_TYPE_MAP.get(
+                        state["sec_type"].lower(), classify_heading(heading)
+                    ),
+                }
+            return
+        if kind == "float":
+            if state["caption"]:
+                self._captions[tag][state["slot"]] = (
+                    "%s %s" % (state["label"] or "", state["caption"])).strip()
+            return
+
+        text = "".join(self._buffers.pop()).strip()
+        if kind == "abstract":
+            self._abstracts[state] = text
+            return
+        parent_state = self._stack[-1][1]
+        if kind == "p":
+            if text:
+                parent_state["paragraphs"].append(text)
+        elif kind == "title":
+            parent_state["heading"] = text
+        else:  # caption / label
+            parent_state[kind] = text
+
+    def close(self) -> None:
+        pass
+
+    def sections(self) -> List[Dict[str, str]]:
+        sections = [
+            {"heading": "Abstract", "text": text, "type": "abstract"}
+            for text in self._abstracts if text
+        ]
+        sections.extend(sec for sec in self._secs if sec is not None)
+        for tag, heading in (("fig", "Figure Captions"), ("table-wrap", "Table Captions")):
+            captions = [c for c in self._captions[tag] if c]
+            if captions:
+                sections.append({
+                    "heading": heading,
+                    "text": " ".join(captions),
+                    "type": "figures",
+                })
+        return sections
@@ -5,6 +5,12 @@ Converts PDFs into structured section-tagged text via a running GROBID
 service (Docker recommended).  Falls back gracefully when GROBID is
 unavailable.
 
+All parsers for one GROBID URL share a GrobidPool, which keeps at most
+``concurrency`` requests in flight — set it to the server's processing
+thread count (``concurrency`` in grobid.yaml) with set_grobid_concurrency().
+When GROBID answers 503 (its queue is full) every worker holds off for the
+server's Retry-After, or an exponential backoff, before retrying.
+
 Usage::
 
     parser = GrobidParser("http://localhost:8070")
@@ -14,6 +20,8 @@ Usage::
 
 import re
 import logging
+import threading
+import time
 from typing import Dict, List, Optional
 
 logger = logging.getLogger(__name__)
@@ -54,22 +62,139 @@ def _classify_heading(heading: str) -> str:
     return "other"
 
 
-class GrobidParser:
-    """Parse PDFs into structured sections via GROBID REST API."""
+DEFAULT_CONCURRENCY = 4   # requests in flight per server; see set_grobid_concurrency()
+_MAX_RETRIES = 5          # 503 retries per PDF before giving up
+_BACKOFF_BASE = 2.0       # seconds; doubled on each consecutive 503
+_BACKOFF_MAX = 60.0
+_ALIVE_TTL = 60.0         # seconds an is_available() answer is reused
+_REQUEST_TIMEOUT = 120
 
-    def __init__(self, grobid_url: str = "http://localhost:8070"):
+
+class GrobidPool:
+    """Bounded, backpressure-aware access to one GROBID server.
+
+    A semaphore caps the requests in flight at *concurrency*.  A 503 sets a
+    pause shared by all threads: nobody sends until it has passed, so a
+    saturated server drains instead of being hammered by retries.
+    """
+
+    def __init__(self, grobid_url: str, concurrency: int = DEFAULT_CONCURRENCY,
+                 max_retries: int = _MAX_RETRIES):
         self.grobid_url = grobid_url.rstrip("/")
+        self.concurrency = max(1, concurrency)
+        self.max_retries = max_retries
+        self._slots = threading.BoundedSemaphore(self.concurrency)
+        self._lock = threading.Lock()
+        self._paused_until = 0.0
+        self._consecutive_503 = 0
+        self._alive: Optional[bool] = None
+        self._alive_checked = 0.0
 
     # ------------------------------------------------------------------
     def is_available(self) -> bool:
-        """Check whether the GROBID service is reachable."""
+        """Check whether the GROBID service is reachable (cached briefly)."""
         if not HAS_REQUESTS:
             return False
+        now = time.monotonic()
+        with self._lock:
+            if self._alive is not None and now - self._alive_checked < _ALIVE_TTL:
+                return self._alive
         try:
             resp = requests.get(f"{self.grobid_url}/api/isalive", timeout=5)
-            return resp.status_code == 200
+            alive = resp.status_code == 200
         except Exception:
-            return False
+            alive = False
+        with self._lock:
+            self._alive, self._alive_checked = alive, time.monotonic()
+        return alive
+
+    # ------------------------------------------------------------------
+    def process_fulltext(self, pdf_path: str) -> Optional[str]:
+        """POST a PDF to processFulltextDocument; return the TEI or None."""
+        for attempt in range(self.max_retries + 1):
+            self._wait_for_pause()
+            with self._slots:
+                # A pause may have started while this thread queued for a slot
+                self._wait_for_pause()
+                try:
+                    with open(pdf_path, "rb") as f:
+                        resp = requests.post(
+                            f"{self.grobid_url}/api/processFulltextDocument",
+                            files={"input": f},
+                            data={"segmentSentences": "1"},
+                            timeout=_REQUEST_TIMEOUT,
+                        )
+                except Exception as exc:
+                    logger.warning("GROBID call failed: %s", exc)
+                    return None
+            if resp.status_code == 200:
+                with self._lock:
+                    self._consecutive_503 = 0
+                return resp.text
+            if resp.status_code != 503:
+                logger.warning("GROBID returned status %d", resp.status_code)
+                return None
+            if attempt < self.max_retries:
+                self._back_off(resp.headers.get("Retry-After"))
+        logger.warning("GROBID still busy after %d retries; skipping %s",
+                       self.max_retries, pdf_path)
+        return None
+
+    # ------------------------------------------------------------------
+    def _wait_for_pause(self) -> None:
+        while True:
+            with self._lock:
+                delay = self._paused_until - time.monotonic()
+            if delay <= 0:
+                return
+            time.sleep(delay)
+
+    def _back_off(self, retry_after: Optional[str]) -> None:
+        with self._lock:
+            self._consecutive_503 += 1
+            try:
+                delay = float(retry_after)
+            except (TypeError, ValueError):
+                delay = _BACKOFF_BASE * 2 ** (self._consecutive_503 - 1)
+            delay = min(max(delay, 0.0), _BACKOFF_MAX)
+            self._paused_until = max(self._paused_until, time.monotonic() + delay)
+        logger.debug("GROBID busy (503); pausing requests for %.1fs", delay)
+
+
+_pools_lock = threading.Lock()
+_pools: Dict[str, GrobidPool] = {}
+_concurrency = DEFAULT_CONCURRENCY
+
+
+def set_grobid_concurrency(concurrency: int) -> None:
+    """Allow *concurrency* simultaneous requests per GROBID server from now on."""
+    global _concurrency
+    with _pools_lock:
+        _concurrency = max(1, concurrency)
+        _pools.clear()
+
+
+def get_grobid_pool(grobid_url: str) -> GrobidPool:
+    """Return the shared pool for *grobid_url*, creating it on first use."""
+    key = grobid_url.rstrip("/")
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = _pools[key] = GrobidPool(key, _concurrency)
+        return pool
+
+
+class GrobidParser:
+    """Parse PDFs into structured sections via GROBID REST API."""
+
+    def __init__(self, grobid_url: str = "http://localhost:8070"):
+        self.grobid_url = grobid_url.rstrip("/")
+        self.pool = get_grobid_pool(self.grobid_url)
+
+    # ------------------------------------------------------------------
+    def is_available(self) -> bool:
+        """Check whether the GROBID service is reachable."""
+        return self.pool.is_available()
 
     # ------------------------------------------------------------------
     def parse_pdf(self, pdf_path: str) -> List[Dict[str, str]]:
@@ -95,25 +220,22 @@ class GrobidParser:
         """Return the raw TEI XML string from GROBID."""
         return self._call_grobid(pdf_path)
 
+    # ------------------------------------------------------------------
+    def parse_tei(self, tei_xml: str) -> List[Dict[str, str]]:
+        """Return structured sections from TEI XML GROBID already produced."""
+        if not HAS_BS4:
+            logger.warning("beautifulsoup4 not installed -- cannot parse GROBID TEI")
+            return []
+        return self._parse_tei(tei_xml)
+
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
 
     def _call_grobid(self, pdf_path: str) -> Optional[str]:
-        try:
-            with open(pdf_path, "rb") as f:
-                resp = requests.post(
-                    f"{self.grobid_url}/api/processFulltextDocument",
-                    files={"input": f},
-                    data={"segmentSentences": "1"},
-                    timeout=120,
-                )
-            if resp.status_code == 200:
-                return resp.text
-            logger.warning("GROBID returned status %d", resp.status_code)
-        except Exception as exc:
-            logger.warning("GROBID call failed: %s", exc)
-        return None
+        if not HAS_REQUESTS:
+            return None
+        return self.pool.process_fulltext(pdf_path)
 
     def _parse_tei(self, tei_xml: str) -> List[Dict[str, str]]:
         """Extract sections from GROBID TEI XML."""
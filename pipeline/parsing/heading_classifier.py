@@ -0,0 +1,280 @@
+"""
+Shared section-heading classifier.
+
+Maps a section heading ("2.1 Materials and Methods", "Cell culture and
+transfection", "Data Availability Statement") to a canonical section type:
+abstract, introduction, methods, results, discussion, figures,
+data_availability, supplementary, acknowledgements, references or other.
+Both the heuristic full-text segmenter (section_extractor) and the JATS
+parser (europepmc_fetcher) classify through here.
+
+Headings are split into lowercase word tokens ("&" reads as "and"; digits
+and punctuation are dropped) and matched against a token trie of known
+heading phrases:
+
+  - the earliest phrase in the heading wins, the longest one at that token
+    (so a whole-heading match always beats a partial one);
+  - no phrase at all → "other".
+
+Matching is by whole words: "imaging" does not match "bioimaging", so
+compound words that should classify are listed as keywords themselves.
+
+Phrases come in two kinds.  *Headings* are complete section titles, and
+match_heading() only detects those when segmenting plain text.  *Keywords*
+("materials", "imaging", "tables") only help classify longer headings,
+since a line reading "Table" in extracted text is rarely a section title.
+
+A heading is classified in time proportional to its token count, and
+results are memoised by heading string — headings repeat enormously
+across the corpus.
+
+Usage:
+    from pipeline.parsing.heading_classifier import classify_heading
+    classify_heading("2. Materials & Methods")   # → "methods"
+"""
+
+import re
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
+
+# Complete section titles → section type.  Together these are exactly the
+# headings match_heading() detects in plain text.
+HEADING_TYPES = {
+    "abstract": "abstract",
+    "introduction": "introduction",
+    "background": "introduction",
+    "methods": "methods",
+    "method": "methods",
+    "materials and methods": "methods",
+    "materials and method": "methods",
+    "material and methods": "methods",
+    "material and method": "methods",
+    "methods and materials": "methods",
+    "methods and material": "methods",
+    "method and materials": "methods",
+    "method and material": "methods",
+    "experimental procedures": "methods",
+    "experimental procedure": "methods",
+    "experimental section": "methods",
+    "experimental methods": "methods",
+    "experimental method": "methods",
+    "experimental design": "methods",
+    "online methods": "methods",
+    "online method": "methods",
+    "extended methods": "methods",
+    "extended method": "methods",
+    "star methods": "methods",
+    "star method": "methods",
+    "lead contact methods": "methods",
+    "lead contact method": "methods",
+    "image acquisition": "methods",
+    "image analysis": "methods",
+    "image processing": "methods",
+    "microscopy": "methods",
+    "sample preparation": "methods",
+    "specimen preparation": "methods",
+    "cell culture": "methods",
+    "tissue culture": "methods",
+    "statistical analysis": "methods",
+    "data analysis": "methods",
+    "immunofluorescence": "methods",
+    "immunofluorescence staining": "methods",
+    "immunofluorescence microscopy": "methods",
+    "immunohistochemistry": "methods",
+    "western blotting": "methods",
+    "western blot": "methods",
+    "confocal microscopy": "methods",
+    "fluorescence microscopy": "methods",
+    "electron microscopy": "methods",
+    "light microscopy": "methods",
+    "key resources table": "methods",
+    "results": "results",
+    "result": "results",
+    "results and discussion": "results",
+    "result and discussion": "results",
+    "discussion": "discussion",
+    "conclusions": "discussion",
+    "conclusion": "discussion",
+    "summary": "discussion",
+    "acknowledgements": "acknowledgements",
+    "acknowledgments": "acknowledgements",
+    "acknowledgement": "acknowledgements",
+    "acknowledgment": "acknowledgements",
+    "references": "references",
+    "reference": "references",
+    "bibliography": "references",
+    "works cited": "references",
+    "literature cited": "references",
+    "author contributions": "other",
+    "author contribution": "other",
+    "competing interests": "other",
+    "competing interest": "other",
+    "conflict of interests": "other",
+    "conflict of interest": "other",
+    "ethics statement": "other",
+    "ethics approval": "other",
+    "ethics declaration": "other",
+    "funding": "other",
+    "funding information": "other",
+    "funding sources": "other",
+    "funding source": "other",
+    "funding statement": "other",
+    "figure legends": "figures",
+    "figure legend": "figures",
+    "additional data": "other",
+    "additional information": "other",
+    "extended data": "other",
+    "extended information": "other",
+    "reporting summary": "other",
+    "supplementary information": "supplementary",
+    "supplementary data": "supplementary",
+    "supplementary materials": "supplementary",
+    "supplementary material": "supplementary",
+    "supplementary methods": "methods",
+    "supplementary method": "methods",
+    "supplementary figures": "figures",
+    "supplementary figure": "figures",
+    "supplementary tables": "other",
+    "supplementary table": "other",
+    "supporting information": "supplementary",
+    "supporting data": "supplementary",
+    "supporting materials": "supplementary",
+    "supporting material": "supplementary",
+    "supporting methods": "methods",
+    "supporting method": "methods",
+    "supporting figures": "figures",
+    "supporting figure": "figures",
+    "supporting tables": "other",
+    "supporting table": "other",
+    "data availability": "data_availability",
+    "code availability": "data_availability",
+    "data and code availability": "data_availability",
+    "code and data availability": "data_availability",
+    "availability of data": "data_availability",
+    "availability of code": "data_availability",
+    "availability of materials": "data_availability",
+    "availability of material": "data_availability",
+    "accession codes": "data_availability",
+    "accession code": "data_availability",
+    "accession numbers": "data_availability",
+    "accession number": "data_availability",
+    "resource availability": "data_availability",
+}
+
+# Words that identify a section inside a longer heading but are not
+# section titles on their own.
+KEYWORD_TYPES = {
+    "methodology": "methods",
+    "material": "methods",
+    "materials": "methods",
+    "experimental": "methods",
+    "procedure": "methods",
+    "procedures": "methods",
+    "protocol": "methods",
+    "protocols": "methods",
+    "imaging": "methods",
+    "staining": "methods",
+    # Phrases match whole words, so compounds the JATS parser's old
+    # substring patterns caught ("method", "imaging", "microscopy",
+    # "staining") are listed explicitly.
+    "methodological": "methods",
+    "methodologies": "methods",
+    "bioimaging": "methods",
+    "neuroimaging": "methods",
+    "cryomicroscopy": "methods",
+    "photomicroscopy": "methods",
+    "videomicroscopy": "methods",
+    "microscopies": "methods",
+    "immunostaining": "methods",
+    "counterstaining": "methods",
+    "sample preparations": "methods",
+    "cell cultures": "methods",
+    "finding": "results",
+    "findings": "results",
+    # Longer than "summary", so these win over its discussion type
+    "summary of results": "results",
+    "summary of the results": "results",
+    "summary of findings": "results",
+    "summary of the findings": "results",
+    "summary of main findings": "results",
+    "summary of the main findings": "results",
+    "summary of key findings": "results",
+    "figure": "figures",
+    "figures": "figures",
+    "fig": "figures",
+    "table": "figures",
+    "tables": "figures",
+    "data and software availability": "data_availability",
+}
+
+_TOKEN_RE = re.compile(r"[^\W\d_]+|&")
+_WORD_RE = re.compile(r"[^\W\d_]+")
+_SPACE_RE = re.compile(r"\s+")
+_LINE_END_RE = re.compile(r"\s*(?:\n|$)")
+
+# Trie node: token → child node; the _END entry of a node ending a phrase
+# holds (section_type, is_heading).
+_END = ""
+_Node = Dict[str, object]
+
+
+def _build_trie() -> _Node:
+    root: _Node = {}
+    for phrases, is_heading in ((KEYWORD_TYPES, False), (HEADING_TYPES, True)):
+        for phrase, section_type in phrases.items():
+            node = root
+            for token in phrase.split():
+                node = node.setdefault(token, {})
+            node[_END] = (section_type, is_heading)
+    return root
+
+
+_TRIE = _build_trie()
+
+
+@lru_cache(maxsize=1 << 16)
+def classify_heading(heading: str) -> str:
+    """Classify a heading string into a section type ("other" if unknown)."""
+    tokens = [("and" if t == "&" else t) for t in _TOKEN_RE.findall(heading.lower())]
+    for start in range(len(tokens)):
+        node = _TRIE
+        found = None
+        for token in tokens[start:]:
+            node = node.get(token)
+            if node is None:
+                break
+            if _END in node:
+                found = node[_END][0]
+        if found:
+            return found
+    return "other"
+
+
+def match_heading(text: str, pos: int) -> Optional[Tuple[int, int, str]]:
+    """Match a section title standing alone on its line at ``text[pos]``.
+
+    The title's words may be separated by any whitespace and must be
+    followed only by whitespace up to a newline or the end of *text*.
+    Returns ``(title_end, line_end, section_type)`` for the longest title
+    found — *line_end* is past the trailing whitespace and newline — or
+    None.
+    """
+    node = _TRIE
+    best = None
+    while True:
+        word = _WORD_RE.match(text, pos)
+        if not word:
+            break
+        node = node.get(word.group().lower())
+        if node is None:
+            break
+        entry = node.get(_END)
+        if entry and entry[1]:
+            tail = _LINE_END_RE.match(text, word.end())
+            if tail:
+                best = (word.end(), tail.end(), entry[0])
+        space = _SPACE_RE.match(text, word.end())
+        if not space:
+            break
+        pos = space.end()
+    return best
@@ -0,0 +1,370 @@
+"""
+Local full-text store built from PMC / Europe PMC open-access bulk archives.
+
+Fetching JATS XML one article at a time from Europe PMC or NCBI is the
+slowest part of full-text acquisition.  For open-access papers the same
+XML ships in bulk packages:
+
+  - PMC OA bulk packages (``oa_comm_xml.*.tar.gz``, ``*.tgz``, ``*.tar``):
+    tar archives holding one ``.xml`` / ``.nxml`` article per member
+  - Europe PMC OA bundles (``PMC*_PMC*.xml.gz``): many ``<article>``
+    elements inside one ``<articles>`` document
+
+ingest_archives() reads every bundle in a directory once, keys each article
+by PMCID (from its ``<article-id>``, else the member name) and stores it
+zlib-compressed in a SQLite file:
+
+  - ``articles``  PMCID → compressed XML, and the bundle it came from
+  - ``bundles``   bundles already ingested (name, size, mtime), so a re-run
+                  only reads new or changed bundles
+  - ``meta``      format version
+
+EuropePMCFetcher.fetch_fulltext_xml() and section_extractor.from_pmc()
+check this store before going to the network; a lookup is one indexed
+query.  The store is found at DEFAULT_STORE_PATH unless
+set_default_store_path() points elsewhere.
+
+Usage:
+    from pipeline.parsing.oa_archive import ingest_archives, local_fulltext_xml
+    ingest_archives("/data/pmc_oa", DEFAULT_STORE_PATH)
+    xml_text = local_fulltext_xml("PMC1234567")   # None if not in the store
+"""
+
+import gzip
+import logging
+import os
+import re
+import sqlite3
+import tarfile
+import threading
+import zlib
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from urllib.request import pathname2url
+
+from .. import load_costs
+
+logger = logging.getLogger(__name__)
+
+# Bump when the schema or article encoding changes; readers ignore stores
+# written with another version.
+FORMAT_VERSION = 1
+
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(
+    os.path.abspath(__file__)
+)))
+DEFAULT_STORE_PATH = os.path.join(_PROJECT_ROOT, "pmc_oa_fulltext.sqlite")
+
+TAR_SUFFIXES = (".tar.gz", ".tgz", ".tar")
+XML_SUFFIXES = (".xml.gz", ".xml", ".nxml")
+
+_READ_BLOCK = 1 << 20  # 1 MiB
+_BATCH_SIZE = 500
+
+_PMCID_NAME_RE = re.compile(r"PMC\d+", re.IGNORECASE)
+_PMCID_XML_RE = re.compile(
+    rb'<article-id[^>]*pub-id-type="pmc(?:id)?"[^>]*>\s*(?:PMC)?(\d+)\s*</article-id>',
+    re.IGNORECASE,
+)
+_ARTICLE_START_RE = re.compile(rb"<article[\s>]")
+_ARTICLE_END = b"</article>"
+_ROOT_TAG_RE = re.compile(rb"<articles\b[^>]*>")
+_XMLNS_RE = re.compile(rb'\sxmlns(?::[\w.-]+)?="[^"]*"')
+
+
+def normalize_pmcid(pmc_id: str) -> Optional[str]:
+    """Normalize a PMC ID to ``PMC1234567`` form (None if empty)."""
+    pmc_id = str(pmc_id or "").strip().upper()
+    if not pmc_id:
+        return None
+    return pmc_id if pmc_id.startswith("PMC") else "PMC" + pmc_id
+
+
+# ======================================================================
+# Ingestion
+# ======================================================================
+
+def find_bundles(archive_dir: str) -> List[str]:
+    """Return the bulk archive files in *archive_dir*, sorted by name."""
+    names = sorted(os.listdir(archive_dir))
+    return [os.path.join(archive_dir, n) for n in names
+            if n.endswith(TAR_SUFFIXES + XML_SUFFIXES)
+            and os.path.isfile(os.path.join(archive_dir, n))]
+
+
+def ingest_archives(archive_dir: str, store_path: str = DEFAULT_STORE_PATH) -> Dict[str, int]:
+    """Index every bulk archive in *archive_dir* into the store at *store_path*.
+
+    Bundles already ingested with the same size and mtime are skipped, so
+    this is cheap to re-run after new packages are downloaded.  An article
+    appearing in several bundles keeps the copy from the bundle read last
+    (bundles are read in name order, so incremental packages win over the
+    baseline).  Each bundle is committed as a whole; an interrupted run
+    re-reads the bundle it was in.  Returns counts of bundles read and
+    skipped and of articles stored.
+    """
+    conn = _open_for_writing(store_path)
+    stats = {"bundles": 0, "skipped": 0, "articles": 0}
+    try:
+        for path in find_bundles(archive_dir):
+            name = os.path.basename(path)
+            st = os.stat(path)
+            row = conn.execute(
+                "SELECT size, mtime FROM bundles WHERE name = ?", (name,)
+            ).fetchone()
+            if row == (st.st_size, int(st.st_mtime)):
+                stats["skipped"] += 1
+                continue
+
+            logger.info("Ingesting %s (%.1f MB)", name, st.st_size / 1e6)
+            count = 0
+            batch: List[Tuple[str, str, bytes]] = []
+            for pmcid, xml in _iter_bundle(path):
+                batch.append((pmcid, name, zlib.compress(xml)))
+                if len(batch) >= _BATCH_SIZE:
+                    _insert_articles(conn, batch)
+                    count += len(batch)
+                    batch = []
+            _insert_articles(conn, batch)
+            count += len(batch)
+            conn.execute(
+                "INSERT OR REPLACE INTO bundles (name, size, mtime, articles) "
+                "VALUES (?, ?, ?, ?)",
+                (name, st.st_size, int(st.st_mtime), count),
+            )
+            conn.commit()
+            stats["bundles"] += 1
+            stats["articles"] += count
+            logger.info("  %s: %d articles", name, count)
+    finally:
+        conn.close()
+    return stats
+
+
+def _open_for_writing(store_path: str) -> sqlite3.Connection:
+    conn = sqlite3.connect(store_path)
+    conn.executescript("""
+        CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL) WITHOUT ROWID;
+        CREATE TABLE IF NOT EXISTS articles (
+            pmcid TEXT PRIMARY KEY, bundle TEXT NOT NULL, xml BLOB NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS bundles (
+            name TEXT PRIMARY KEY, size INTEGER, mtime INTEGER, articles INTEGER
+        ) WITHOUT ROWID;
+    """)
+    row = conn.execute("SELECT value FROM meta WHERE key = 'format_version'").fetchone()
+    if row is None:
+        conn.execute("INSERT INTO meta (key, value) VALUES ('format_version', ?)",
+                     (str(FORMAT_VERSION),))
+        conn.commit()
+    elif row[0] != str(FORMAT_VERSION):
+        conn.close()
+        raise ValueError(
+            "OA full-text store %s has format version %s (expected %d); "
+            "delete it and re-ingest" % (store_path, row[0], FORMAT_VERSION)
+        )
+    return conn
+
+
+def _insert_articles(conn: sqlite3.Connection, batch: List[Tuple[str, str, bytes]]) -> None:
+    if batch:
+        conn.executemany(
+            "INSERT OR REPLACE INTO articles (pmcid, bundle, xml) VALUES (?, ?, ?)",
+            batch,
+        )
+
+
+def _iter_bundle(path: str) -> Iterator[Tuple[str, bytes]]:
+    """Yield ``(pmcid, xml)`` for every article in one bulk archive file."""
+    if path.endswith(TAR_SUFFIXES):
+        # Stream mode: members are read in order without seeking
+        with tarfile.open(path, "r|*") as tar:
+            for member in tar:
+                if not member.isfile() or not member.name.endswith(XML_SUFFIXES):
+                    continue
+                f = tar.extractfile(member)
+                if f is None:
+                    continue
+                data = f.read()
+                if member.name.endswith(".gz"):
+                    data = gzip.decompress(data)
+                yield from _articles_with_ids(_split_articles([data], whole=data),
+                                              path, member.name)
+        return
+
+    opener = gzip.open if path.endswith(".gz") else open
+    with opener(path, "rb") as f:
+        blocks = iter(lambda: f.read(_READ_BLOCK), b"")
+        yield from _articles_with_ids(_split_articles(blocks), path)
+
+
+def _articles_with_ids(articles: Iterable[bytes], source: str,
+                       member: Optional[str] = None) -> Iterator[Tuple[str, bytes]]:
+    """Attach PMCIDs: from ``<article-id>``, else from a tar *member* name."""
+    for xml in articles:
+        m = _PMCID_XML_RE.search(xml)
+        if m:
+            pmcid = "PMC" + m.group(1).decode("ascii")
+        else:
+            m = _PMCID_NAME_RE.search(os.path.basename(member)) if member else None
+            if not m:
+                logger.debug("No PMCID for an article in %s; skipped", source)
+                continue
+            pmcid = m.group(0).upper()
+        yield pmcid, xml
+
+
+def _split_articles(blocks: Iterable[bytes], whole: Optional[bytes] = None) -> Iterator[bytes]:
+    """Split a stream of XML bytes into its ``<article>`` elements.
+
+    Namespace declarations on an enclosing ``<articles>`` root are copied
+    onto each article, so every piece parses on its own.  When *whole* is
+    the complete document and it holds a single article, the document is
+    yielded unchanged (keeping its XML declaration and DOCTYPE).
+    """
+    buf = b""
+    root_ns: List[bytes] = []
+    past_prolog = False
+    pieces: List[bytes] = []
+    for block in blocks:
+        buf += block
+        while True:
+            start = _ARTICLE_START_RE.search(buf)
+            if not past_prolog:
+                root = _ROOT_TAG_RE.search(buf, 0, start.start() if start else len(buf))
+                if root:
+                    root_ns = _XMLNS_RE.findall(root.group(0))
+                    past_prolog = True
+            if not start:
+                if past_prolog:
+                    buf = buf[-len(_ARTICLE_END):]  # may hold a split start tag
+                break
+            end = buf.find(_ARTICLE_END, start.start())
+            if end < 0:
+                buf = buf[start.start():]
+                break
+            end += len(_ARTICLE_END)
+            pieces.append(_with_namespaces(buf[start.start():end], root_ns))
+            buf = buf[end:]
+            past_prolog = True
+            if whole is None or len(pieces) > 1:
+                yield from pieces
+                pieces = []
+                whole = None
+    if whole is not None and len(pieces) == 1:
+        yield whole
+    else:
+        yield from pieces
+
+
+def _with_namespaces(article: bytes, root_ns: List[bytes]) -> bytes:
+    if not root_ns:
+        return article
+    tag_end = article.index(b">")
+    start_tag = article[:tag_end]
+    missing = [ns for ns in root_ns if ns.split(b"=", 1)[0] + b"=" not in start_tag]
+    if not missing:
+        return article
+    return start_tag + b"".join(missing) + article[tag_end:]
+
+
+# ======================================================================
+# Reading
+# ======================================================================
+
+class OAFullTextStore:
+    """Read-only PMCID → JATS XML lookups in an ingested store.
+
+    A single connection is shared between threads under a lock; each
+    lookup is one primary-key query.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        uri = "file:%s?mode=ro" % pathname2url(os.path.abspath(path))
+        self._conn = sqlite3.connect(uri, uri=True, check_same_thread=False)
+        self._lock = threading.Lock()
+        row = self._conn.execute(
+            "SELECT value FROM meta WHERE key = 'format_version'"
+        ).fetchone()
+        self.format_version = int(row[0]) if row else 0
+
+    def get_xml(self, pmc_id: str) -> Optional[str]:
+        """Return the article's JATS XML, or None if it is not in the store."""
+        pmc_id = normalize_pmcid(pmc_id)
+        if not pmc_id:
+            return None
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT xml FROM articles WHERE pmcid = ?", (pmc_id,)
+            ).fetchone()
+        if row is None:
+            return None
+        return zlib.decompress(row[0]).decode("utf-8", errors="replace")
+
+    def __contains__(self, pmc_id: object) -> bool:
+        with self._lock:
+            return self._conn.execute(
+                "SELECT 1 FROM articles WHERE pmcid = ?", (normalize_pmcid(pmc_id),)
+            ).fetchone() is not None
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM articles").fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def open_oa_store(path: str) -> Optional[OAFullTextStore]:
+    """Open the store at *path*, or return None if there is no usable store."""
+    if not os.path.exists(path):
+        return None
+    try:
+        store = OAFullTextStore(path)
+    except sqlite3.Error as exc:
+        logger.warning("OA full-text store %s unreadable (%s); ignoring it", path, exc)
+        return None
+    if store.format_version != FORMAT_VERSION:
+        logger.warning(
+            "OA full-text store %s has format version %s (expected %d); "
+            "re-ingest the archives. Using the network only.",
+            path, store.format_version, FORMAT_VERSION,
+        )
+        store.close()
+        return None
+    return store
+
+
+_default_lock = threading.Lock()
+_default_path = DEFAULT_STORE_PATH
+_default_store: Optional[OAFullTextStore] = None
+_default_opened = False
+
+
+def set_default_store_path(path: str) -> None:
+    """Use the store at *path* for local full-text lookups from now on."""
+    global _default_path, _default_store, _default_opened
+    with _default_lock:
+        if _default_store is not None:
+            _default_store.close()
+        _default_path, _default_store, _default_opened = path, None, False
+
+
+def default_oa_store() -> Optional[OAFullTextStore]:
+    """Return the default store, opening it on first use (None if absent)."""
+    global _default_store, _default_opened
+    with _default_lock:
+        if not _default_opened:
+            with load_costs.timed("PMC OA full-text store"):
+                _default_store = open_oa_store(_default_path)
+            _default_opened = True
+            if _default_store is not None:
+                logger.info("Local OA full text: %s", _default_path)
+        return _default_store
+
+
+def local_fulltext_xml(pmc_id: str) -> Optional[str]:
+    """Return JATS XML for *pmc_id* from the default store, or None."""
+    store = default_oa_store()
+    return store.get_xml(pmc_id) if store is not None else None
@@ -0,0 +1,149 @@
+"""
+Content-addressed on-disk store for open-access PDFs and their GROBID TEI.
+
+Tier 2 of the full-text waterfall downloads a PDF found by Unpaywall and
+sends it to GROBID.  Both steps are slow and both give the same answer on
+every re-run, so their results are kept here:
+
+  objects/<aa>/<sha256>.pdf       the PDF, named by the SHA-256 of its bytes
+  objects/<aa>/<sha256>.tei.xml   GROBID's TEI for that PDF
+  index.sqlite                    DOI → source URL and PDF hash
+
+A DOI already in the index needs neither the Unpaywall lookup nor the
+download, and a PDF whose TEI is stored skips GROBID.  Identical PDFs
+reached through different DOIs or URLs are stored once.  Files are written
+to a temporary name and moved into place, so concurrent workers never see
+a partial object.
+
+Usage:
+    from pipeline.parsing.pdf_store import default_pdf_store
+    store = default_pdf_store()
+    sha = store.put_pdf(doi, url, pdf_bytes)
+    pdf_path = store.pdf_path(sha)
+"""
+
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(
+    os.path.abspath(__file__)
+)))
+DEFAULT_STORE_DIR = os.path.join(_PROJECT_ROOT, "pdf_cache")
+
+
+class PdfStore:
+    """DOI-indexed, content-addressed PDF and TEI files under one directory.
+
+    Safe to share between threads: index access is serialized under a
+    lock, and object files are immutable once written.
+    """
+
+    def __init__(self, root: str):
+        self.root = root
+        os.makedirs(os.path.join(root, "objects"), exist_ok=True)
+        self._conn = sqlite3.connect(os.path.join(root, "index.sqlite"),
+                                     check_same_thread=False)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS pdfs (
+                doi TEXT PRIMARY KEY,
+                url TEXT,
+                sha256 TEXT NOT NULL,
+                fetched_at TEXT DEFAULT (datetime('now'))
+            )
+        """)
+        self._conn.commit()
+        self._lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    def _object_path(self, sha256: str, suffix: str) -> str:
+        return os.path.join(self.root, "objects", sha256[:2], sha256 + suffix)
+
+    def _write_object(self, path: str, data: bytes) -> None:
+        if os.path.exists(path):
+            return
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = "%s.%d.%d.tmp" % (path, os.getpid(), threading.get_ident())
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    # ------------------------------------------------------------------
+    def pdf_for_doi(self, doi: str) -> Optional[str]:
+        """Return the SHA-256 of the stored PDF for *doi*, or None."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT sha256 FROM pdfs WHERE doi = ?", (doi.lower(),)
+            ).fetchone()
+        if row and os.path.exists(self._object_path(row[0], ".pdf")):
+            return row[0]
+        return None
+
+    def put_pdf(self, doi: str, url: str, content: bytes) -> str:
+        """Store *content* as the PDF for *doi*; return its SHA-256."""
+        sha256 = hashlib.sha256(content).hexdigest()
+        self._write_object(self._object_path(sha256, ".pdf"), content)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO pdfs (doi, url, sha256) VALUES (?, ?, ?)",
+                (doi.lower(), url, sha256),
+            )
+            self._conn.commit()
+        return sha256
+
+    def pdf_path(self, sha256: str) -> str:
+        return self._object_path(sha256, ".pdf")
+
+    def get_tei(self, sha256: str) -> Optional[str]:
+        """Return the stored GROBID TEI for a PDF, or None."""
+        try:
+            with open(self._object_path(sha256, ".tei.xml"), "r", encoding="utf-8") as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+    def put_tei(self, sha256: str, tei: str) -> None:
+        self._write_object(self._object_path(sha256, ".tei.xml"), tei.encode("utf-8"))
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+_default_lock = threading.Lock()
+_default_dir = DEFAULT_STORE_DIR
+_default_store: Optional[PdfStore] = None
+_default_opened = False
+
+
+def set_default_store_dir(path: Optional[str]) -> None:
+    """Use *path* for the PDF store from now on (None disables it)."""
+    global _default_dir, _default_store, _default_opened
+    with _default_lock:
+        if _default_store is not None:
+            _default_store.close()
+        _default_dir, _default_store, _default_opened = path, None, False
+
+
+def default_pdf_store() -> Optional[PdfStore]:
+    """Return the default store, creating it on first use.
+
+    None when the store is disabled or its directory cannot be created;
+    callers then work from temporary files as before.
+    """
+    global _default_store, _default_opened
+    with _default_lock:
+        if not _default_opened:
+            _default_opened = True
+            if _default_dir:
+                try:
+                    _default_store = PdfStore(_default_dir)
+                except (OSError, sqlite3.Error) as exc:
+                    logger.warning("PDF store %s unavailable (%s); not caching PDFs",
+                                   _default_dir, exc)
+        return _default_store
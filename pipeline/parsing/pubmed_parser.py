@@ -13,6 +13,8 @@ import xml.etree.ElementTree as ET
 from typing import Any, Dict, List, Optional
 from urllib.parse import quote
 
+from .. import rate_limit
+
 logger = logging.getLogger(__name__)
 
 try:
@@ -36,6 +38,7 @@ def _retry_get(url: str, params: Dict = None, retries: int = 3,
         return None
     for attempt in range(retries):
         try:
+            rate_limit.wait_for_url(url)
             resp = requests.get(url, params=params, timeout=timeout)
             if resp.status_code == 200:
                 return resp
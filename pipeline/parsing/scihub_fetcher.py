@@ -13,6 +13,8 @@ import logging
 import re
 from typing import Optional
 
+from .. import rate_limit
+
 logger = logging.getLogger(__name__)
 
 try:
@@ -54,6 +56,7 @@ def fetch_fulltext_via_scihub(doi: str) -> Optional[str]:
     for base_url in _SCIHUB_URLS:
         try:
             url = f"{base_url}/{doi}"
+            rate_limit.wait_for_url(url)
             resp = requests.get(url, timeout=_TIMEOUT, allow_redirects=True)
             if resp.status_code != 200:
                 logger.debug("SciHub: %s returned HTTP %d for DOI %s",
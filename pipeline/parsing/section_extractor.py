@@ -21,7 +21,7 @@ by the extraction agents.
 import re
 import logging
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from .grobid_parser import GrobidParser
 from .pubmed_parser import (
@@ -30,6 +30,9 @@ from .pubmed_parser import (
     fetch_pubmed_metadata,
 )
 from .europepmc_fetcher import EuropePMCFetcher
+from .heading_classifier import match_heading
+from .oa_archive import local_fulltext_xml
+from .pdf_store import default_pdf_store
 from .unpaywall_client import UnpaywallClient
 
 logger = logging.getLogger(__name__)
@@ -348,6 +351,18 @@ _PROTECTED_PAREN_RE = re.compile(
 )
 
 
+# Anything any citation pattern could remove.  Placeholders only ever
+# prevent citation matches, so text without a candidate needs no protection.
+_CITATION_CANDIDATE_RE = re.compile(
+    "%s|%s|%s" % (_NUMERIC_CITATION_RE.pattern,
+                  _AUTHOR_YEAR_CITATION_RE.pattern,
+                  _SUPERSCRIPT_CITATION_RE.pattern)
+)
+
+_PLACEHOLDER_RE = re.compile("\x00PROT(\\d+)\x00")
+_MULTI_SPACE_RE = re.compile(r"  +")
+
+
 def strip_inline_citations(text: str) -> str:
     """Remove inline citations while preserving scientific notation.
 
@@ -363,211 +378,74 @@ def strip_inline_citations(text: str) -> str:
       - pH values: (pH 7.4)
       - P-values: (P < 0.05)
       - Figure/Table references: (Fig. 1), (Table 2)
+
+    Runs in linear time: a fixed number of regex passes, with all protected
+    spans restored in a single substitution.
     """
     if not text:
         return text
 
+    # Fast path: nothing to strip.  (Text with NULs takes the full path, in
+    # case it already contains placeholder-like strings.)
+    if "\x00" not in text and not _CITATION_CANDIDATE_RE.search(text):
+        return _MULTI_SPACE_RE.sub(" ", text)
+
     # Step 1: protect scientific brackets/parens with placeholders
-    protected = {}
-    counter = [0]
+    protected = []
 
     def _protect(m):
-        key = f"\x00PROT{counter[0]}\x00"
-        protected[key] = m.group(0)
-        counter[0] += 1
-        return key
+        protected.append(m.group(0))
+        return f"\x00PROT{len(protected) - 1}\x00"
 
     text = _PROTECTED_BRACKET_RE.sub(_protect, text)
     text = _PROTECTED_PAREN_RE.sub(_protect, text)
 
-    # Step 2: strip citations
+    # Step 2: strip citations (in this order — removing one kind can
+    # complete a match of the next, e.g. "(Smith [1], 2020)")
     text = _NUMERIC_CITATION_RE.sub("", text)
     text = _AUTHOR_YEAR_CITATION_RE.sub("", text)
     text = _SUPERSCRIPT_CITATION_RE.sub("", text)
 
     # Step 3: restore protected tokens
-    for key, val in protected.items():
-        text = text.replace(key, val)
+    if protected:
+        def _restore(m):
+            idx = int(m.group(1))
+            return protected[idx] if idx < len(protected) else m.group(0)
+
+        text = _PLACEHOLDER_RE.sub(_restore, text)
 
     # Clean up double spaces left by removal
-    text = re.sub(r"  +", " ", text)
-    return text
+    return _MULTI_SPACE_RE.sub(" ", text)
 
 
 # ======================================================================
 # Heuristic section segmentation from full text
 # ======================================================================
 
-# Heading detection regex: matches typical section headings
-_HEADING_RE = re.compile(
-    r"(?:^|\n)\s*"
-    r"(?:(?:\d+\.?(?:\d+\.?)*)\s+)?"  # optional numbering: 1., 2.1, etc.
-    r"("
-    # Core section headings
-    r"abstract|introduction|background"
-    r"|(?:materials?\s+and\s+)?methods?"
-    r"|experimental\s+(?:procedures?|section|methods?|design)"
-    r"|(?:materials?\s+and\s+methods?)"
-    r"|(?:methods?\s+and\s+materials?)"
-    r"|results?\s+(?:and\s+discussion)?"
-    r"|results?"
-    r"|discussion"
-    r"|conclusions?"
-    r"|summary"
-    r"|acknowledge?ments?"
-    r"|references?|bibliography|works\s+cited|literature\s+cited"
-    r"|(?:supplementary|supporting)\s+(?:information|data|materials?|methods?|figures?|tables?)"
-    r"|(?:data|code)\s+(?:and\s+(?:code|data)\s+)?availability"
-    r"|(?:availability\s+of\s+(?:data|code|materials?))"
-    r"|accession\s+(?:codes?|numbers?)"
-    r"|resource\s+availability"
-    r"|author\s+contributions?"
-    r"|competing\s+interests?"
-    r"|conflict\s+of\s+interests?"
-    r"|ethics\s+(?:statement|approval|declaration)"
-    r"|funding\s*(?:information|sources?|statement)?"
-    r"|(?:key\s+resources?\s+table)"
-    r"|(?:star|lead\s+contact)\s+methods?"
-    r"|(?:online|extended)\s+methods?"
-    r"|figure\s+legends?"
-    r"|(?:additional|extended)\s+(?:data|information)"
-    r"|(?:reporting\s+summary)"
-    r"|image\s+(?:acquisition|analysis|processing)"
-    r"|microscopy"
-    r"|(?:sample|specimen)\s+preparation"
-    r"|(?:cell|tissue)\s+culture"
-    r"|(?:statistical|data)\s+analysis"
-    r"|immunofluorescence\s*(?:staining|microscopy)?"
-    r"|immunohistochemistry"
-    r"|western\s+blot(?:ting)?"
-    r"|(?:confocal|fluorescence|electron|light)\s+microscopy"
-    r")"
-    r"\s*(?:\n|$)",
-    re.IGNORECASE,
-)
+# Leading whitespace and optional numbering (1., 2.1, etc.) before a
+# heading; the heading itself is matched against the shared heading trie.
+_HEADING_INDENT_RE = re.compile(r"\s*(?:(?:\d+\.?(?:\d+\.?)*)\s+)?")
 
-# Map heading text to section type
-_HEADING_TYPE_MAP = {
-    "abstract": "abstract",
-    "introduction": "introduction",
-    "background": "introduction",
-    "methods": "methods",
-    "method": "methods",
-    "materials and methods": "methods",
-    "methods and materials": "methods",
-    "material and methods": "methods",
-    "materials and method": "methods",
-    "experimental procedures": "methods",
-    "experimental procedure": "methods",
-    "experimental section": "methods",
-    "experimental methods": "methods",
-    "experimental method": "methods",
-    "experimental design": "methods",
-    "online methods": "methods",
-    "extended methods": "methods",
-    "star methods": "methods",
-    "lead contact methods": "methods",
-    "image acquisition": "methods",
-    "image analysis": "methods",
-    "image processing": "methods",
-    "microscopy": "methods",
-    "sample preparation": "methods",
-    "specimen preparation": "methods",
-    "cell culture": "methods",
-    "tissue culture": "methods",
-    "statistical analysis": "methods",
-    "data analysis": "methods",
-    "immunofluorescence": "methods",
-    "immunofluorescence staining": "methods",
-    "immunofluorescence microscopy": "methods",
-    "immunohistochemistry": "methods",
-    "western blotting": "methods",
-    "western blot": "methods",
-    "confocal microscopy": "methods",
-    "fluorescence microscopy": "methods",
-    "electron microscopy": "methods",
-    "light microscopy": "methods",
-    "results": "results",
-    "results and discussion": "results",
-    "result": "results",
-    "discussion": "discussion",
-    "conclusions": "discussion",
-    "conclusion": "discussion",
-    "summary": "discussion",
-    "acknowledgements": "acknowledgements",
-    "acknowledgments": "acknowledgements",
-    "acknowledgement": "acknowledgements",
-    "acknowledgment": "acknowledgements",
-    "references": "references",
-    "reference": "references",
-    "bibliography": "references",
-    "works cited": "references",
-    "literature cited": "references",
-    "author contributions": "other",
-    "author contribution": "other",
-    "competing interests": "other",
-    "conflict of interests": "other",
-    "conflict of interest": "other",
-    "ethics statement": "other",
-    "ethics approval": "other",
-    "ethics declaration": "other",
-    "funding": "other",
-    "funding information": "other",
-    "funding sources": "other",
-    "funding source": "other",
-    "funding statement": "other",
-    "key resources table": "methods",
-    "figure legends": "figures",
-    "figure legend": "figures",
-    "additional data": "other",
-    "additional information": "other",
-    "extended data": "other",
-    "reporting summary": "other",
-    "supplementary information": "supplementary",
-    "supplementary data": "supplementary",
-    "supplementary materials": "supplementary",
-    "supplementary material": "supplementary",
-    "supplementary methods": "methods",
-    "supplementary figures": "figures",
-    "supplementary tables": "other",
-    "supporting information": "supplementary",
-    "supporting data": "supplementary",
-    "supporting materials": "supplementary",
-    "supporting material": "supplementary",
-    "supporting methods": "methods",
-    "supporting figures": "figures",
-    "supporting tables": "other",
-    "data availability": "data_availability",
-    "code availability": "data_availability",
-    "data and code availability": "data_availability",
-    "code and data availability": "data_availability",
-    "availability of data": "data_availability",
-    "availability of code": "data_availability",
-    "availability of materials": "data_availability",
-    "accession codes": "data_availability",
-    "accession code": "data_availability",
-    "accession numbers": "data_availability",
-    "accession number": "data_availability",
-    "resource availability": "data_availability",
-}
-
-
-def _classify_heading(heading: str) -> str:
-    """Classify a heading string into a section type."""
-    # Strip numbering and whitespace
-    clean = re.sub(r"^\d+\.?\s*(?:\d+\.?\s*)*", "", heading.strip()).strip()
-    clean_lower = clean.lower()
-
-    # Exact match
-    if clean_lower in _HEADING_TYPE_MAP:
-        return _HEADING_TYPE_MAP[clean_lower]
-
-    # Partial match: check if any key is contained in the heading
-    for key, stype in _HEADING_TYPE_MAP.items():
-        if key in clean_lower:
-            return stype
-
-    return "other"
+
+def _find_headings(text: str) -> List[Tuple[int, int, str, str]]:
+    """Return ``(start, end, heading, type)`` for each heading line in *text*.
+
+    Candidates are the start of *text* and every newline; a heading's
+    span includes the newline before it and the whitespace after it.
+    """
+    headings = []
+    start, skip = 0, 0
+    while start >= 0:
+        indent_end = _HEADING_INDENT_RE.match(text, start + skip).end()
+        found = match_heading(text, indent_end)
+        if found is None:
+            resume = start + 1
+        else:
+            title_end, line_end, section_type = found
+            headings.append((start, line_end, text[indent_end:title_end], section_type))
+            resume = line_end
+        start, skip = text.find("\n", resume), 1
+    return headings
 
 
 def heuristic_segment(text: str) -> List[Dict[str, str]]:
@@ -580,7 +458,7 @@ def heuristic_segment(text: str) -> List[Dict[str, str]]:
     if not text:
         return []
 
-    headings = list(_HEADING_RE.finditer(text))
+    headings = _find_headings(text)
 
     if not headings:
         # No headings found — return full text as a single section
@@ -589,8 +467,8 @@ def heuristic_segment(text: str) -> List[Dict[str, str]]:
     sections = []
 
     # Text before the first heading (if any) — treat as preamble/abstract
-    if headings[0].start() > 50:
-        preamble = text[:headings[0].start()].strip()
+    if headings[0][0] > 50:
+        preamble = text[:headings[0][0]].strip()
         if preamble:
             sections.append({
                 "heading": "",
@@ -598,14 +476,10 @@ def heuristic_segment(text: str) -> List[Dict[str, str]]:
                 "type": "other",
             })
 
-    for i, m in enumerate(headings):
-        heading_text = m.group(1).strip()
-        section_type = _classify_heading(heading_text)
-
+    for i, (_, body_start, heading_text, section_type) in enumerate(headings):
         # Section body: from end of this heading to start of next heading
-        body_start = m.end()
         if i + 1 < len(headings):
-            body_end = headings[i + 1].start()
+            body_end = headings[i + 1][0]
         else:
             body_end = len(text)
 
@@ -650,8 +524,8 @@ def from_pdf(pdf_path: str, grobid_url: str = "http://localhost:8070") -> PaperS
 
 
 def from_pmc(pmc_id: str) -> PaperSections:
-    """Fetch and parse a PMC full-text article."""
-    xml_text = fetch_pmc_fulltext(pmc_id)
+    """Fetch and parse a PMC full-text article (local OA archive first)."""
+    xml_text = local_fulltext_xml(pmc_id) or fetch_pmc_fulltext(pmc_id)
     if not xml_text:
         return PaperSections()
     sections = extract_pmc_sections(xml_text)
@@ -682,44 +556,64 @@ def from_unpaywall_pdf(doi: str, metadata: Dict = None,
     """Discover OA PDF via Unpaywall + parse with GROBID (Tier 2).
 
     For articles without PMCIDs, Unpaywall finds open-access PDF URLs.
-    GROBID processes these PDFs into structured TEI XML.
+    GROBID processes these PDFs into structured TEI XML.  Downloaded PDFs
+    and their TEI are kept in the local PDF store (pdf_store), so a re-run
+    neither downloads nor re-parses a paper it has seen.
     """
-    client = UnpaywallClient(email=email)
-    pdf_url = client.find_pdf_url(doi)
-    if not pdf_url:
-        logger.debug("Unpaywall: no OA PDF for DOI %s", doi)
-        return PaperSections()
+    store = default_pdf_store()
+    sha256 = store.pdf_for_doi(doi) if store is not None else None
+    pdf_content = None
+    if sha256 is None:
+        client = UnpaywallClient(email=email)
+        pdf_url = client.find_pdf_url(doi)
+        if not pdf_url:
+            logger.debug("Unpaywall: no OA PDF for DOI %s", doi)
+            return PaperSections()
 
-    # Download and parse with GROBID
-    pdf_content = client.download_pdf(pdf_url)
-    if not pdf_content:
-        logger.debug("Unpaywall: failed to download PDF from %s", pdf_url)
-        return PaperSections()
+        pdf_content = client.download_pdf(pdf_url)
+        if not pdf_content:
+            logger.debug("Unpaywall: failed to download PDF from %s", pdf_url)
+            return PaperSections()
+        if store is not None:
+            try:
+                sha256 = store.put_pdf(doi, pdf_url, pdf_content)
+            except OSError as exc:
+                logger.warning("Could not store PDF for DOI %s: %s", doi, exc)
 
     parser = GrobidParser(grobid_url)
-    if not parser.is_available():
-        logger.warning("GROBID not available at %s for Unpaywall PDF", grobid_url)
-        return PaperSections()
+    tei = store.get_tei(sha256) if sha256 else None
+    if tei is None:
+        if not parser.is_available():
+            logger.warning("GROBID not available at %s for Unpaywall PDF", grobid_url)
+            return PaperSections()
+        if sha256:
+            tei = parser.parse_pdf_raw(store.pdf_path(sha256))
+            if tei:
+                store.put_tei(sha256, tei)
+        else:
+            tei = _grobid_tei_from_bytes(parser, pdf_content)
+        if not tei:
+            return PaperSections()
+
+    grobid_meta = parser.extract_metadata(tei)
+    sections = parser.parse_tei(tei)
+    if metadata:
+        grobid_meta.update({k: v for k, v in metadata.items() if v})
+    ps = from_sections_list(sections, grobid_meta)
+    logger.info("Unpaywall+GROBID: parsed %d sections for DOI %s",
+                 len(sections), doi)
+    return ps
 
-    # Write to temporary file for GROBID
+
+def _grobid_tei_from_bytes(parser: GrobidParser, pdf_content: bytes) -> Optional[str]:
+    """Run GROBID on an unstored PDF through a temporary file."""
     import tempfile
     import os
     with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as f:
         f.write(pdf_content)
         tmp_path = f.name
-
     try:
-        tei = parser.parse_pdf_raw(tmp_path)
-        if not tei:
-            return PaperSections()
-        grobid_meta = parser.extract_metadata(tei)
-        sections = parser.parse_pdf(tmp_path)
-        if metadata:
-            grobid_meta.update({k: v for k, v in metadata.items() if v})
-        ps = from_sections_list(sections, grobid_meta)
-        logger.info("Unpaywall+GROBID: parsed %d sections for DOI %s",
-                     len(sections), doi)
-        return ps
+        return parser.parse_pdf_raw(tmp_path)
     finally:
         os.unlink(tmp_path)
 
@@ -17,10 +17,11 @@ Usage:
 """
 
 import logging
-import time
 from typing import Any, Dict, Optional
 from urllib.parse import quote
 
+from .. import rate_limit
+
 logger = logging.getLogger(__name__)
 
 try:
@@ -30,7 +31,6 @@ except ImportError:
     HAS_REQUESTS = False
 
 _UNPAYWALL_BASE = "https://api.unpaywall.org/v2"
-_REQUEST_DELAY = 0.1  # generous; 100K/day ≈ 1.15/sec
 
 
 class UnpaywallClient:
@@ -45,7 +45,6 @@ class UnpaywallClient:
             limit tracking by Unpaywall).
         """
         self.email = email
-        self._last_call = 0.0
         self._cache: Dict[str, Optional[Dict]] = {}
 
     def lookup(self, doi: str) -> Optional[Dict[str, Any]]:
@@ -95,7 +94,7 @@ class UnpaywallClient:
         if not HAS_REQUESTS or not url:
             return None
 
-        self._rate_limit()
+        rate_limit.wait_for_url(url)
         try:
             resp = requests.get(
                 url,
@@ -103,7 +102,6 @@ class UnpaywallClient:
                 headers={"User-Agent": "MicroHub/6.0 (mailto:microhub@example.com)"},
                 allow_redirects=True,
             )
-            self._last_call = time.time()
             if resp.status_code == 200 and len(resp.content) > 1000:
                 # Basic PDF validation
                 if resp.content[:5] == b"%PDF-":
@@ -121,14 +119,14 @@ class UnpaywallClient:
 
     def _fetch(self, doi: str) -> Optional[Dict[str, Any]]:
         """Query Unpaywall API for a DOI."""
-        self._rate_limit()
+        url = f"{_UNPAYWALL_BASE}/{quote(doi, safe='')}"
+        rate_limit.wait_for_url(url)
         try:
             resp = requests.get(
-                f"{_UNPAYWALL_BASE}/{quote(doi, safe='')}",
+                url,
                 params={"email": self.email},
                 timeout=15,
             )
-            self._last_call = time.time()
 
             if resp.status_code == 404:
                 return None
@@ -165,11 +163,6 @@ class UnpaywallClient:
             "doi": data.get("doi", ""),
         }
 
-    def _rate_limit(self):
-        elapsed = time.time() - self._last_call
-        if elapsed < _REQUEST_DELAY:
-            time.sleep(_REQUEST_DELAY - elapsed)
-
     @staticmethod
     def _clean_doi(doi: str) -> str:
         doi = (doi or "").strip()
@@ -0,0 +1,74 @@
+"""
+Process-wide request spacing per API host.
+
+Full-text acquisition fetches several papers at once (step 1
+--fulltext-workers, step 3 --fetch-workers), and each call builds its own
+fetcher objects, so a delay kept per fetcher instance does not bound what
+a host actually receives.
+Every request to a host instead waits on the one limiter registered for
+that host here, whichever thread or object sends it.
+
+Usage:
+    from pipeline import rate_limit
+    rate_limit.wait_for_url(url)
+    resp = requests.get(url, ...)
+"""
+
+import threading
+import time
+from typing import Dict
+from urllib.parse import urlparse
+
+# Minimum seconds between request starts, per host
+HOST_INTERVALS = {
+    "eutils.ncbi.nlm.nih.gov": 0.34,   # NCBI: 3 req/sec without an API key
+    "www.ebi.ac.uk": 0.2,              # Europe PMC: no formal limit
+    "api.semanticscholar.org": 0.1,
+    "api.crossref.org": 0.05,
+    "api.unpaywall.org": 0.1,          # 100K/day per email
+}
+DEFAULT_INTERVAL = 0.2
+
+
+class RateLimiter:
+    """Thread-safe request spacer: one request start per ``interval`` seconds."""
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    def wait(self) -> None:
+        """Block until the next request slot is available."""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+_lock = threading.Lock()
+_limiters: Dict[str, RateLimiter] = {}
+
+
+def limiter(host: str) -> RateLimiter:
+    """Return the shared limiter for *host*, creating it on first use."""
+    host = host.lower()
+    with _lock:
+        found = _limiters.get(host)
+        if found is None:
+            found = _limiters[host] = RateLimiter(HOST_INTERVALS.get(host, DEFAULT_INTERVAL))
+        return found
+
+
+def set_interval(host: str, seconds: float) -> None:
+    """Space requests to *host* by *seconds* from now on."""
+    limiter(host).interval = seconds
+
+
+def wait_for_url(url: str) -> None:
+    """Wait for a request slot on the host *url* points at."""
+    host = urlparse(url).hostname
+    if host:
+        limiter(host).wait()
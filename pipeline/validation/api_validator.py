@@ -13,14 +13,17 @@ optional — if an API is unreachable the tag passes through unchanged.
 Usage:
     validator = ApiValidator()
     validator.validate_paper(paper_results)  # mutates in-place
+    validator.validate_papers(chunk_results)  # one lookup per unique entity
 """
 
 import logging
 import os
 import re
+import threading
 import time
 import json
-from typing import Any, Dict, List, Optional, Set, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -61,6 +64,41 @@ def _get_key(name: str) -> Optional[str]:
     return _load_env_file().get(name)
 
 
+# ======================================================================
+# Fluorophores that need no FPbase lookup
+# ======================================================================
+
+# Known organic dyes that FPbase won't have — pass through directly
+_KNOWN_DYES = frozenset({
+    "DAPI", "Hoechst 33342", "Hoechst 33258",
+    "Propidium Iodide", "Phalloidin",
+    "MitoTracker Red", "MitoTracker Green", "MitoTracker Deep Red",
+    "LysoTracker Red", "LysoTracker Green", "LysoTracker Blue",
+    "CellTracker Green", "CellTracker Red", "CellTracker Blue",
+    "DiI", "DiD", "DiO", "DiR",
+    "Calcein AM", "Calcein", "Fluo-4", "Fura-2", "Indo-1",
+    "Rhodamine 123", "TMRM", "TMRE", "JC-1",
+    "SYTOX Green", "SYTOX Blue", "SYTOX Orange",
+    "SYTO 9", "SYTO 13", "SYTO 16",
+    "Ethidium Homodimer-1", "7-AAD",
+})
+
+# Dye families — validate by regex pattern, not API lookup
+_DYE_FAMILY_PATTERNS = [
+    re.compile(r"^Alexa\s*Fluor\s*\d{3}[A-Z]?$", re.I),
+    re.compile(r"^Cy[2-7](?:\.5)?$", re.I),
+    re.compile(r"^ATTO\s*\d{3,4}N?$", re.I),
+    re.compile(r"^DyLight\s*\d{3}$", re.I),
+    re.compile(r"^CF\d{3}$", re.I),
+    re.compile(r"^IRDye\s*\d+[A-Z]*$", re.I),
+    re.compile(r"^(?:PE|APC|BV|BUV)\d{3}$", re.I),
+]
+
+
+def _is_known_dye(name: str) -> bool:
+    return name in _KNOWN_DYES or any(p.match(name) for p in _DYE_FAMILY_PATTERNS)
+
+
 # ======================================================================
 # API Validator
 # ======================================================================
@@ -96,6 +134,9 @@ class ApiValidator:
             self._cellosaurus = CellosaurusClient(local_path=cellosaurus_path)
         except ImportError:
             pass
+        # Built on first use from the local Cellosaurus indexes
+        self._cell_line_gazetteer = None
+        self._gazetteer_lock = threading.Lock()
 
         # Rate limiting (only for APIs not delegated to validators)
         self._last_call: Dict[str, float] = {}
@@ -145,6 +186,77 @@ class ApiValidator:
 
         return results
 
+    def validate_papers(self, results_list: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Validate a chunk of papers, looking up each unique entity once.
+
+        Collects the fluorophores, RRIDs, RORs, organisms and cell lines
+        that would reach a validator across all of *results_list*, resolves
+        each unique value once — one worker per API, each running its
+        lookups sequentially so the per-API rate limits still hold — and
+        then applies the cached verdicts with ``validate_paper()``.
+        Results are identical to calling ``validate_paper()`` per paper.
+        """
+        fluorophores: Dict[str, None] = {}
+        rrids: Dict[str, None] = {}
+        rors: Dict[str, None] = {}
+        organisms: Dict[str, None] = {}
+        cell_lines: Dict[str, None] = {}
+
+        gazetteer = self._get_cell_line_gazetteer() if self._cellosaurus else None
+        for results in results_list:
+            for name in results.get("fluorophores") or ():
+                if _is_known_dye(name):
+                    continue
+                if self._local_lookup and self._local_lookup.fluorophore(name) is not None:
+                    continue
+                fluorophores[name] = None
+            for entry in results.get("rrids") or ():
+                if entry.get("id"):
+                    rrids[entry["id"]] = None
+            for entry in results.get("rors") or ():
+                if entry.get("id"):
+                    rors[entry["id"]] = None
+            for name in results.get("organisms") or ():
+                if not (self._local_lookup and self._local_lookup.taxon(name)):
+                    organisms[name] = None
+            if gazetteer is not None:
+                for name in results.get("cell_lines") or ():
+                    if gazetteer.is_catalogued(name) and not gazetteer.resolve(name):
+                        cell_lines[gazetteer.query_name(name)] = None
+
+        tasks: List[Tuple[str, Callable[[str], Any], Iterable[str]]] = [
+            ("fpbase", self._query_fpbase, fluorophores),
+            ("scicrunch", self._query_scicrunch, rrids),
+            ("ror", self._query_ror, rors),
+            ("ncbi", self._query_ncbi_taxonomy, organisms),
+            ("cellosaurus", self._cellosaurus.validate if self._cellosaurus else None,
+             cell_lines),
+        ]
+        tasks = [(api, query, names) for api, query, names in tasks
+                 if query is not None and names and api not in self._exhausted]
+        if tasks:
+            logger.debug(
+                "API validation: %d papers, %s unique lookups",
+                len(results_list),
+                ", ".join("%s=%d" % (api, len(names)) for api, _, names in tasks),
+            )
+            with ThreadPoolExecutor(max_workers=len(tasks)) as pool:
+                for future in [pool.submit(self._prefetch, api, query, names)
+                               for api, query, names in tasks]:
+                    future.result()
+
+        for results in results_list:
+            self.validate_paper(results)
+        return results_list
+
+    def _prefetch(self, api: str, query: Callable[[str], Any],
+                  names: Iterable[str]) -> None:
+        """Run *query* over *names* to fill its cache; stop if *api* runs dry."""
+        for name in names:
+            if api in self._exhausted:
+                return
+            query(name)
+
     # ------------------------------------------------------------------
     # FPbase fluorophore validation
     # ------------------------------------------------------------------
@@ -154,40 +266,10 @@ class ApiValidator:
         if "fpbase" in self._exhausted:
             return fluorophores
 
-        # Known organic dyes that FPbase won't have — pass through directly
-        KNOWN_DYES = {
-            "DAPI", "Hoechst 33342", "Hoechst 33258",
-            "Propidium Iodide", "Phalloidin",
-            "MitoTracker Red", "MitoTracker Green", "MitoTracker Deep Red",
-            "LysoTracker Red", "LysoTracker Green", "LysoTracker Blue",
-            "CellTracker Green", "CellTracker Red", "CellTracker Blue",
-            "DiI", "DiD", "DiO", "DiR",
-            "Calcein AM", "Calcein", "Fluo-4", "Fura-2", "Indo-1",
-            "Rhodamine 123", "TMRM", "TMRE", "JC-1",
-            "SYTOX Green", "SYTOX Blue", "SYTOX Orange",
-            "SYTO 9", "SYTO 13", "SYTO 16",
-            "Ethidium Homodimer-1", "7-AAD",
-        }
-        # Dye families — validate by regex pattern, not API lookup
-        DYE_FAMILY_PATTERNS = [
-            re.compile(r"^Alexa\s*Fluor\s*\d{3}[A-Z]?$", re.I),
-            re.compile(r"^Cy[2-7](?:\.5)?$", re.I),
-            re.compile(r"^ATTO\s*\d{3,4}N?$", re.I),
-            re.compile(r"^DyLight\s*\d{3}$", re.I),
-            re.compile(r"^CF\d{3}$", re.I),
-            re.compile(r"^IRDye\s*\d+[A-Z]*$", re.I),
-            re.compile(r"^(?:PE|APC|BV|BUV)\d{3}$", re.I),
-        ]
-
         validated = []
         for fp_name in fluorophores:
-            # Known dye — pass through
-            if fp_name in KNOWN_DYES:
-                validated.append(fp_name)
-                continue
-
-            # Dye family — pass through
-            if any(p.match(fp_name) for p in DYE_FAMILY_PATTERNS):
+            # Known dye or dye family — pass through
+            if _is_known_dye(fp_name):
                 validated.append(fp_name)
                 continue
 
@@ -336,7 +418,11 @@ class ApiValidator:
             self._ror_cache[ror_id] = result
             return result
 
-        except Exception:
+        except Exception as exc:
+            # Remember the miss like the other validators do, so a chunk's
+            # papers don't each retry an unreachable API
+            logger.debug("ROR lookup failed for %s: %s", ror_id, exc)
+            self._ror_cache[ror_id] = None
             return None
 
     # ------------------------------------------------------------------
@@ -444,26 +530,32 @@ class ApiValidator:
         if not self._cellosaurus:
             return []
 
+        gazetteer = self._get_cell_line_gazetteer()
         metadata: List[Dict[str, Any]] = []
         for name in cell_lines:
-            # Check local Cellosaurus first
-            if self._local_lookup:
-                local_cl = self._local_lookup.cell_line(name)
-                if local_cl:
-                    entry = {
-                        "name": name,
-                        "validated": True,
-                        "cellosaurus_accession": local_cl.get("accession", ""),
-                        "canonical_name": local_cl.get("name", name),
-                        "species": local_cl.get("species", ""),
-                        "disease": local_cl.get("disease", ""),
-                        "category": local_cl.get("category", ""),
-                    }
-                    metadata.append(entry)
-                    continue
+            # Primary cultures have no Cellosaurus entry — skip the query
+            if not gazetteer.is_catalogued(name):
+                metadata.append({"name": name, "validated": False})
+                continue
+
+            # Check local Cellosaurus first (canonical names, synonyms and
+            # hyphen/space variants all resolve here)
+            local_cl = gazetteer.resolve(name)
+            if local_cl:
+                entry = {
+                    "name": name,
+                    "validated": True,
+                    "cellosaurus_accession": local_cl.get("accession", ""),
+                    "canonical_name": local_cl.get("name", name),
+                    "species": local_cl.get("species", ""),
+                    "disease": local_cl.get("disease", ""),
+                    "category": local_cl.get("category", ""),
+                }
+                metadata.append(entry)
+                continue
 
             # API fallback
-            result = self._cellosaurus.validate(name) if self._cellosaurus else None
+            result = self._cellosaurus.validate(gazetteer.query_name(name))
             if result:
                 entry = {
                     "name": name,
@@ -486,6 +578,23 @@ class ApiValidator:
                 })
         return metadata
 
+    def _get_cell_line_gazetteer(self):
+        """Build the cell line gazetteer once from the local indexes."""
+        if self._cell_line_gazetteer is None:
+            with self._gazetteer_lock:
+                if self._cell_line_gazetteer is None:
+                    from .cell_line_gazetteer import CellLineGazetteer
+                    indexes = []
+                    if self._local_lookup:
+                        indexes.append(self._local_lookup.cell_line_index())
+                    indexes.append(self._cellosaurus.local_index())
+                    self._cell_line_gazetteer = CellLineGazetteer(indexes)
+                    logger.debug(
+                        "Cell line gazetteer built: %d names",
+                        len(self._cell_line_gazetteer),
+                    )
+        return self._cell_line_gazetteer
+
     # ------------------------------------------------------------------
     # PubTator supplemental extraction (for papers with PMIDs)
     # ------------------------------------------------------------------
@@ -0,0 +1,207 @@
+"""
+Cell line gazetteer: canonical names and Cellosaurus synonyms → records.
+
+CellLineAgent emits the pipeline's full canonical names ("HeLa (Henrietta
+Lacks)", "Human Embryonic Kidney 293T").  Those never match a Cellosaurus
+name, so every one used to fall through to the Cellosaurus search API.
+The gazetteer closes that gap without a network call:
+
+  - CELLOSAURUS_NAMES maps each canonical name to the Cellosaurus name to
+    resolve, or to None for primary cultures and stem-cell types, which are
+    not catalogued cell lines and are never worth a query.
+  - Every key of the local Cellosaurus indexes (primary names and all
+    synonyms) is indexed again under a normalized form, so "HEK-293",
+    "HEK 293" and "hek293" all resolve to the same record.
+
+Usage:
+    from pipeline.validation.cell_line_gazetteer import CellLineGazetteer
+    gazetteer = CellLineGazetteer([local_lookup.cell_line_index()])
+    gazetteer.resolve("Human Embryonic Kidney 293T")
+    # → {"accession": "CVCL_0063", "name": "HEK293T", ...}
+"""
+
+import re
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple
+
+# ======================================================================
+# Canonical name → Cellosaurus name (None = not a catalogued cell line)
+# ======================================================================
+
+CELLOSAURUS_NAMES: Dict[str, Optional[str]] = {
+    "HeLa (Henrietta Lacks)": "HeLa",
+    "Human Embryonic Kidney 293": "HEK293",
+    "Human Embryonic Kidney 293T": "HEK293T",
+    "Human Osteosarcoma U2OS": "U2OS",
+    "African Green Monkey Kidney COS-7": "COS-7",
+    "Human Lung Adenocarcinoma A549": "A549",
+    "Human Breast Adenocarcinoma MCF-7": "MCF-7",
+    "NIH 3T3 Mouse Fibroblast": "NIH 3T3",
+    "Chinese Hamster Ovary": "CHO",
+    "Madin-Darby Canine Kidney": "MDCK",
+    "Vero (African Green Monkey Kidney)": "Vero",
+    "Human Neuroblastoma SH-SY5Y": "SH-SY5Y",
+    "Rat Pheochromocytoma PC-12": "PC-12",
+    "Human T-cell Leukemia Jurkat": "Jurkat",
+    "Human Chronic Myelogenous Leukemia K562": "K-562",
+    "Human Hepatocellular Carcinoma HepG2": "Hep-G2",
+    "Human Colorectal Adenocarcinoma Caco-2": "Caco-2",
+    "Human Colorectal Adenocarcinoma HT-29": "HT-29",
+    "Human Colorectal Carcinoma HCT116": "HCT 116",
+    "Human Breast Adenocarcinoma MDA-MB-231": "MDA-MB-231",
+    "Human Acute Monocytic Leukemia THP-1": "THP-1",
+    "Human Promyelocytic Leukemia HL-60": "HL-60",
+    "Mouse Neuroblastoma Neuro-2a": "Neuro-2a",
+    "Mouse Myoblast C2C12": "C2C12",
+    "Mouse Fibroblast L929": "L929",
+    "Baby Hamster Kidney BHK-21": "BHK-21",
+    "Human Colorectal Adenocarcinoma DLD-1": "DLD-1",
+    "Human Colorectal Adenocarcinoma SW480": "SW480",
+    "Human Breast Carcinoma SK-BR-3": "SK-BR-3",
+    "Human Pancreatic Carcinoma PANC-1": "PANC-1",
+    "Human Mammary Epithelial MCF-10A": "MCF-10A",
+    "Human Fetal Lung Fibroblast IMR-90": "IMR-90",
+    "Human Fetal Lung Fibroblast WI-38": "WI-38",
+    "Human Foreskin Fibroblast BJ": "BJ",
+    "Mouse Mammary Carcinoma 4T1": "4T1",
+    "Mouse Lewis Lung Carcinoma LLC": "LL/2",
+    "Mouse Melanoma B16": "B16",
+    "Mouse Colon Carcinoma CT26": "CT26",
+    "Mouse Macrophage RAW 264.7": "RAW 264.7",
+    "Human Cervical Carcinoma SiHa": "SiHa",
+    "Human Retinal Pigment Epithelium ARPE-19": "ARPE-19",
+    "Human Embryonic Kidney Lenti-X 293T": "Lenti-X 293T",
+    "Rat Glioma C6": "C6",
+    "Dog Kidney MDCK-II": "MDCK II",
+    "Human Prostate Cancer PC-3": "PC-3",
+    "Human Prostate Cancer LNCaP": "LNCaP",
+    "Human Glioblastoma U-87 MG": "U-87MG ATCC",
+    "Human Glioblastoma U-251 MG": "U-251MG",
+    "Human Non-Small Cell Lung Cancer NCI-H460": "NCI-H460",
+    "Human T Lymphoblast CCRF-CEM": "CCRF-CEM",
+
+    # Primary cultures and stem-cell types — no Cellosaurus accession
+    "Mouse Embryonic Fibroblast": None,
+    "Induced Pluripotent Stem Cell": None,
+    "Embryonic Stem Cell": None,
+    "Human Umbilical Vein Endothelial Cell": None,
+    "Primary Neurons": None,
+    "Primary Cardiomyocytes": None,
+    "Primary Hepatocytes": None,
+    "Primary T Cells": None,
+    "Primary B Cells": None,
+    "Primary Natural Killer Cells": None,
+    "Primary Macrophages": None,
+    "Primary Dendritic Cells": None,
+    "Primary Neutrophils": None,
+    "Primary Fibroblasts": None,
+    "Primary Keratinocytes": None,
+    "Primary Endothelial Cells": None,
+    "Primary Astrocytes": None,
+    "Primary Microglia": None,
+    "Primary Oligodendrocytes": None,
+    "Primary Epithelial Cells": None,
+    "Primary Mesenchymal Stem Cells": None,
+    "Neural Stem Cells": None,
+    "Hematopoietic Stem Cells": None,
+    "Primary Monocytes": None,
+    "Primary Osteoblasts": None,
+    "Primary Osteoclasts": None,
+    "Primary Chondrocytes": None,
+    "Primary Podocytes": None,
+    "Primary Schwann Cells": None,
+    "Primary Muscle Satellite Cells": None,
+}
+
+# Separators that vary freely between spellings of the same line
+# ("HEK-293" / "HEK 293" / "HEK293", "LL/2" / "LL2").
+_SEPARATOR_RE = re.compile(r"[\s\-_/]+")
+
+
+def normalize_cell_line_name(name: str) -> str:
+    """Lowercase *name* and drop hyphen, space, underscore and slash."""
+    return _SEPARATOR_RE.sub("", name.strip().lower())
+
+
+def normalized_index(index: Mapping[str, Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """Re-key a Cellosaurus index by normalize_cell_line_name().
+
+    Under a normalized key, a record whose primary name normalizes to that
+    key beats one that only lists it as a synonym.  download_lookup_data.py
+    stores this map as the Cellosaurus lookup store's alternate key space.
+    """
+    normalized: Dict[str, Dict[str, Any]] = {}
+    for key, entry in index.items():
+        norm = normalize_cell_line_name(key)
+        if not norm:
+            continue
+        held = normalized.get(norm)
+        if held is None:
+            normalized[norm] = entry
+        elif (normalize_cell_line_name(entry.get("name", "")) == norm
+                and normalize_cell_line_name(held.get("name", "")) != norm):
+            normalized[norm] = entry
+    return normalized
+
+
+class CellLineGazetteer:
+    """Resolve cell line names to Cellosaurus records without the API.
+
+    Built once from one or more local Cellosaurus indexes (lowercase name or
+    synonym → record, as produced by download_lookup_data.py and
+    CellosaurusClient's flat-file loader).  Read-only after construction.
+
+    An index may be a plain dict or a LookupStore; a store already carries
+    the normalized keys (``get_alt``), so it is queried in place instead of
+    being copied into memory.
+    """
+
+    def __init__(self, indexes: Iterable[Mapping[str, Dict[str, Any]]] = ()):
+        # (exact lookup, normalized lookup) per index, in priority order
+        self._sources: List[Tuple[Callable, Callable]] = []
+        self._size = 0
+        for index in indexes:
+            self.add_index(index)
+
+    def add_index(self, index: Mapping[str, Dict[str, Any]]) -> None:
+        """Add a local Cellosaurus index; earlier indexes win on conflicts."""
+        get_alt = getattr(index, "get_alt", None)
+        if get_alt is not None:
+            self._sources.append((index.get, get_alt))
+        else:
+            self._sources.append((index.get, normalized_index(index).get))
+        self._size += len(index)
+
+    def __len__(self) -> int:
+        """Number of indexed names and synonyms (summed over indexes)."""
+        return self._size
+
+    @staticmethod
+    def is_catalogued(name: str) -> bool:
+        """False for canonical names that are not Cellosaurus cell lines."""
+        return not (name in CELLOSAURUS_NAMES and CELLOSAURUS_NAMES[name] is None)
+
+    @staticmethod
+    def query_name(name: str) -> str:
+        """Return the Cellosaurus name to search for *name*."""
+        return CELLOSAURUS_NAMES.get(name) or name
+
+    def resolve(self, name: str) -> Optional[Dict[str, Any]]:
+        """Return the local Cellosaurus record for *name*, or None.
+
+        *name* may be a canonical pipeline name, a Cellosaurus name or any
+        synonym, in any hyphen/space spelling.
+        """
+        if not name or not self.is_catalogued(name):
+            return None
+        for candidate in (self.query_name(name), name):
+            key = candidate.strip().lower()
+            for exact, _ in self._sources:
+                entry = exact(key)
+                if entry is not None:
+                    return entry
+            norm = normalize_cell_line_name(key)
+            for _, normalized in self._sources:
+                entry = normalized(norm)
+                if entry is not None:
+                    return entry
+        return None
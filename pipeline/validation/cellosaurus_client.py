@@ -28,6 +28,8 @@ import re
 import time
 from typing import Any, Dict, List, Optional, Set
 
+from .. import load_costs
+
 logger = logging.getLogger(__name__)
 
 try:
@@ -53,11 +55,8 @@ class CellosaurusClient:
         self._exhausted = False
         self._local_index: Dict[str, Dict[str, Any]] = {}
         self._local_loaded = False
-        self._local_path = local_path
-
-    def _ensure_local_loaded(self) -> None:
-        if not self._local_loaded and self._local_path:
-            self._load_local(self._local_path)
+        self._local_loader = load_costs.LazyLoad(
+            "Cellosaurus flat file", self._load_local, local_path or None)
 
     def _load_local(self, path: str):
         """Parse cellosaurus.txt flat file into a fast lookup index."""
@@ -136,6 +135,14 @@ class CellosaurusClient:
     # Public API
     # ------------------------------------------------------------------
 
+    def local_index(self) -> Dict[str, Dict[str, Any]]:
+        """Return the flat-file index (lowercase name/synonym → record).
+
+        Empty when no local_path was given or the file is missing.
+        """
+        self._local_loader.ensure()
+        return self._local_index
+
     def validate(self, cell_line_name: str) -> Optional[Dict[str, Any]]:
         """Validate a single cell line name against Cellosaurus.
 
@@ -166,7 +173,7 @@ class CellosaurusClient:
         if cache_key in self._cache:
             return self._cache[cache_key]
 
-        self._ensure_local_loaded()
+        self._local_loader.ensure()
 
         # LOCAL FIRST
         if self._local_loaded:
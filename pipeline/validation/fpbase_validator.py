@@ -6,14 +6,18 @@ spectral properties (excitation/emission maxima, quantum yield).
 Results are cached to avoid repeated API calls.
 
 Supports local-first validation via fpbase_name_lookup.json (downloaded
-by download_lookup_tables.sh).  Falls back to live API if local lookup
-misses or is not loaded.
+by download_lookup_tables.sh), or the compact fpbase_name_lookup.sqlite
+store built from it by ``download_lookup_data.py --compact``.  Falls back
+to live API if local lookup misses or is not loaded.
 """
 
 import json
 import logging
 import os
-from typing import Dict, Optional
+from typing import Dict, Mapping, Optional
+
+from .. import load_costs
+from .lookup_store import open_lookup_store, store_path_for
 
 logger = logging.getLogger(__name__)
 
@@ -32,18 +36,24 @@ class FPbaseValidator:
     def __init__(self, lookup_path: str = None):
         self._cache: Dict[str, Optional[Dict]] = {}
         self._name_set: Optional[set] = None
-        self._local_lookup: Dict[str, Dict] = {}
+        self._local_lookup: Mapping[str, Dict] = {}
         self._local_loaded = False
-
-        if lookup_path:
-            self._load_local(lookup_path)
+        self._local_loader = load_costs.LazyLoad(
+            "FPbase lookup", self._load_local, lookup_path or None)
 
     def _load_local(self, path: str):
-        """Load fpbase_name_lookup.json for instant local validation."""
+        """Open the FPbase lookup store, else load fpbase_name_lookup.json."""
         json_path = path
         if os.path.isdir(path):
             json_path = os.path.join(path, "fpbase_name_lookup.json")
 
+        store = open_lookup_store(store_path_for(json_path))
+        if store is not None:
+            self._local_lookup = store
+            self._local_loaded = True
+            logger.info("FPbase local lookup store opened: %d entries", len(store))
+            return
+
         if not os.path.exists(json_path):
             logger.warning("FPbase lookup not found at %s", json_path)
             return
@@ -63,6 +73,7 @@ class FPbaseValidator:
             return self._name_set
 
         # LOCAL FIRST: build from downloaded lookup
+        self._local_loader.ensure()
         if self._local_loaded:
             names = set()
             for key, entry in self._local_lookup.items():
@@ -113,6 +124,7 @@ class FPbaseValidator:
             return self._cache[name]
 
         # LOCAL FIRST
+        self._local_loader.ensure()
         if self._local_loaded:
             entry = self._local_lookup.get(name.lower())
             if entry and isinstance(entry, dict):
@@ -6,7 +6,9 @@ instant in-memory lookups. Falls back to API ONLY for entities not found
 locally.
 
 Architecture:
-    1. Load JSON indexes from microhub_lookup_tables/ (one-time, ~5 seconds)
+    1. Open the lookup stores written by download_lookup_data.py
+       (SQLite, milliseconds; see lookup_store.py) — or, for tables that
+       only exist as legacy JSON, load the JSON index (one-time, ~5 seconds)
     2. All validate/lookup calls check local index first (< 1ms)
     3. Only if NOT found locally → make API call (slow path)
     4. API results are cached back to the local index for next run
@@ -38,8 +40,12 @@ Usage:
 import json
 import logging
 import os
+import threading
 import time
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Mapping, Optional
+
+from .. import load_costs
+from .lookup_store import open_lookup_store, store_path_for
 
 logger = logging.getLogger(__name__)
 
@@ -68,18 +74,20 @@ def _find_lookup_dir() -> Optional[str]:
 class LocalLookup:
     """Unified local-first lookup across all bulk data sources.
 
-    Loads JSON indexes lazily on first access. Thread-safe for reads.
+    Opens indexes lazily on first access. Each index is a LookupStore when
+    one exists, else a dict loaded from JSON. Thread-safe for reads.
     """
 
     def __init__(self, lookup_dir: Optional[str] = None):
         self._dir = lookup_dir or _find_lookup_dir()
         self._loaded = False
+        self._load_lock = threading.Lock()
 
         # Indexes — populated by _ensure_loaded()
-        self._ror_index: Dict[str, Dict] = {}
-        self._cellosaurus_index: Dict[str, Dict] = {}
-        self._taxonomy_index: Dict[str, Dict] = {}
-        self._fpbase_index: Dict[str, Dict] = {}
+        self._ror_index: Mapping[str, Dict] = {}
+        self._cellosaurus_index: Mapping[str, Dict] = {}
+        self._taxonomy_index: Mapping[str, Dict] = {}
+        self._fpbase_index: Mapping[str, Dict] = {}
 
         # Track what we've loaded
         self._available = set()
@@ -153,6 +161,14 @@ class LocalLookup:
             return None
         return self._cellosaurus_index.get(name.strip().lower())
 
+    def cell_line_index(self) -> Mapping[str, Dict[str, Any]]:
+        """Return the whole Cellosaurus index (lowercase name → record).
+
+        A LookupStore when the compact table exists, else a dict.
+        """
+        self._ensure_loaded()
+        return self._cellosaurus_index
+
     def taxon(self, organism_name: str) -> Optional[Dict[str, Any]]:
         """Look up NCBI taxonomy data for an organism name."""
         self._ensure_loaded()
@@ -212,8 +228,16 @@ class LocalLookup:
     def _ensure_loaded(self):
         if self._loaded:
             return
-        self._loaded = True
-
+        # Indexes are read from several threads (step 3 overlaps extraction
+        # with API enrichment); only publish _loaded once they are filled.
+        with self._load_lock:
+            if self._loaded:
+                return
+            with load_costs.timed("Local lookup tables (ROR, Cellosaurus, taxonomy, FPbase)"):
+                self._load_indexes()
+            self._loaded = True
+
+    def _load_indexes(self):
         if not self._dir or not os.path.isdir(self._dir):
             logger.warning(
                 "Local lookup tables not found. Run download_lookup_data.py first. "
@@ -224,10 +248,10 @@ class LocalLookup:
         t0 = time.time()
 
         # Load each file if present
-        self._ror_index = self._load_json("ror_lookup.json", "ROR")
-        self._cellosaurus_index = self._load_json("cellosaurus_lookup.json", "Cellosaurus")
-        self._taxonomy_index = self._load_json("taxonomy_lookup.json", "NCBI Taxonomy")
-        self._fpbase_index = self._load_json("fpbase_lookup.json", "FPbase")
+        self._ror_index = self._load_index("ror_lookup.json", "ROR")
+        self._cellosaurus_index = self._load_index("cellosaurus_lookup.json", "Cellosaurus")
+        self._taxonomy_index = self._load_index("taxonomy_lookup.json", "NCBI Taxonomy")
+        self._fpbase_index = self._load_index("fpbase_lookup.json", "FPbase")
 
         elapsed = time.time() - t0
         logger.info(
@@ -238,6 +262,17 @@ class LocalLookup:
             len(self._taxonomy_index), len(self._fpbase_index),
         )
 
+    def _load_index(self, filename: str, label: str) -> Mapping:
+        """Open the lookup store for *filename*, else load the JSON file."""
+        if not self._dir:
+            return {}
+        store = open_lookup_store(store_path_for(os.path.join(self._dir, filename)))
+        if store is not None:
+            self._available.add(label.lower())
+            logger.info("  %s: %d entries (lookup store)", label, len(store))
+            return store
+        return self._load_json(filename, label)
+
     def _load_json(self, filename: str, label: str) -> Dict:
         if not self._dir:
             return {}
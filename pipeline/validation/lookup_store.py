@@ -0,0 +1,251 @@
+"""
+Compact, indexed lookup stores for the bulk validation tables.
+
+download_lookup_data.py used to write each lookup table (ROR, Cellosaurus,
+NCBI taxonomy, FPbase) as one JSON object that every run parsed in full with
+``json.load`` — tens of seconds and hundreds of MB before the first lookup.
+A lookup store holds the same ``key → record`` mapping in a SQLite file:
+
+  - ``records``   each distinct record once, as compact JSON
+  - ``keys``      lowercase lookup key → record id (WITHOUT ROWID, so the
+                  primary-key B-tree is a covering index for point lookups)
+  - ``alt_keys``  optional second key space (e.g. normalized cell line names)
+  - ``meta``      format version, table name, entry counts
+
+Opening a store costs a few milliseconds; a lookup is one indexed query and
+decodes only the record it returns.  Stores are written next to where the
+JSON file would live, with a ``.sqlite`` suffix, and loaders fall back to
+the JSON file when no store (or a store of another format version) exists.
+
+Usage:
+    from pipeline.validation.lookup_store import write_lookup_store, open_lookup_store
+    write_lookup_store("ror_lookup.sqlite", index, name="ror")
+    store = open_lookup_store("ror_lookup.sqlite")
+    store.get("harvard university")
+    # → {"ror_id": "03vek6s52", "name": "Harvard University", ...}
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections.abc import Mapping
+from typing import Any, Dict, Iterator, Optional, Tuple
+from urllib.request import pathname2url
+
+logger = logging.getLogger(__name__)
+
+# Bump when the schema or record encoding changes; readers refuse stores
+# written with another version and fall back to the JSON tables.
+FORMAT_VERSION = 1
+
+STORE_SUFFIX = ".sqlite"
+
+
+def store_path_for(json_path: str) -> str:
+    """Return the store path that replaces *json_path* (``x.json`` → ``x.sqlite``)."""
+    return os.path.splitext(json_path)[0] + STORE_SUFFIX
+
+
+# ======================================================================
+# Writing
+# ======================================================================
+
+def write_lookup_store(path: str, index: Mapping,
+                       alt_index: Optional[Mapping] = None,
+                       name: str = "",
+                       extra_meta: Optional[Dict[str, str]] = None) -> str:
+    """Write *index* (key → record dict) as a lookup store at *path*.
+
+    Records shared by several keys (aliases, synonyms) are stored once.
+    *alt_index* fills the optional second key space; *extra_meta* is stored
+    alongside the format version (e.g. a signature of the source file).
+    The store is built in a per-process temporary file and moved into
+    place, so readers — and concurrent builders — never see a partial file.
+    Returns *path*.
+    """
+    tmp_path = "%s.%d.tmp" % (path, os.getpid())
+    if os.path.exists(tmp_path):
+        os.remove(tmp_path)
+
+    record_ids: Dict[str, int] = {}
+
+    def _rows(mapping: Mapping) -> Iterator[Tuple[str, int]]:
+        for key, record in mapping.items():
+            data = json.dumps(record, ensure_ascii=False, sort_keys=True,
+                              separators=(",", ":"))
+            rid = record_ids.get(data)
+            if rid is None:
+                rid = record_ids[data] = len(record_ids) + 1
+                conn.execute("INSERT INTO records (id, data) VALUES (?, ?)",
+                             (rid, data))
+            yield key, rid
+
+    conn = sqlite3.connect(tmp_path)
+    try:
+        conn.execute("PRAGMA journal_mode=OFF")
+        conn.execute("PRAGMA synchronous=OFF")
+        conn.executescript("""
+            CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT NOT NULL) WITHOUT ROWID;
+            CREATE TABLE records (id INTEGER PRIMARY KEY, data TEXT NOT NULL);
+            CREATE TABLE keys (
+                key TEXT PRIMARY KEY, record_id INTEGER NOT NULL
+            ) WITHOUT ROWID;
+            CREATE TABLE alt_keys (
+                key TEXT PRIMARY KEY, record_id INTEGER NOT NULL
+            ) WITHOUT ROWID;
+        """)
+        conn.executemany(
+            "INSERT OR REPLACE INTO keys (key, record_id) VALUES (?, ?)",
+            _rows(index),
+        )
+        if alt_index:
+            conn.executemany(
+                "INSERT OR REPLACE INTO alt_keys (key, record_id) VALUES (?, ?)",
+                _rows(alt_index),
+            )
+        entries = conn.execute("SELECT COUNT(*) FROM keys").fetchone()[0]
+        conn.executemany(
+            "INSERT INTO meta (key, value) VALUES (?, ?)",
+            [
+                ("format_version", str(FORMAT_VERSION)),
+                ("name", name),
+                ("entries", str(entries)),
+                ("records", str(len(record_ids))),
+                ("built_at", time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())),
+            ] + sorted((extra_meta or {}).items()),
+        )
+        conn.commit()
+        conn.execute("VACUUM")
+    except BaseException:
+        conn.close()
+        os.remove(tmp_path)
+        raise
+    conn.close()
+
+    os.replace(tmp_path, path)
+    logger.info("Lookup store %s: %d keys → %d records (%.1f MB)",
+                os.path.basename(path), entries, len(record_ids),
+                os.path.getsize(path) / 1e6)
+    return path
+
+
+def compact_json_lookup(json_path: str, name: str = "") -> str:
+    """Convert an existing ``key → record`` JSON table into a lookup store."""
+    with open(json_path, "r", encoding="utf-8") as f:
+        index = json.load(f)
+    return write_lookup_store(store_path_for(json_path), index,
+                              name=name or os.path.basename(json_path))
+
+
+# ======================================================================
+# Reading
+# ======================================================================
+
+class LookupStore(Mapping):
+    """Read-only ``key → record`` mapping backed by a lookup store.
+
+    Behaves like the dict ``json.load`` used to return (``get``, ``in``,
+    ``len``, iteration), but answers each lookup with one indexed query.
+    A single connection is shared between threads under a lock; lookups
+    are short enough that this never contends in practice.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        uri = "file:%s?mode=ro" % pathname2url(os.path.abspath(path))
+        self._conn = sqlite3.connect(uri, uri=True, check_same_thread=False)
+        self._lock = threading.Lock()
+        self.meta: Dict[str, str] = dict(
+            self._conn.execute("SELECT key, value FROM meta").fetchall()
+        )
+        self._len = int(self.meta.get("entries", 0))
+
+    @property
+    def format_version(self) -> int:
+        return int(self.meta.get("format_version", 0))
+
+    def _query(self, sql: str, params: Tuple = ()) -> Optional[Tuple]:
+        with self._lock:
+            return self._conn.execute(sql, params).fetchone()
+
+    def get(self, key: str, default: Any = None) -> Any:
+        row = self._query(
+            "SELECT r.data FROM keys k JOIN records r ON r.id = k.record_id "
+            "WHERE k.key = ?", (key,),
+        )
+        return json.loads(row[0]) if row else default
+
+    def get_alt(self, key: str, default: Any = None) -> Any:
+        """Look *key* up in the alternate key space."""
+        row = self._query(
+            "SELECT r.data FROM alt_keys k JOIN records r ON r.id = k.record_id "
+            "WHERE k.key = ?", (key,),
+        )
+        return json.loads(row[0]) if row else default
+
+    def __getitem__(self, key: str) -> Any:
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key: object) -> bool:
+        return self._query("SELECT 1 FROM keys WHERE key = ?", (key,)) is not None
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __iter__(self) -> Iterator[str]:
+        for key, _ in self.items():
+            yield key
+
+    def items(self) -> Iterator[Tuple[str, Any]]:
+        """Stream every ``(key, record)`` pair in key order.
+
+        Uses its own cursor, so a long scan does not hold the lookup lock.
+        """
+        uri = "file:%s?mode=ro" % pathname2url(os.path.abspath(self.path))
+        conn = sqlite3.connect(uri, uri=True)
+        try:
+            for key, data in conn.execute(
+                "SELECT k.key, r.data FROM keys k "
+                "JOIN records r ON r.id = k.record_id ORDER BY k.key"
+            ):
+                yield key, json.loads(data)
+        finally:
+            conn.close()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+_MISSING = object()
+
+
+def open_lookup_store(path: str) -> Optional[LookupStore]:
+    """Open the lookup store at *path*, or return None.
+
+    None means there is no usable store: the file is missing, unreadable,
+    or written with another FORMAT_VERSION.  Callers then fall back to the
+    JSON table.
+    """
+    if not os.path.exists(path):
+        return None
+    try:
+        store = LookupStore(path)
+    except sqlite3.Error as exc:
+        logger.warning("Lookup store %s unreadable (%s); ignoring it", path, exc)
+        return None
+    if store.format_version != FORMAT_VERSION:
+        logger.warning(
+            "Lookup store %s has format version %s (expected %d); "
+            "re-run download_lookup_data.py. Falling back to JSON.",
+            path, store.meta.get("format_version"), FORMAT_VERSION,
+        )
+        store.close()
+        return None
+    return store
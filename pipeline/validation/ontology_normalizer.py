@@ -36,6 +36,8 @@ import time
 from typing import Any, Dict, List, Optional
 from urllib.parse import quote
 
+from .. import load_costs
+
 logger = logging.getLogger(__name__)
 
 try:
@@ -294,8 +296,8 @@ class OntologyNormalizer:
         for name, mapping in _TECHNIQUE_TO_FBBI.items():
             self._cache[name.lower()] = mapping
 
-        if local_path:
-            self._load_local(local_path)
+        self._local_loader = load_costs.LazyLoad(
+            "FBbi ontology lookup", self._load_local, local_path or None)
 
     def _load_local(self, path: str):
         """Load fbbi_name_lookup.json for comprehensive ontology matching."""
@@ -349,6 +351,7 @@ class OntologyNormalizer:
             return self._cache[cache_key]
 
         # LOCAL LOOKUP (comprehensive, from downloaded OBO)
+        self._local_loader.ensure()
         if self._local_loaded:
             entry = self._local_lookup.get(cache_key)
             if entry and isinstance(entry, dict):
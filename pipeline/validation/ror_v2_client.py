@@ -28,6 +28,8 @@ import time
 from typing import Any, Dict, List, Optional
 from urllib.parse import quote
 
+from .. import load_costs
+
 logger = logging.getLogger(__name__)
 
 try:
@@ -79,9 +81,8 @@ class RORv2Client:
         self._local_index: Dict[str, Dict] = {}  # lowercase name → match payload
         self._local_loaded = False
         self._local_lookup = local_lookup
-
-        if local_path:
-            self._load_local(local_path)
+        self._local_loader = load_costs.LazyLoad(
+            "ROR dump (ROR v2 client)", self._load_local, local_path or None)
 
     def _load_local(self, path: str):
         """Load ROR data dump JSON for local name → ROR ID matching."""
@@ -164,6 +165,7 @@ class RORv2Client:
 
     def lookup_local(self, institution_name: str) -> Optional[Dict]:
         """Fast local lookup by exact institution name."""
+        self._local_loader.ensure()
         if not self._local_loaded:
             return None
         return self._local_index.get(institution_name.lower().strip())
@@ -217,6 +219,7 @@ class RORv2Client:
                 return result
 
         # Local exact match first
+        self._local_loader.ensure()
         if self._local_loaded:
             local_hit = self.lookup_local(affiliation)
             if local_hit is not None:
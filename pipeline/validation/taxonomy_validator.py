@@ -7,11 +7,23 @@ extractions with taxonomic identifiers.
 Supports local-first validation via NCBI names.dmp (downloaded by
 download_lookup_tables.sh).  Falls back to the live NCBI API if
 local lookup misses or is not loaded.
+
+names.dmp is never held in memory.  On first use it is streamed once into
+a compact lookup store next to it (taxonomy_names.sqlite, see
+lookup_store.py) restricted to the name classes — and, when nodes.dmp is
+present, the ranks — that organism matching uses.  Later runs and workers
+just open that store.  Scientific names form the primary key space; common
+names and synonyms sit in the alternate key space, consulted only on a miss.
+The store is rebuilt when names.dmp changes.
 """
 
 import logging
 import os
-from typing import Dict, List, Optional
+import sqlite3
+from typing import Dict, List, Optional, Tuple
+
+from .. import load_costs
+from .lookup_store import LookupStore, open_lookup_store, write_lookup_store
 
 logger = logging.getLogger(__name__)
 
@@ -44,20 +56,39 @@ NCBI_TAXIDS: Dict[str, int] = {
 
 _PUBTATOR_API = "https://www.ncbi.nlm.nih.gov/research/pubtator3-api"
 
+# Compact index built from names.dmp (stored in the same directory)
+TAXONOMY_INDEX_FILENAME = "taxonomy_names.sqlite"
+
+# names.dmp name classes worth indexing; the rest (authorities, type
+# material, misspellings, ...) are most of the file and never match
+_INDEXED_NAME_CLASSES = frozenset({
+    "scientific name", "common name", "synonym", "equivalent name",
+    "genbank common name",
+})
+
+# Ranks kept when nodes.dmp is available (species and below, plus genera)
+_INDEXED_RANKS = frozenset({
+    "species", "subspecies", "varietas", "forma", "genus", "strain",
+})
+
+
+def _normalize_name(name: str) -> str:
+    """Lowercase *name* and collapse runs of whitespace."""
+    return " ".join(name.lower().split())
+
 
 class TaxonomyValidator:
     """Validate organism names against NCBI Taxonomy."""
 
     def __init__(self, local_path: str = None):
         self._cache: Dict[str, Optional[int]] = {}
-        self._local_names: Dict[str, int] = {}  # lowercase name → taxid
+        self._local_names: Optional[LookupStore] = None
         self._local_loaded = False
-
-        if local_path:
-            self._load_local(local_path)
+        self._local_loader = load_costs.LazyLoad(
+            "NCBI taxonomy index", self._load_local, local_path or None)
 
     def _load_local(self, path: str):
-        """Parse NCBI names.dmp for comprehensive name → TaxID mapping."""
+        """Open the taxonomy index for names.dmp, building it if stale."""
         names_path = path
         if os.path.isdir(path):
             names_path = os.path.join(path, "names.dmp")
@@ -66,39 +97,102 @@ class TaxonomyValidator:
             logger.warning("NCBI names.dmp not found at %s", names_path)
             return
 
-        count = 0
-        try:
-            with open(names_path, "r", encoding="utf-8") as f:
+        stat = os.stat(names_path)
+        signature = "%d:%d" % (stat.st_size, int(stat.st_mtime))
+        index_path = os.path.join(os.path.dirname(names_path),
+                                  TAXONOMY_INDEX_FILENAME)
+
+        store = open_lookup_store(index_path)
+        if store is not None and store.meta.get("source") != signature:
+            store.close()
+            store = None
+        if store is None:
+            try:
+                self._build_index(names_path, index_path, signature)
+            except (OSError, sqlite3.Error) as exc:
+                logger.warning("Failed to build NCBI taxonomy index: %s", exc)
+                return
+            store = open_lookup_store(index_path)
+            if store is None:
+                return
+
+        self._local_names = store
+        self._local_loaded = True
+        logger.info("NCBI taxonomy index opened: %d scientific names",
+                    len(store))
+
+    @staticmethod
+    def _build_index(names_path: str, index_path: str, signature: str) -> None:
+        """Stream names.dmp once into the compact taxonomy index."""
+        ranks: Dict[int, str] = {}
+        nodes_path = os.path.join(os.path.dirname(names_path), "nodes.dmp")
+        if os.path.exists(nodes_path):
+            with open(nodes_path, "r", encoding="utf-8") as f:
                 for line in f:
-                    parts = line.strip().split("\t|\t")
-                    if len(parts) >= 4:
-                        try:
-                            taxid = int(parts[0].strip())
-                        except ValueError:
-                            continue
-                        name = parts[1].strip()
-                        name_class = parts[3].rstrip("\t|").strip()
-
-                        # Index scientific names, common names, and synonyms
-                        if name_class in (
-                            "scientific name", "common name",
-                            "synonym", "equivalent name",
-                            "genbank common name",
-                        ):
-                            name_lower = name.lower()
-                            # Prefer scientific names over common names
-                            if (name_lower not in self._local_names
-                                    or name_class == "scientific name"):
-                                self._local_names[name_lower] = taxid
-                            count += 1
-
-            self._local_loaded = True
-            logger.info(
-                "NCBI taxonomy loaded: %d name entries, %d unique names",
-                count, len(self._local_names),
-            )
-        except Exception as exc:
-            logger.warning("Failed to load NCBI taxonomy: %s", exc)
+                    parts = line.split("\t|\t", 3)
+                    if len(parts) >= 3 and parts[2] in _INDEXED_RANKS:
+                        ranks[int(parts[0])] = parts[2]
+
+        scientific, other = TaxonomyValidator._read_names(
+            names_path, ranks if ranks else None)
+        write_lookup_store(
+            index_path,
+            {name: {"tax_id": taxid} for name, taxid in scientific.items()},
+            alt_index={name: {"tax_id": taxid} for name, taxid in other.items()},
+            name="ncbi_taxonomy",
+            extra_meta={"source": signature},
+        )
+        logger.info(
+            "NCBI taxonomy index built: %d scientific names, %d other names",
+            len(scientific), len(other),
+        )
+
+    @staticmethod
+    def _read_names(names_path: str, ranks: Optional[Dict[int, str]]
+                    ) -> Tuple[Dict[str, int], Dict[str, int]]:
+        """Return (scientific name → taxid, other name → taxid) from names.dmp.
+
+        A scientific name always wins over another class for the same key;
+        among the other classes the first occurrence wins.
+        """
+        scientific: Dict[str, int] = {}
+        other: Dict[str, int] = {}
+        with open(names_path, "r", encoding="utf-8") as f:
+            for line in f:
+                parts = line.strip().split("\t|\t")
+                if len(parts) < 4:
+                    continue
+                name_class = parts[3].rstrip("\t|").strip()
+                if name_class not in _INDEXED_NAME_CLASSES:
+                    continue
+                try:
+                    taxid = int(parts[0].strip())
+                except ValueError:
+                    continue
+                if ranks is not None and taxid not in ranks:
+                    continue
+                key = _normalize_name(parts[1])
+                if not key:
+                    continue
+                if name_class == "scientific name":
+                    scientific[key] = taxid
+                else:
+                    other.setdefault(key, taxid)
+        for key in scientific:
+            other.pop(key, None)
+        return scientific, other
+
+    def _lookup_local(self, organism: str) -> Optional[int]:
+        """Scientific names first; the full name index only on a miss.
+
+        Keys are case- and whitespace-normalized on both sides, so
+        "mus  Musculus" finds "Mus musculus".
+        """
+        key = _normalize_name(organism)
+        entry = self._local_names.get(key)
+        if entry is None:
+            entry = self._local_names.get_alt(key)
+        return entry["tax_id"] if entry is not None else None
 
     def get_taxid(self, organism: str) -> Optional[int]:
         """Return NCBI Taxonomy ID for a canonical organism name."""
@@ -112,8 +206,9 @@ class TaxonomyValidator:
             return self._cache[organism]
 
         # LOCAL LOOKUP (comprehensive)
+        self._local_loader.ensure()
         if self._local_loaded:
-            taxid = self._local_names.get(organism.lower())
+            taxid = self._lookup_local(organism)
             if taxid is not None:
                 self._cache[organism] = taxid
                 return taxid
@@ -0,0 +1,332 @@
+#!/usr/bin/env python3
+"""
+Tests for the chunk file helpers (pipeline/export/chunk_io.py).
+
+Tests the streaming JSON reader against json.load, ChunkWriter's output
+against json.dump(indent=2), the compressed JSON Lines formats, chunk
+discovery, and the export manifest helpers.
+"""
+
+import gzip
+import json
+import logging
+import os
+import sys
+import tempfile
+import time
+
+# Ensure project root is on the path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from pipeline.export import chunk_io
+from pipeline.export.chunk_io import (
+    HAS_ZSTD,
+    ChunkWriter,
+    find_chunk_files,
+    iter_chunk,
+    manifest_chunk_files,
+    read_manifest,
+    write_manifest,
+)
+
+# Paper lists written and read back.  Strings hold the characters the
+# streaming reader has to see past: brackets, commas, quotes, escapes.
+SAMPLE_CHUNKS = [
+    [],
+    [{"pmid": "1", "title": "One paper"}],
+    [
+        {"pmid": "2", "title": "Brackets ] [ and , commas", "year": 2020,
+         "tags": ["confocal", "GFP"], "score": 12.5, "oa": True, "doi": None},
+        {"pmid": "3", "title": "Quotes \" and \\ backslashes \\\" }", "nested":
+         {"a": [1, [2, [3, {}]]], "b": {"c": []}}, "unicode": "Förster – 488 nm µm"},
+        {"pmid": "4", "abstract": "line one\nline two\ttab", "count": -0.0001,
+         "big": 12345678901234567890, "exp": 1e-07},
+        "a bare string",
+        42,
+        [],
+    ],
+    [{"pmid": str(i), "full_text": "word " * (i * 37 % 400)} for i in range(60)],
+]
+
+# (name, text): malformed chunk files; iter_chunk must raise whenever
+# json.loads does.
+MALFORMED = [
+    ("empty file", ""),
+    ("whitespace only", "  \n "),
+    ("unterminated array", "[\n  {\"a\": 1}"),
+    ("trailing comma", "[1, 2,]"),
+    ("missing comma", "[1 2]"),
+    ("leading comma", "[, 1]"),
+    ("truncated object", "[{\"a\": 1}, {\"b\": ]"),
+    ("extra data", "[1, 2] x"),
+    ("two arrays", "[1][2]"),
+    ("unterminated string", "[\"abc]"),
+    ("truncated number", "[1, 2.]"),
+]
+
+
+def _json_dump_bytes(papers):
+    """What the exporter wrote before chunks were streamed."""
+    return json.dumps(papers, indent=2, ensure_ascii=False, default=str).encode("utf-8")
+
+
+def run_tests():
+    passed = 0
+    failed = 0
+    total = 0
+
+    def check(name, condition, detail=""):
+        nonlocal passed, failed, total
+        total += 1
+        if condition:
+            passed += 1
+            print(f"PASS  {total}: {name}")
+        else:
+            failed += 1
+            print(f"FAIL  {total}: {name}")
+            if detail:
+                print(f"         {detail}")
+
+    tmp = tempfile.TemporaryDirectory()
+    tmp_dir = tmp.name
+
+    # ================================================================
+    # Test 1: ChunkWriter — JSON output identical to json.dump(indent=2)
+    # ================================================================
+    bad = []
+    for i, papers in enumerate(SAMPLE_CHUNKS):
+        path = os.path.join(tmp_dir, f"w_chunk_{i}.json")
+        with ChunkWriter(path) as writer:
+            for paper in papers:
+                writer.write(paper)
+        with open(path, "rb") as f:
+            if f.read() != _json_dump_bytes(papers) or writer.count != len(papers):
+                bad.append(i)
+    check(
+        "ChunkWriter — byte-identical to json.dump(indent=2)",
+        not bad,
+        f"Differs for sample chunks {bad}",
+    )
+
+    # ================================================================
+    # Test 2: iter_chunk — round trip of every sample chunk
+    # ================================================================
+    bad = [i for i, papers in enumerate(SAMPLE_CHUNKS)
+           if list(iter_chunk(os.path.join(tmp_dir, f"w_chunk_{i}.json"))) != papers]
+    check(
+        "iter_chunk — reads back what ChunkWriter wrote",
+        not bad,
+        f"Differs for sample chunks {bad}",
+    )
+
+    # ================================================================
+    # Test 3: iter_chunk — values split across read blocks
+    # ================================================================
+    # Tiny read blocks put a block boundary inside every token, string
+    # and number at some point.
+    saved_block = chunk_io._READ_BLOCK
+    bad = []
+    try:
+        for block in (1, 2, 3, 7, 64):
+            chunk_io._READ_BLOCK = block
+            for i, papers in enumerate(SAMPLE_CHUNKS):
+                path = os.path.join(tmp_dir, f"w_chunk_{i}.json")
+                if list(iter_chunk(path)) != papers:
+                    bad.append((block, i))
+            # Compact JSON: no whitespace between values at all
+            path = os.path.join(tmp_dir, "compact_chunk_1.json")
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(SAMPLE_CHUNKS[2], f, ensure_ascii=False, separators=(",", ":"))
+            if list(iter_chunk(path)) != SAMPLE_CHUNKS[2]:
+                bad.append((block, "compact"))
+    finally:
+        chunk_io._READ_BLOCK = saved_block
+    check(
+        "iter_chunk — correct with block boundaries anywhere",
+        not bad,
+        f"Differs for (block size, chunk): {bad}",
+    )
+
+    # ================================================================
+    # Test 4: iter_chunk — a top-level object is a one-paper chunk
+    # ================================================================
+    path = os.path.join(tmp_dir, "object_chunk_1.json")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write('  {"pmid": "9", "title": "Single"}\n')
+    check(
+        "iter_chunk — single top-level object",
+        list(iter_chunk(path)) == [{"pmid": "9", "title": "Single"}],
+    )
+
+    # ================================================================
+    # Test 5: iter_chunk — malformed input raises like json.loads
+    # ================================================================
+    bad = []
+    try:
+        for block in (1, 4, saved_block):
+            chunk_io._READ_BLOCK = block
+            for name, text in MALFORMED:
+                path = os.path.join(tmp_dir, "bad_chunk_1.json")
+                with open(path, "w", encoding="utf-8") as f:
+                    f.write(text)
+                try:
+                    json.loads(text)
+                    bad.append((block, name, "fixture parses"))
+                    continue
+                except json.JSONDecodeError:
+                    pass
+                try:
+                    list(iter_chunk(path))
+                    bad.append((block, name, "no error"))
+                except json.JSONDecodeError:
+                    pass
+    finally:
+        chunk_io._READ_BLOCK = saved_block
+    check(
+        "iter_chunk — JSONDecodeError on malformed input",
+        not bad,
+        f"Not raised: {bad}",
+    )
+
+    # ================================================================
+    # Test 6: .jsonl.gz — one compact paper per line, round trip
+    # ================================================================
+    papers = SAMPLE_CHUNKS[2]
+    path = os.path.join(tmp_dir, "g_chunk_1.jsonl.gz")
+    with ChunkWriter(path) as writer:
+        for paper in papers:
+            writer.write(paper)
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        lines = f.read().splitlines()
+    check(
+        "ChunkWriter/iter_chunk — .jsonl.gz round trip",
+        list(iter_chunk(path)) == papers
+        and [json.loads(line) for line in lines] == papers,
+        f"{len(lines)} lines for {len(papers)} papers",
+    )
+
+    # ================================================================
+    # Test 7: .jsonl.zst round trip (needs zstandard)
+    # ================================================================
+    if HAS_ZSTD:
+        path = os.path.join(tmp_dir, "z_chunk_1.jsonl.zst")
+        with ChunkWriter(path) as writer:
+            for paper in papers:
+                writer.write(paper)
+        check("ChunkWriter/iter_chunk — .jsonl.zst round trip",
+              list(iter_chunk(path)) == papers)
+    else:
+        print("SKIP  .jsonl.zst round trip (zstandard not installed)")
+
+    # ================================================================
+    # Test 8: ChunkWriter — an error leaves the old file untouched
+    # ================================================================
+    path = os.path.join(tmp_dir, "w_chunk_1.json")
+    before = open(path, "rb").read()
+    try:
+        with ChunkWriter(path) as writer:
+            writer.write({"pmid": "partial"})
+            raise RuntimeError("boom")
+    except RuntimeError:
+        pass
+    leftovers = [n for n in os.listdir(tmp_dir) if n.endswith(".tmp")]
+    check(
+        "ChunkWriter — aborted write keeps the previous chunk",
+        open(path, "rb").read() == before and not leftovers,
+        f"Leftover temp files: {leftovers}",
+    )
+
+    # ================================================================
+    # Test 9: find_chunk_files — skips delta chunks, one format per chunk
+    # ================================================================
+    find_dir = os.path.join(tmp_dir, "find")
+    os.makedirs(find_dir)
+    for name in ("p_chunk_1.json", "p_chunk_2.json", "p_delta_7_chunk_1.json",
+                 "p_manifest.json", "p_chunk_3.json.123.tmp"):
+        open(os.path.join(find_dir, name), "w").close()
+    old_time = time.time() - 60
+    os.utime(os.path.join(find_dir, "p_chunk_1.json"), (old_time, old_time))
+    open(os.path.join(find_dir, "p_chunk_1.jsonl.gz"), "w").close()
+    logging.disable(logging.WARNING)
+    try:
+        found = [os.path.basename(p) for p in find_chunk_files(find_dir)]
+        found_delta = [os.path.basename(p)
+                       for p in find_chunk_files(find_dir, include_delta=True)]
+    finally:
+        logging.disable(logging.NOTSET)
+    check(
+        "find_chunk_files — newest format per chunk, no delta chunks",
+        found == ["p_chunk_1.jsonl.gz", "p_chunk_2.json"],
+        f"Found: {found}",
+    )
+    check(
+        "find_chunk_files — include_delta=True adds delta chunks",
+        found_delta == ["p_chunk_1.jsonl.gz", "p_chunk_2.json", "p_delta_7_chunk_1.json"],
+        f"Found: {found_delta}",
+    )
+
+    # ================================================================
+    # Test 10: manifests — round trip, missing and unreadable files
+    # ================================================================
+    manifest_path = os.path.join(find_dir, "p_manifest.json")
+    manifest = {"format_version": 1, "mode": "delta", "watermark": 12,
+                "chunks": ["p_chunk_1.json", "p_delta_7_chunk_1.json", "p_chunk_9.json"]}
+    write_manifest(manifest_path, manifest)
+    broken_path = os.path.join(find_dir, "broken_manifest.json")
+    with open(broken_path, "w", encoding="utf-8") as f:
+        f.write("{not json")
+    logging.disable(logging.WARNING)
+    try:
+        broken = read_manifest(broken_path)
+    finally:
+        logging.disable(logging.NOTSET)
+    check(
+        "read_manifest — round trip; None if missing or unreadable",
+        read_manifest(manifest_path) == manifest
+        and read_manifest(os.path.join(find_dir, "none_manifest.json")) is None
+        and broken is None,
+    )
+
+    # ================================================================
+    # Test 11: manifest_chunk_files — listed chunks, any format
+    # ================================================================
+    # The listed p_chunk_1.json wins over the newer .jsonl.gz; once it is
+    # gone the .jsonl.gz is used.  p_chunk_9.json is missing and skipped.
+    logging.disable(logging.WARNING)
+    try:
+        listed = [os.path.basename(p) for p in manifest_chunk_files(manifest_path, find_dir)]
+        os.remove(os.path.join(find_dir, "p_chunk_1.json"))
+        listed_other = [os.path.basename(p)
+                        for p in manifest_chunk_files(manifest_path, find_dir)]
+        try:
+            manifest_chunk_files(os.path.join(find_dir, "none_manifest.json"), find_dir)
+            raised = False
+        except ValueError:
+            raised = True
+    finally:
+        logging.disable(logging.NOTSET)
+    check(
+        "manifest_chunk_files — listed chunks in order, missing ones skipped",
+        listed == ["p_chunk_1.json", "p_delta_7_chunk_1.json"],
+        f"Listed: {listed}",
+    )
+    check(
+        "manifest_chunk_files — finds a listed chunk in another format",
+        listed_other == ["p_chunk_1.jsonl.gz", "p_delta_7_chunk_1.json"],
+        f"Listed: {listed_other}",
+    )
+    check("manifest_chunk_files — ValueError without a manifest", raised)
+
+    tmp.cleanup()
+
+    # -------- Summary --------
+    print()
+    print("=" * 50)
+    print(f"RESULTS: {passed}/{total} passed, {failed}/{total} failed")
+    print("=" * 50)
+
+    return 0 if failed == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(run_tests())
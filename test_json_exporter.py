@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+"""
+Tests for the JSON exporter's row paging and delta exports
+(pipeline/export/json_exporter.py).
+
+Tests the keyset-paged row reader against the single ORDER BY query it
+replaced (NULL sort keys, ties, filters, --limit), the paper_changes
+triggers, the delta/full decision, and a delta export end to end, all on
+a scratch SQLite database.
+"""
+
+import contextlib
+import io
+import logging
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+
+# Ensure project root is on the path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from pipeline.export import json_exporter
+from pipeline.export.chunk_io import find_chunk_files, iter_chunk, read_manifest
+from pipeline.export.json_exporter import JsonExporter
+
+# The order exports have always used; _iter_rows must reproduce it.
+BASELINE_ORDER = "citation_count DESC, priority_score DESC, year DESC, id"
+
+SCHEMA = """
+CREATE TABLE papers (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    pmid TEXT UNIQUE,
+    doi TEXT,
+    title TEXT,
+    citation_count INTEGER,
+    priority_score INTEGER,
+    year INTEGER
+);
+"""
+
+
+def _make_db(path, n=60, seed=7):
+    """Papers with few distinct sort keys (many ties) and NULLs in each."""
+    rng = random.Random(seed)
+    conn = sqlite3.connect(path)
+    conn.executescript(SCHEMA)
+    for i in range(n):
+        conn.execute(
+            "INSERT INTO papers (pmid, doi, title, citation_count, priority_score, year) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (
+                str(1000 + i),
+                f"10.1/{i}",
+                f"Paper {i}",
+                rng.choice([None, 0, 3, 3, 12]),
+                rng.choice([None, 1, 5]),
+                rng.choice([None, 2019, 2021]),
+            ),
+        )
+    conn.commit()
+    return conn
+
+
+def _pmids(rows):
+    return [row["pmid"] for row in rows]
+
+
+def _chunk_pmids(directory, include_delta=False, delta_only=False):
+    pmids = []
+    for path in find_chunk_files(directory, include_delta=include_delta or delta_only):
+        if delta_only and "_delta_" not in os.path.basename(path):
+            continue
+        pmids.extend(paper["pmid"] for paper in iter_chunk(path))
+    return pmids
+
+
+def run_tests():
+    passed = 0
+    failed = 0
+    total = 0
+
+    def check(name, condition, detail=""):
+        nonlocal passed, failed, total
+        total += 1
+        if condition:
+            passed += 1
+            print(f"PASS  {total}: {name}")
+        else:
+            failed += 1
+            print(f"FAIL  {total}: {name}")
+            if detail:
+                print(f"         {detail}")
+
+    tmp = tempfile.TemporaryDirectory()
+    tmp_dir = tmp.name
+    logging.disable(logging.WARNING)
+
+    db_path = os.path.join(tmp_dir, "papers.db")
+    conn = _make_db(db_path)
+    conn.row_factory = sqlite3.Row
+    exporter = JsonExporter(db_path)
+    columns = [r[1] for r in conn.execute("PRAGMA table_info(papers)")]
+
+    # ================================================================
+    # Test 1: _iter_rows — same order as one ORDER BY, NULLs and ties
+    # ================================================================
+    # Small pages put page boundaries inside runs of tied and NULL keys.
+    saved_page = json_exporter._EXPORT_PAGE_SIZE
+    expected = _pmids(conn.execute(f"SELECT pmid FROM papers ORDER BY {BASELINE_ORDER}"))
+    bad = []
+    try:
+        for page in (1, 2, 3, 7, 1000):
+            json_exporter._EXPORT_PAGE_SIZE = page
+            got = _pmids(exporter._iter_rows(conn, columns, "1=1", [], None))
+            if got != expected:
+                bad.append(page)
+    finally:
+        json_exporter._EXPORT_PAGE_SIZE = saved_page
+    check(
+        "_iter_rows — baseline ORDER BY for every page size",
+        not bad,
+        f"Differs for page sizes {bad}",
+    )
+
+    # ================================================================
+    # Test 2: _iter_rows — filters and --limit
+    # ================================================================
+    cases = [
+        ("1=1", [], 1),
+        ("1=1", [], 10),
+        ("1=1", [], 500),
+        ("citation_count >= ?", [3], None),
+        ("citation_count >= ?", [3], 5),
+        ("year IS NULL", [], None),
+        ("citation_count > ?", [1000], None),
+    ]
+    bad = []
+    try:
+        json_exporter._EXPORT_PAGE_SIZE = 3
+        for where, params, limit in cases:
+            sql = f"SELECT pmid FROM papers WHERE {where} ORDER BY {BASELINE_ORDER}"
+            if limit:
+                sql += f" LIMIT {limit}"
+            want = _pmids(conn.execute(sql, params))
+            got = _pmids(exporter._iter_rows(conn, columns, where, params, limit))
+            if got != want:
+                bad.append((where, params, limit))
+    finally:
+        json_exporter._EXPORT_PAGE_SIZE = saved_page
+    check(
+        "_iter_rows — filters and limits match the baseline query",
+        not bad,
+        f"Differs for {bad}",
+    )
+
+    # ================================================================
+    # Test 3: _keyset_ranges — one equality range when all keys are NULL
+    # ================================================================
+    ranges = JsonExporter._keyset_ranges(
+        {"citation_count": None, "priority_score": None, "year": None, "id": 5})
+    check(
+        "_keyset_ranges — all-NULL keys only continue within the tie",
+        len(ranges) == 1 and ranges[0][1] == [None, None, None, 5],
+        f"Ranges: {ranges}",
+    )
+
+    # ================================================================
+    # Test 4: a plain export leaves no change log behind
+    # ================================================================
+    conn.close()
+    full_dir = os.path.join(tmp_dir, "full")
+    os.makedirs(full_dir)
+    with contextlib.redirect_stdout(io.StringIO()):
+        count = exporter.export(os.path.join(full_dir, "out.json"), chunk_size=25)
+    conn = sqlite3.connect(db_path)
+    conn.row_factory = sqlite3.Row
+    has_log = conn.execute(
+        "SELECT COUNT(*) FROM sqlite_master WHERE name = 'paper_changes'").fetchone()[0]
+    manifest = read_manifest(os.path.join(full_dir, "out_manifest.json"))
+    check(
+        "export — full export in baseline order, no change log installed",
+        count == 60 and _chunk_pmids(full_dir) == expected and not has_log
+        and manifest["mode"] == "full" and manifest["watermark"] is None,
+        f"count={count} has_log={has_log} manifest={manifest}",
+    )
+
+    # ================================================================
+    # Test 5: paper_changes triggers — INSERT, UPDATE, INSERT OR REPLACE
+    # ================================================================
+    watermark = JsonExporter._ensure_change_log(conn)
+    conn.execute("UPDATE papers SET citation_count = 99 WHERE pmid = '1005'")
+    conn.execute("INSERT INTO papers (pmid, title) VALUES ('2000', 'New paper')")
+    conn.execute("INSERT OR REPLACE INTO papers (pmid, title, year) "
+                 "VALUES ('1010', 'Replaced paper', 2024)")
+    conn.execute("INSERT OR IGNORE INTO papers (pmid, title) VALUES ('1020', 'Ignored')")
+    conn.execute("UPDATE papers SET title = 'Twice' WHERE pmid = '1005'")
+    conn.commit()
+    changed = sorted(r[0] for r in conn.execute(
+        "SELECT pmid FROM papers WHERE id IN "
+        "(SELECT paper_id FROM paper_changes WHERE seq > ?)", [watermark]))
+    log_rows = conn.execute(
+        "SELECT COUNT(*) FROM paper_changes WHERE seq > ?", [watermark]).fetchone()[0]
+    check(
+        "paper_changes — insert, update and replace logged once each",
+        watermark == 0 and changed == ["1005", "1010", "2000"] and log_rows == 3,
+        f"watermark={watermark} changed={changed} log_rows={log_rows}",
+    )
+    check(
+        "_change_log_watermark — latest seq once the log exists",
+        JsonExporter._change_log_watermark(conn) > watermark,
+    )
+    conn.close()
+
+    # ================================================================
+    # Test 6: _delta_since — when a delta export falls back to full
+    # ================================================================
+    filters = {"min_citations": 0}
+    previous = {"watermark": 4, "filters": filters}
+    delta_cases = [
+        ("no change log", previous, None, None),
+        ("no previous manifest", None, 9, None),
+        ("previous limited export", {"watermark": None, "filters": filters}, 9, None),
+        ("other filters", {"watermark": 4, "filters": {"min_citations": 5}}, 9, None),
+        ("watermark ahead of DB", previous, 3, None),
+        ("no changes since", previous, 4, 4),
+        ("changes since", previous, 9, 4),
+    ]
+    bad = [(name, JsonExporter._delta_since(prev, wm, filters))
+           for name, prev, wm, want in delta_cases
+           if JsonExporter._delta_since(prev, wm, filters) != want]
+    check("_delta_since — full-export fallbacks and delta start", not bad, f"Wrong: {bad}")
+
+    # ================================================================
+    # Test 7: export(delta=True) — full first, then only changed papers
+    # ================================================================
+    delta_dir = os.path.join(tmp_dir, "delta")
+    os.makedirs(delta_dir)
+    out = os.path.join(delta_dir, "out.json")
+    with contextlib.redirect_stdout(io.StringIO()):
+        first = exporter.export(out, chunk_size=25, delta=True)
+        first_manifest = read_manifest(os.path.join(delta_dir, "out_manifest.json"))
+        conn = sqlite3.connect(db_path)
+        conn.execute("UPDATE papers SET year = 2025 WHERE pmid = '1030'")
+        conn.execute("INSERT INTO papers (pmid, title, citation_count) VALUES ('2001', 'Newer', 50)")
+        conn.commit()
+        conn.close()
+        second = exporter.export(out, chunk_size=25, delta=True)
+        second_manifest = read_manifest(os.path.join(delta_dir, "out_manifest.json"))
+        third = exporter.export(out, chunk_size=25, delta=True)
+    check(
+        "export(delta=True) — first run is a full export with a watermark",
+        first == 61 and first_manifest["mode"] == "full"
+        and first_manifest["watermark"] is not None,
+        f"first={first} manifest={first_manifest}",
+    )
+    check(
+        "export(delta=True) — second run writes only the changed papers",
+        second == 2 and second_manifest["mode"] == "delta"
+        and second_manifest["since"] == first_manifest["watermark"]
+        and all("_delta_" in c for c in second_manifest["chunks"])
+        and _chunk_pmids(delta_dir, delta_only=True) == ["2001", "1030"],
+        f"second={second} manifest={second_manifest}",
+    )
+    check("export(delta=True) — nothing changed, nothing exported", third == 0)
+
+    logging.disable(logging.NOTSET)
+    tmp.cleanup()
+
+    # -------- Summary --------
+    print()
+    print("=" * 50)
+    print(f"RESULTS: {passed}/{total} passed, {failed}/{total} failed")
+    print("=" * 50)
+
+    return 0 if failed == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(run_tests())
@@ -2,12 +2,17 @@
 """
 Tests for Section Segmentation Step (2b).
 
-Tests heuristic_segment(), strip_inline_citations(), taggable_sections(),
-and the segment_paper() function from 2b_segment.py.
+Tests heuristic_segment(), strip_inline_citations() (including a golden
+check against the original regex implementation), taggable_sections(),
+the segment_paper() function from 2b_segment.py, and the streaming JATS
+parser against the element-tree version it replaced.
 """
 
+import hashlib
+import itertools
 import sys
 import os
+import xml.etree.ElementTree as ET
 
 # Ensure project root is on the path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -19,6 +24,102 @@ from pipeline.parsing.section_extractor import (
     strip_references,
     from_sections_list,
 )
+from pipeline.parsing.europepmc_fetcher import (
+    EuropePMCFetcher,
+    _JATS_SECTION_TYPE_MAP,
+)
+from pipeline.parsing.heading_classifier import classify_heading
+
+
+def _tree_parse_jats_xml(xml_text):
+    """Reference: the element-tree parse_jats_xml that the streaming
+    parser replaced.  Both must return identical section lists."""
+    try:
+        root = ET.fromstring(xml_text)
+    except ET.ParseError:
+        return []
+
+    def text_of(el):
+        return "".join(el.itertext())
+
+    sections = []
+    for abstract in root.findall(".//abstract"):
+        text = text_of(abstract).strip()
+        if text:
+            sections.append({"heading": "Abstract", "text": text, "type": "abstract"})
+
+    for sec in root.findall(".//body//sec"):
+        heading_el = sec.find("title")
+        heading = text_of(heading_el).strip() if heading_el is not None else ""
+        paragraphs = [t for t in (text_of(p).strip() for p in sec.findall("p")) if t]
+        if not paragraphs:
+            continue
+        section_type = _JATS_SECTION_TYPE_MAP.get(
+            sec.get("sec-type", "").lower(), classify_heading(heading)
+        )
+        sections.append({"heading": heading, "text": " ".join(paragraphs),
+                         "type": section_type})
+
+    for tag, heading in (("fig", "Figure Captions"), ("table-wrap", "Table Captions")):
+        captions = []
+        for el in root.findall(".//" + tag):
+            caption = el.find("caption")
+            if caption is not None:
+                text = text_of(caption).strip()
+                if text:
+                    label_el = el.find("label")
+                    label = text_of(label_el).strip() if label_el is not None else ""
+                    captions.append(f"{label} {text}".strip())
+        if captions:
+            sections.append({"heading": heading, "text": " ".join(captions),
+                             "type": "figures"})
+    return sections
+
+
+JATS_FIXTURES = [
+    ("typical article", """<?xml version="1.0" encoding="UTF-8"?>
+<article xmlns:xlink="http://www.w3.org/1999/xlink" article-type="research-article">
+  <front><article-meta>
+    <title-group><article-title>Live imaging of <italic>Drosophila</italic> wings</article-title></title-group>
+    <abstract><p>We imaged wing discs using a <bold>Zeiss LSM 880</bold>.</p></abstract>
+    <abstract abstract-type="summary"><title>Summary</title><p>Short summary.</p></abstract>
+  </article-meta></front>
+  <body>
+    <sec sec-type="intro"><title>Introduction</title>
+      <p>Confocal microscopy <xref ref-type="bibr" rid="b1">[1]</xref> is widely used.</p>
+    </sec>
+    <sec sec-type="materials|methods"><title>Materials and Methods</title>
+      <p>Samples were fixed in 4% PFA.</p>
+      <sec><title>Imaging</title>
+        <p>Images were acquired with a 63x/1.4 NA objective (<xref ref-type="fig" rid="f1">Fig. 1</xref>).</p>
+        <fig id="f1"><label>Figure 1</label><caption><title>Setup.</title><p>Overview of the <italic>setup</italic>.</p></caption>
+          <graphic xlink:href="f1.jpg"/></fig>
+      </sec>
+      <sec><title>Image analysis</title><p>Analysed in Fiji (RRID:SCR_002285).</p></sec>
+    </sec>
+    <sec><title>Results</title><p>First.</p><p>  </p><p>Second.</p></sec>
+    <sec><title>Empty section</title></sec>
+  </body>
+  <floats-group>
+    <table-wrap id="t1"><label>Table 1</label><caption><p>Reagents used.</p></caption>
+      <table><tr><td>GFP</td></tr></table></table-wrap>
+    <fig id="f2"><caption><p>Unlabelled figure.</p></caption></fig>
+    <fig id="f3"><label>Figure 3</label></fig>
+  </floats-group>
+</article>"""),
+    ("no sec-type, nested paragraphs and tails", """<article>
+  <body>
+    <sec><title>Methods <italic>in vivo</italic></title>
+      <p>Mice<sup>1</sup> were anaesthetised <list><list-item><p>nested item</p></list-item></list> tail text.</p>
+      <sec><title>Discussion</title><p>Inner <fig><label>Fig. 2</label><caption><p>In-paragraph figure.</p></caption></fig> after.</p></sec>
+    </sec>
+    <p>Body paragraph outside any section.</p>
+  </body>
+  <back><sec><title>Acknowledgements</title><p>Not in body.</p></sec></back>
+</article>"""),
+    ("no body", "<article><front><abstract>  </abstract></front></article>"),
+    ("malformed", "<article><body><sec><title>Methods</title><p>Unclosed</sec></body>"),
+]
 
 
 def run_tests():
@@ -325,6 +426,86 @@ References
         f"full_text: {ps_from_list.full_text[:100]}",
     )
 
+    # ================================================================
+    # Test 17: strip_inline_citations — golden output
+    # ================================================================
+    # Expected values were produced by the original regex-based
+    # implementation; the scanner must reproduce them byte for byte.
+    golden_cases = [
+        ("Imaged on a Zeiss LSM 880 [12, 14-16] at 37 °C (Smith et al., 2020).",
+         "Imaged on a Zeiss LSM 880 at 37 °C ."),
+        ("Loaded with Fluo-4 [Ca2+] (n = 5) in buffer (pH 7.4) as before¹².",
+         "Loaded with Fluo-4 [Ca2+] (n = 5) in buffer (pH 7.4) as before."),
+        ("Signal increased (P < 0.05; Fig. 2) (Lee and Kim, 2019; Park et al., 2021).",
+         "Signal increased (P < 0.05; Fig. 2) ."),
+    ]
+    bad = [(s, strip_inline_citations(s)) for s, want in golden_cases
+           if strip_inline_citations(s) != want]
+    check(
+        "strip_inline_citations — golden sentences",
+        not bad,
+        f"Mismatch: {bad[:1]}",
+    )
+
+    # Every 3-fragment combination of citations, protected notation and
+    # stray delimiters (27,000 strings), hashed in order.
+    fragments = [
+        "Cells were imaged", " [1]", " [1, 2]", "[3-5]", " [1, 3, 7-9]", "[Ca2+]", " [K+]",
+        " (Smith et al., 2020)", " (Smith and Jones, 2019)", "(Lee et al. 2018a; Kim, 2017)",
+        " (488 nm)", " (60x/1.4 NA)", " (n = 5)", " (pH 7.4)", " (P < 0.05)", " (Fig. 1)",
+        " (Table 2)", "¹²³", "²", " as described.", " (", ")", "[", "]", ", ", "et al.",
+        " 2020", "\x00", "  ", "\n",
+    ]
+    digest = hashlib.sha256()
+    for parts in itertools.product(fragments, repeat=3):
+        digest.update(strip_inline_citations("".join(parts)).encode("utf-8"))
+        digest.update(b"\x01")
+    check(
+        "strip_inline_citations — golden corpus digest",
+        digest.hexdigest()
+        == "3d427d2cb243042c5e7b171208b94476a59ffae7804ab1bfaaead62f3e777c03",
+        f"Digest: {digest.hexdigest()}",
+    )
+
+    # ================================================================
+    # Test 18: parse_jats_xml — matches the element-tree implementation
+    # ================================================================
+    for name, xml_text in JATS_FIXTURES:
+        got = EuropePMCFetcher.parse_jats_xml(xml_text)
+        want = _tree_parse_jats_xml(xml_text)
+        check(
+            f"parse_jats_xml — same sections as tree parser ({name})",
+            got == want,
+            f"Got: {got}\n         Want: {want}",
+        )
+
+    # ================================================================
+    # Test 19: classify_heading — JATS subsection titles
+    # ================================================================
+    # Compound words the JATS parser's former substring patterns caught
+    # must keep their type under whole-word matching.
+    heading_cases = {
+        "Immunostaining": "methods",
+        "Whole-mount immunostaining": "methods",
+        "Bioimaging": "methods",
+        "Cryomicroscopy": "methods",
+        "Photomicroscopy": "methods",
+        "Methodological approach": "methods",
+        "Sample preparations": "methods",
+        "Summary of results": "results",
+        "Summary of the main findings": "results",
+        "Summary": "discussion",
+        "Supplementary Material": "supplementary",
+        "2. Materials & Methods": "methods",
+    }
+    wrong = {h: classify_heading(h) for h, want in heading_cases.items()
+             if classify_heading(h) != want}
+    check(
+        "classify_heading — JATS subsection titles keep their type",
+        not wrong,
+        f"Wrong: {wrong}",
+    )
+
     # -------- Summary --------
     print()
     print("=" * 50)